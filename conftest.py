@@ -4,6 +4,7 @@ import os
 import pathlib
 import shutil
 import traceback
+from collections.abc import Generator
 from typing import Any
 
 import pytest
@@ -27,8 +28,12 @@ from pytest import (
 )
 from pytest_testconfig import config as py_config
 
-from utilities.constants import KServeDeploymentType
+from utilities.api_call_accounting import ApiCallAccounting
+from utilities.constants import MODEL_CACHE_NAMESPACE, KServeDeploymentType
 from utilities.database import Database
+from utilities.dsc_state_planner import get_item_dsc_component_states, plan_dsc_component_states
+from utilities.fixture_affinity import FixtureAffinityPlan, count_fixture_setups, plan_fixture_affinity
+from utilities.fixture_profiler import FixtureProfiler
 from utilities.infra import get_dsci_applications_namespace, get_operator_distribution
 from utilities.logger import separator, setup_logging
 from utilities.must_gather_collector import (
@@ -38,6 +43,7 @@ from utilities.must_gather_collector import (
     set_must_gather_collector_directory,
     set_must_gather_collector_values,
 )
+from utilities.xdist_scheduling import DurationScheduler
 
 LOGGER = logging.getLogger(name=__name__)
 BASIC_LOGGER = logging.getLogger(name="basic")
@@ -63,6 +69,8 @@ def pytest_addoption(parser: Parser) -> None:
     model_validation_automation_group = parser.getgroup(name="Model Validation Automation")
     hf_group = parser.getgroup(name="Hugging Face")
     model_registry_group = parser.getgroup(name="Model Registry options")
+    dsc_group = parser.getgroup(name="DSC options")
+    profiling_group = parser.getgroup(name="Profiling")
     # AWS config and credentials options
     aws_group.addoption(
         "--aws-secret-access-key",
@@ -109,6 +117,12 @@ def pytest_addoption(parser: Parser) -> None:
         default=os.environ.get("MODELS_S3_BUCKET_ENDPOINT"),
         help="Models S3 bucket endpoint",
     )
+    buckets_group.addoption(
+        "--model-pvc-cache",
+        action="store_true",
+        help="Reuse model data downloaded to PVCs across classes and runs, from snapshots of cache PVCs kept in the "
+        f"{MODEL_CACHE_NAMESPACE} namespace (storage classes without VolumeSnapshot support download every time)",
+    )
     # Runtime options
     runtime_group.addoption(
         "--supported-accelerator-type",
@@ -223,17 +237,103 @@ def pytest_addoption(parser: Parser) -> None:
         help="Indicates if the model registry tests are to be run against custom namespace",
     )
 
+    # DSC options
+    dsc_group.addoption(
+        "--dsc-state-planner",
+        action="store_true",
+        help="Re-order test packages and modules to minimise DSC component managementState transitions and keep "
+        "component states across consecutive tests requiring them (not applied to upgrade)",
+    )
+
+    # Profiling options
+    profiling_group.addoption(
+        "--fixture-profile",
+        action="store_true",
+        help="Measure fixtures setup/teardown and tests phases wall time, including TimeoutSampler sleeps",
+    )
+    profiling_group.addoption(
+        "--fixture-profile-dir",
+        default=os.path.join(get_base_dir(), "fixture-profile"),
+        help="Directory of the fixture profile per-worker JSON artifacts and merged reports",
+    )
+    profiling_group.addoption(
+        "--duration-scheduler",
+        action="store_true",
+        help="With xdist, send test files to workers longest-first according to previous runs durations "
+        "(falls back to loadfile without history), and record tests durations",
+    )
+    profiling_group.addoption(
+        "--fixture-affinity",
+        action="store_true",
+        help="Re-order tests to maximise reuse of class, module, package and session-scoped fixtures "
+        "(not applied to upgrade)",
+    )
+    profiling_group.addoption(
+        "--api-call-accounting",
+        action="store_true",
+        help="Count Kubernetes API requests per test by verb, resource and status",
+    )
+    profiling_group.addoption(
+        "--api-call-report",
+        default=os.path.join(get_base_dir(), "api-calls.json"),
+        help="Path of the Kubernetes API calls JSON report",
+    )
+    profiling_group.addoption(
+        "--api-call-budget",
+        type=float,
+        help="Fail tests whose call phase issues more Kubernetes API requests than their baseline times this factor "
+        "(implies --api-call-accounting)",
+    )
+    profiling_group.addoption(
+        "--api-call-update-baseline",
+        action="store_true",
+        help="Record the call phase Kubernetes API requests of passing tests as their baseline "
+        "(implies --api-call-accounting, cannot be combined with --api-call-budget)",
+    )
+
 
 def pytest_cmdline_main(config: Any) -> None:
     config.option.basetemp = py_config["tmp_base_dir"] = f"{config.option.basetemp}-{shortuuid.uuid()}"
 
 
+def pytest_configure(config: Config) -> None:
+    if config.getoption("--fixture-profile"):
+        config.pluginmanager.register(
+            plugin=FixtureProfiler(config=config, output_dir=config.getoption("--fixture-profile-dir")),
+            name="fixture-profiler",
+        )
+
+    # Scheduling and durations recording happen on the xdist controller only
+    if config.getoption("--duration-scheduler") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(plugin=DurationScheduler(), name="duration-scheduler")
+
+    api_call_budget = config.getoption("--api-call-budget")
+    update_api_call_baseline = config.getoption("--api-call-update-baseline")
+    if update_api_call_baseline and api_call_budget is not None:
+        # A budget run checks against the baseline, it must not move it
+        raise pytest.UsageError("--api-call-update-baseline cannot be combined with --api-call-budget")
+
+    if config.getoption("--api-call-accounting") or api_call_budget is not None or update_api_call_baseline:
+        config.pluginmanager.register(
+            plugin=ApiCallAccounting(
+                config=config,
+                report_path=config.getoption("--api-call-report"),
+                budget_factor=api_call_budget,
+                update_baseline=update_api_call_baseline,
+            ),
+            name="api-call-accounting",
+        )
+
+
 def pytest_collection_modifyitems(session: Session, config: Config, items: list[Item]) -> None:
     """
     Pytest fixture to filter or re-order the items in-place.
 
     Filters upgrade tests based on '--pre-upgrade' / '--post-upgrade' option and marker.
     If `--upgrade-deployment-modes` option is set, only tests with the specified deployment modes will be added.
+    If `--fixture-affinity` option is set, non-upgrade tests are re-ordered to maximise reuse of scoped fixtures.
+    If `--dsc-state-planner` option is set, non-upgrade tests are re-ordered to minimise DSC component transitions.
+    Jira issues referenced by `jira` markers are prefetched in one bulk query.
     """
 
     def _add_upgrade_test(_item: Item, _upgrade_deployment_modes: list[str]) -> bool:
@@ -301,9 +401,52 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
     if deselected:
         config.hook.pytest_deselected(items=deselected)
 
+    # Applied first, the DSC state planner keeps the order of modules within a state group
+    if config.getoption(name="fixture_affinity") and not (run_pre_upgrade_tests or run_post_upgrade_tests):
+        _order_items_by_fixture_affinity(config=config, items=items)
+
+    if config.getoption(name="dsc_state_planner") and not (run_pre_upgrade_tests or run_post_upgrade_tests):
+        _order_items_by_dsc_component_states(config=config, items=items)
+        if fixture_affinity_plan := getattr(config.option, "fixture_affinity_plan", None):
+            # Report the scoped fixture setups of the order that actually runs
+            fixture_affinity_plan.items = list(items)
+            fixture_affinity_plan.planned_setups = count_fixture_setups(items=items)
+
+    # With xdist, collection runs on the workers only; the plan is handed to the controller terminal summary
+    if hasattr(config, "workeroutput") and (
+        fixture_affinity_plan := getattr(config.option, "fixture_affinity_plan", None)
+    ):
+        config.workeroutput["fixture_affinity"] = {
+            "original_setups": fixture_affinity_plan.original_setups,
+            "planned_setups": fixture_affinity_plan.planned_setups,
+        }
+
     _add_default_tier2_marker(items=items)
 
 
+def _order_items_by_fixture_affinity(config: Config, items: list[Item]) -> None:
+    """Re-order items in-place to maximise scoped fixtures reuse and keep the plan for the session report."""
+    fixture_affinity_plan = plan_fixture_affinity(items=items)
+    items[:] = fixture_affinity_plan.items
+    config.option.fixture_affinity_plan = fixture_affinity_plan
+    LOGGER.info(
+        f"Fixture affinity: {fixture_affinity_plan.planned_setups} scoped fixture setups instead of "
+        f"{fixture_affinity_plan.original_setups} ({fixture_affinity_plan.saved_setups} saved)"
+    )
+
+
+def _order_items_by_dsc_component_states(config: Config, items: list[Item]) -> None:
+    """Re-order items in-place by required DSC component states and keep the plan for the session report."""
+    dsc_state_plan = plan_dsc_component_states(items=items)
+    items[:] = dsc_state_plan.items
+    config.option.dsc_state_plan = dsc_state_plan
+    LOGGER.info(
+        f"DSC state planner: {dsc_state_plan.groups} state groups, "
+        f"{dsc_state_plan.planned_transitions} component transitions instead of "
+        f"{dsc_state_plan.original_transitions} ({dsc_state_plan.avoided_transitions} avoided)"
+    )
+
+
 def _add_default_tier2_marker(items: list[Item]) -> None:
     """Add tier2 marker to tests that lack any tier/smoke/upgrade marker, for specific components."""
     for item in items:
@@ -435,12 +578,21 @@ def pytest_runtest_call(item: Item) -> None:
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
 
 
-def pytest_runtest_teardown(item: Item) -> None:
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item: Item, nextitem: Item | None) -> Generator[None, Any, Any]:
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='TEARDOWN')}")
     # reset must-gather collector after each tests
     py_config["must_gather_collector"]["collector_directory"] = py_config["must_gather_collector"][
         "must_gather_base_directory"
     ]
+    try:
+        return (yield)
+    finally:
+        # Once the fixtures which may still need the kept DSC component states are torn down
+        if dsc_component_state_manager := getattr(item.config.option, "dsc_component_state_manager", None):
+            dsc_component_state_manager.release(
+                required_components=dict(get_item_dsc_component_states(item=nextitem)) if nextitem else {}
+            )
 
 
 def pytest_report_teststatus(report: CollectReport, config: Config) -> None:
@@ -487,6 +639,41 @@ def pytest_sessionfinish(session: Session, exitstatus: int) -> None:
         reporter.summary_stats()
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: Any) -> None:
+    # xdist workers run with dist "no", tell them how the controller distributes tests
+    node.workerinput["dist"] = node.config.getoption("dist")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    # Every xdist worker plans the same collection, the plan of the first worker to finish is reported
+    config = node.config
+    if (worker_plan := getattr(node, "workeroutput", {}).get("fixture_affinity")) and not getattr(
+        config.option, "fixture_affinity_plan", None
+    ):
+        config.option.fixture_affinity_plan = FixtureAffinityPlan(items=[], **worker_plan)
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, exitstatus: int, config: Config) -> None:
+    if dsc_state_plan := getattr(config.option, "dsc_state_plan", None):
+        terminalreporter.write_sep(sep="-", title="DSC state planner")
+        terminalreporter.write_line(
+            line=f"State groups: {dsc_state_plan.groups}, "
+            f"component transitions: {dsc_state_plan.planned_transitions} "
+            f"(original order: {dsc_state_plan.original_transitions}, "
+            f"avoided: {dsc_state_plan.avoided_transitions})"
+        )
+
+    if fixture_affinity_plan := getattr(config.option, "fixture_affinity_plan", None):
+        terminalreporter.write_sep(sep="-", title="Fixture affinity")
+        terminalreporter.write_line(
+            line=f"Scoped fixture setups: {fixture_affinity_plan.planned_setups} "
+            f"(original order: {fixture_affinity_plan.original_setups}, "
+            f"saved: {fixture_affinity_plan.saved_setups})"
+        )
+
+
 def calculate_must_gather_timer(test_start_time: int) -> int:
     default_duration = 300
     if test_start_time > 0:
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark the EvalHub Prometheus text parser on a synthetic scrape.
+
+Compares ``parse_prometheus_text`` and its indexed lookups against the previous
+implementation, which matched an uncompiled pattern per line and filtered every
+sample of a metric on each lookup. Both parse the same synthetic 50k-line scrape
+once and then run the same label-filtered lookups on it.
+
+Usage:
+    uv run python scripts/benchmark_prometheus_parser.py
+    uv run python scripts/benchmark_prometheus_parser.py --lines 200000 --lookups 5000
+
+Exit codes:
+  0  -- indexed parser is faster than the previous implementation
+  1  -- indexed parser is not faster
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tests.ai_safety.evalhub.utils import get_metric_samples, parse_prometheus_text  # noqa: E402
+
+HISTOGRAM_BUCKETS: tuple[str, ...] = ("0.005", "0.01", "0.025", "0.05", "0.1", "0.25", "0.5", "1", "2.5", "5", "+Inf")
+RESULTS: tuple[str, ...] = ("success", "error", "requeue", "requeue_after")
+
+
+def build_scrape(lines: int) -> tuple[str, list[tuple[str, dict[str, str]]]]:
+    """Build a synthetic scrape of about ``lines`` lines and the lookups to run on it.
+
+    Each controller exposes a reconcile counter per result and a duration histogram, with HELP/TYPE
+    lines per family as client_golang does.
+    """
+    scrape: list[str] = []
+    lookups: list[tuple[str, dict[str, str]]] = []
+    lines_per_controller = len(RESULTS) + len(HISTOGRAM_BUCKETS) + 2
+    controllers = max(lines // lines_per_controller, 1)
+
+    scrape.extend([
+        "# HELP bench_reconcile_total Total number of reconciliations per controller",
+        "# TYPE bench_reconcile_total counter",
+    ])
+    for controller in range(controllers):
+        for result in RESULTS:
+            scrape.append(
+                f'bench_reconcile_total{{controller="controller-{controller}",result="{result}"}} {controller}'
+            )
+        lookups.append(("bench_reconcile_total", {"controller": f"controller-{controller}", "result": "success"}))
+
+    scrape.extend([
+        "# HELP bench_reconcile_duration_seconds Length of time per reconciliation per controller",
+        "# TYPE bench_reconcile_duration_seconds histogram",
+    ])
+    for controller in range(controllers):
+        for bucket in HISTOGRAM_BUCKETS:
+            scrape.append(
+                f'bench_reconcile_duration_seconds_bucket{{controller="controller-{controller}",le="{bucket}"}} 1'
+            )
+        scrape.extend([
+            f'bench_reconcile_duration_seconds_sum{{controller="controller-{controller}"}} 0.5',
+            f'bench_reconcile_duration_seconds_count{{controller="controller-{controller}"}} 1',
+        ])
+        lookups.append(("bench_reconcile_duration_seconds_sum", {"controller": f"controller-{controller}"}))
+
+    return "\n".join(scrape), lookups
+
+
+def parse_prometheus_text_per_line_pattern(text: str) -> dict[str, list[dict[str, Any]]]:
+    """Previous implementation of ``parse_prometheus_text``, kept here as the benchmark reference."""
+    metrics: dict[str, list[dict[str, Any]]] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        match = re.match(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.+?)\})?\s+(.+?)(\s+\d+)?$", line)
+        if not match:
+            continue
+
+        name = match.group(1)
+        labels_raw = match.group(3) or ""
+        labels = dict(re.findall(r'(\w+)="([^"]*)"', labels_raw))
+        try:
+            value: float | str = float(match.group(4))
+        except ValueError:
+            value = match.group(4)
+
+        metrics.setdefault(name, []).append({"labels": labels, "value": value})
+
+    return metrics
+
+
+def get_metric_samples_linear(
+    metrics: dict[str, list[dict[str, Any]]], metric_name: str, label_filter: dict[str, str]
+) -> list[dict[str, Any]]:
+    """Previous implementation of ``get_metric_samples``, kept here as the benchmark reference."""
+    return [
+        s for s in metrics.get(metric_name, []) if all(s["labels"].get(key) == val for key, val in label_filter.items())
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=50_000, help="Approximate number of scrape lines")
+    parser.add_argument("--lookups", type=int, default=1_000, help="Number of label-filtered lookups per run")
+    args = parser.parse_args()
+
+    text, lookups = build_scrape(lines=args.lines)
+    lookups = (lookups * (args.lookups // len(lookups) + 1))[: args.lookups]
+
+    start = time.perf_counter()
+    previous_metrics = parse_prometheus_text_per_line_pattern(text=text)
+    previous_parse = time.perf_counter() - start
+    start = time.perf_counter()
+    previous_results = [
+        get_metric_samples_linear(metrics=previous_metrics, metric_name=name, label_filter=labels)
+        for name, labels in lookups
+    ]
+    previous_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    metrics = parse_prometheus_text(text=text)
+    indexed_parse = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed_results = [
+        get_metric_samples(metrics=metrics, metric_name=name, label_filter=labels) for name, labels in lookups
+    ]
+    indexed_lookup = time.perf_counter() - start
+
+    if previous_results != indexed_results:
+        print("Indexed lookups returned different samples than the previous implementation", file=sys.stderr)
+        return 1
+
+    print(f"Scrape: {len(text.splitlines())} lines, {len(lookups)} lookups")
+    print(f"{'':10} {'parse':>10} {'lookups':>10} {'total':>10}")
+    print(f"{'previous':10} {previous_parse:>9.3f}s {previous_lookup:>9.3f}s {previous_parse + previous_lookup:>9.3f}s")
+    print(f"{'indexed':10} {indexed_parse:>9.3f}s {indexed_lookup:>9.3f}s {indexed_parse + indexed_lookup:>9.3f}s")
+    speedup = (previous_parse + previous_lookup) / (indexed_parse + indexed_lookup)
+    print(f"Speedup: {speedup:.1f}x")
+
+    return 0 if speedup > 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -52,12 +52,11 @@ from utilities.general import (
 from utilities.infra import (
     ResourceNotFoundError,
     get_data_science_cluster,
-    login_with_user_password,
     wait_for_dsc_status_ready,
 )
 from utilities.resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
 from utilities.resources.pod import Pod as UtilPod
-from utilities.user_utils import UserTestSession, create_htpasswd_file, wait_for_user_creation
+from utilities.user_utils import UserTestSession, create_htpasswd_file, wait_for_user_oauth_token
 
 DEFAULT_TOKEN_DURATION = "10m"
 LOGGER = structlog.get_logger(name=__name__)
@@ -208,7 +207,7 @@ def model_registry_operator_pod(admin_client: DynamicClient) -> Generator[Pod, A
     )[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_idp_user(
     request: pytest.FixtureRequest,
     original_user: str,
@@ -218,7 +217,8 @@ def test_idp_user(
 ) -> Generator[UserTestSession | None]:
     """
     Session-scoped fixture that creates a test IDP user and cleans it up after all tests.
-    Returns a UserTestSession object that contains all necessary credentials and contexts.
+    Returns a UserTestSession object that contains all necessary credentials, the user OAuth token
+    and per-user clients (user_client, requests_session); the kubeconfig context is never switched.
     """
     if is_byoidc:
         # For BYOIDC, we would be using a preconfigured group and username for actual api calls.
@@ -229,14 +229,11 @@ def test_idp_user(
         _ = request.getfixturevalue(argname="updated_oauth_config")
         idp_session = None
         try:
-            if wait_for_user_creation(
+            token = wait_for_user_oauth_token(
                 username=user_credentials_rbac["username"],
                 password=user_credentials_rbac["password"],
-                cluster_url=api_server_url,
-            ):
-                # undo the login as test user if we were successful in logging in as test user
-                LOGGER.info(f"Undoing login as test user and logging in as {original_user}")
-                login_with_user_password(api_address=api_server_url, user=original_user)
+                api_server_url=api_server_url,
+            )
 
             idp_session = UserTestSession(
                 idp_name=user_credentials_rbac["idp_name"],
@@ -246,6 +243,7 @@ def test_idp_user(
                 original_user=original_user,
                 api_server_url=api_server_url,
                 client=admin_client,
+                token=token,
             )
             LOGGER.info(f"Created session test IDP user: {idp_session.username}")
 
@@ -266,7 +264,7 @@ def api_server_url(admin_client: DynamicClient) -> str:
     return infrastructure.instance.status.apiServerURL
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def created_htpasswd_secret(
     is_byoidc: bool, admin_client: DynamicClient, original_user: str, user_credentials_rbac: dict[str, str]
 ) -> Generator[UserTestSession | None]:
@@ -297,7 +295,7 @@ def created_htpasswd_secret(
             temp_path.unlink(missing_ok=True)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def updated_oauth_config(
     is_byoidc: bool, admin_client: DynamicClient, original_user: str, user_credentials_rbac: dict[str, str]
 ) -> Generator[Any]:
@@ -327,7 +325,7 @@ def updated_oauth_config(
         wait_for_oauth_openshift_deployment(client=admin_client)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_credentials_rbac(
     is_byoidc: bool,
     admin_client: DynamicClient,
@@ -479,40 +477,6 @@ def sa_namespace(request: pytest.FixtureRequest, admin_client: DynamicClient) ->
         yield ns
 
 
-@pytest.fixture()
-def login_as_test_user(is_byoidc: bool, api_server_url: str, original_user: str, test_idp_user) -> Generator[None]:
-    """
-    Fixture to log in as a test user and restore original user after test.
-
-    This fixture is used for RBAC tests to switch context to a non-admin test user.
-    Used by both model registry and model catalog RBAC tests.
-    """
-    if is_byoidc:
-        yield
-    else:
-        from utilities.user_utils import UserTestSession
-
-        if isinstance(test_idp_user, UserTestSession):
-            username = test_idp_user.username
-            password = test_idp_user.password
-        else:
-            username = test_idp_user
-            password = None
-
-        LOGGER.info(f"Logging in as {username}")
-        login_with_user_password(
-            api_address=api_server_url,
-            user=username,
-            password=password,
-        )
-        yield
-        LOGGER.info(f"Logging in as {original_user}")
-        login_with_user_password(
-            api_address=api_server_url,
-            user=original_user,
-        )
-
-
 @pytest.fixture(scope="class")
 def service_account(admin_client: DynamicClient, sa_namespace: Namespace) -> Generator[Any]:
     """
@@ -37,7 +37,7 @@ from tests.ai_hub.utils import (
     get_rest_headers,
     wait_for_model_catalog_pod_ready_after_deletion,
 )
-from utilities.infra import create_inference_token, get_openshift_token, login_with_user_password
+from utilities.infra import create_inference_token, get_openshift_token
 
 LOGGER = structlog.get_logger(name=__name__)
 
@@ -180,8 +180,6 @@ def user_token_for_api_calls(
     is_byoidc: bool,
     admin_client: DynamicClient,
     request: pytest.FixtureRequest,
-    original_user: str,
-    api_server_url: str,
     user_credentials_rbac: dict[str, str],
     service_account: ServiceAccount,
     model_catalog_rest_url: list[str],
@@ -192,16 +190,11 @@ def user_token_for_api_calls(
 
     token = None
     if user == "admin":
-        LOGGER.info("Logging in as admin user")
-        token = get_openshift_token()
+        LOGGER.info("Using admin user token")
+        token = get_openshift_token(client=admin_client)
     elif user == "test":
         if not is_byoidc:
-            login_with_user_password(
-                api_address=api_server_url,
-                user=user_credentials_rbac["username"],
-                password=user_credentials_rbac["password"],
-            )
-            token = get_openshift_token()
+            token = request.getfixturevalue(argname="test_idp_user").token
         else:
             token = get_mr_user_token(admin_client=admin_client, user_credentials_rbac=user_credentials_rbac)
     elif user == "sa_user":
@@ -214,14 +207,6 @@ def user_token_for_api_calls(
 
     yield token
 
-    # Cleanup: log back in as original user if needed
-    if user == "test" and not is_byoidc:
-        LOGGER.info(f"Logging in as {original_user}")
-        login_with_user_password(
-            api_address=api_server_url,
-            user=original_user,
-        )
-
 
 @pytest.fixture(scope="function")
 def randomly_picked_model_from_catalog_api_by_source(
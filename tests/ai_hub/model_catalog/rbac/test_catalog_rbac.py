@@ -7,9 +7,9 @@ import structlog
 from kubernetes.client.rest import ApiException
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.config_map import ConfigMap
-from ocp_resources.resource import get_client
 
 from tests.ai_hub.constants import DEFAULT_CUSTOM_MODEL_CATALOG, DEFAULT_MODEL_CATALOG_CM
+from utilities.user_utils import UserTestSession
 
 LOGGER = structlog.get_logger(name=__name__)
 
@@ -80,7 +80,7 @@ class TestCatalogRBAC:
         is_byoidc: bool,
         model_registry_namespace: str,
         user_credentials_rbac: dict[str, str],
-        login_as_test_user: None,
+        test_idp_user: UserTestSession | None,
         configmap_name: str,
     ):
         """
@@ -90,8 +90,7 @@ class TestCatalogRBAC:
         if is_byoidc:
             pytest.skip(reason="BYOIDC test users may have pre-configured group memberships")
 
-        # get_client() uses the current kubeconfig context (set by login_as_test_user fixture)
-        user_client = get_client()
+        user_client = test_idp_user.user_client
 
         with pytest.raises(ApiException) as exc_info:
             catalog_cm = ConfigMap(
@@ -26,7 +26,7 @@ from tests.ai_hub.model_registry.async_job.constants import (
 )
 from tests.ai_hub.model_registry.async_job.utils import (
     build_async_job_config,
-    upload_test_model_to_minio_from_image,
+    upload_test_model_to_minio,
 )
 from tests.ai_hub.utils import get_endpoint_from_mr_service, get_mr_service_by_label
 from utilities.constants import ApiGroups, Labels, MinIo, OCIRegistry, Protocols
@@ -199,13 +199,9 @@ def model_sync_async_job(
 @pytest.fixture(scope="class")
 def create_test_data_in_minio_from_image(
     minio_service: Service,
-    admin_client: DynamicClient,
-    model_registry_namespace: str,
 ) -> None:
-    """Extract and upload test model from KSERVE_MINIO_IMAGE to MinIO"""
-    upload_test_model_to_minio_from_image(
-        admin_client=admin_client,
-        namespace=model_registry_namespace,
+    """Upload the test model to MinIO"""
+    upload_test_model_to_minio(
         minio_service=minio_service,
         object_key="my-model/model.onnx",
     )
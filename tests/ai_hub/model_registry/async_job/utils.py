@@ -1,8 +1,5 @@
 import structlog
-from kubernetes.dynamic import DynamicClient
-from ocp_resources.pod import Pod
 from ocp_resources.service import Service
-from timeout_sampler import TimeoutExpiredError
 
 from tests.ai_hub.model_registry.async_job.constants import (
     CA_BUNDLE_CONFIG,
@@ -11,11 +8,13 @@ from tests.ai_hub.model_registry.async_job.constants import (
 )
 from tests.ai_hub.utils import get_latest_job_pod
 from utilities.constants import MinIo, OCIRegistry
-from utilities.general import collect_pod_information
+from utilities.minio import minio_s3_client, upload_s3_objects
 
 LOGGER = structlog.get_logger(name=__name__)
 
-__all__ = ["build_async_job_config", "get_latest_job_pod", "upload_test_model_to_minio_from_image"]
+TEST_MODEL_FILE_CONTENT = b"Test model file for validating the async upload pipeline\n"
+
+__all__ = ["build_async_job_config", "get_latest_job_pod", "upload_test_model_to_minio"]
 
 
 def build_async_job_config(
@@ -88,96 +87,22 @@ def build_async_job_config(
     return volume_mounts, environment_variables
 
 
-def upload_test_model_to_minio_from_image(
-    admin_client: DynamicClient,
-    namespace: str,
+def upload_test_model_to_minio(
     minio_service: Service,
     object_key: str = "my-model/model.onnx",
-    model_image: str = MinIo.PodConfig.KSERVE_MINIO_IMAGE,
 ) -> None:
-    """Extract and upload test model to MinIO from a container image
+    """Upload a test model file to MinIO from the test runner through a port-forward
 
     Args:
-        admin_client: Kubernetes client
-        namespace: Namespace to create upload pod in
         minio_service: MinIO service resource
         object_key: S3 object key path
-        model_image: Container image containing the model
     """
-    mc_url = f"http://{minio_service.name}.{minio_service.namespace}.svc.cluster.local:{MinIo.Metadata.DEFAULT_PORT} "
-    with Pod(
-        client=admin_client,
-        name="test-model-uploader-from-image",
-        namespace=namespace,
-        restart_policy="Never",
-        volumes=[{"name": "upload-data", "emptyDir": {}}],
-        init_containers=[
-            {
-                "name": "extract-model-from-image",
-                "image": model_image,
-                "command": ["/bin/sh", "-c"],
-                "args": [
-                    # Create a test model file for upload testing
-                    (
-                        "echo 'Creating test model file for async upload pipeline testing...' && "
-                        "echo 'Test model file for validating the async upload pipeline' > /upload-data/model.onnx && "
-                        "echo 'Test model file created successfully'"
-                    )
-                ],
-                "volumeMounts": [{"name": "upload-data", "mountPath": "/upload-data"}],
-                "securityContext": {
-                    "allowPrivilegeEscalation": False,
-                    "capabilities": {"drop": ["ALL"]},
-                    "runAsNonRoot": True,
-                    "seccompProfile": {"type": "RuntimeDefault"},
-                },
-            }
-        ],
-        containers=[
-            {
-                "name": "minio-uploader",
-                "image": "quay.io/minio/mc@sha256:470f5546b596e16c7816b9c3fa7a78ce4076bb73c2c73f7faeec0c8043923123",
-                "command": ["/bin/sh", "-c"],
-                "args": [
-                    # Upload the test model file to MinIO
-                    (
-                        f"echo 'Model file details:' && ls -la /upload-data/model.onnx && "
-                        f"echo 'Model file content preview:' && head -c 100 /upload-data/model.onnx && echo && "
-                        f"export MC_CONFIG_DIR=/upload-data/.mc && "
-                        f"mc alias set testminio {mc_url}"
-                        f"{MinIo.Credentials.ACCESS_KEY_VALUE} {MinIo.Credentials.SECRET_KEY_VALUE} && "
-                        f"mc mb --ignore-existing testminio/{MinIo.Buckets.MODELMESH_EXAMPLE_MODELS} && "
-                        f"mc cp /upload-data/model.onnx "
-                        f"testminio/{MinIo.Buckets.MODELMESH_EXAMPLE_MODELS}/{object_key} && "
-                        f"mc ls testminio/{MinIo.Buckets.MODELMESH_EXAMPLE_MODELS}/my-model/ && "
-                        f"echo 'Upload completed successfully'"
-                    )
-                ],
-                "volumeMounts": [{"name": "upload-data", "mountPath": "/upload-data"}],
-                "securityContext": {
-                    "allowPrivilegeEscalation": False,
-                    "capabilities": {"drop": ["ALL"]},
-                    "runAsNonRoot": True,
-                    "seccompProfile": {"type": "RuntimeDefault"},
-                },
-            }
-        ],
-        wait_for_resource=True,
-    ) as upload_pod:
-        LOGGER.info(f"Extracting model from image {model_image} and uploading to MinIO: {object_key}")
-        try:
-            upload_pod.wait_for_status(status="Succeeded", timeout=300)
-        except TimeoutExpiredError:
-            collect_pod_information(pod=upload_pod)
-            raise
-
-        # Get upload logs for verification
-        try:
-            upload_logs = upload_pod.log()
-            LOGGER.info(f"Upload logs: {upload_logs}")
-        except Exception as e:  # noqa: BLE001
-            LOGGER.warning(f"Could not retrieve upload logs: {e}")
-
-        LOGGER.info(
-            f"Test model file uploaded successfully to s3://{MinIo.Buckets.MODELMESH_EXAMPLE_MODELS}/{object_key}"
+    LOGGER.info(f"Uploading test model to MinIO: {object_key}")
+    with minio_s3_client(minio_service=minio_service) as s3_client:
+        upload_s3_objects(
+            s3_client=s3_client,
+            bucket=MinIo.Buckets.MODELMESH_EXAMPLE_MODELS,
+            objects={object_key: TEST_MODEL_FILE_CONTENT},
         )
+
+    LOGGER.info(f"Test model file uploaded successfully to s3://{MinIo.Buckets.MODELMESH_EXAMPLE_MODELS}/{object_key}")
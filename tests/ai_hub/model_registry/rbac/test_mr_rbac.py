@@ -8,7 +8,6 @@ This suite tests various RBAC scenarios including:
 - Role and RoleBinding management
 """
 
-from collections.abc import Generator
 from typing import Self
 
 import pytest
@@ -41,7 +40,6 @@ from tests.ai_hub.utils import (
     get_mr_user_token,
 )
 from utilities.constants import Protocols
-from utilities.infra import get_openshift_token
 from utilities.resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
 from utilities.user_utils import UserTestSession
 
@@ -65,7 +63,6 @@ class TestUserPermission:
         test_idp_user,
         model_registry_instance_rest_endpoint: list[tuple[str, int]],
         user_credentials_rbac: dict[str, str],
-        login_as_test_user: None,
     ):
         """
         This test verifies that non-admin users cannot access the Model Registry (403 Forbidden)
@@ -73,7 +70,7 @@ class TestUserPermission:
         if is_byoidc:
             token = get_mr_user_token(admin_client=admin_client, user_credentials_rbac=user_credentials_rbac)
         else:
-            token = get_openshift_token()
+            token = test_idp_user.token
 
         client_args = build_mr_client_args(rest_endpoint=model_registry_instance_rest_endpoint[0], token=token)
         with pytest.raises(ForbiddenException) as exc_info:
@@ -90,7 +87,6 @@ class TestUserPermission:
         test_idp_user: UserTestSession,
         user_credentials_rbac: dict[str, str],
         model_registry_group_with_user: Group,
-        login_as_test_user: Generator[UserTestSession],
     ):
         """
         This test verifies that:
@@ -101,7 +97,7 @@ class TestUserPermission:
             mr_user1_creds = get_byoidc_user_credentials(client=admin_client, username="mr-user1")
             token = get_mr_user_token(admin_client=admin_client, user_credentials_rbac=mr_user1_creds)
         else:
-            token = get_openshift_token()
+            token = test_idp_user.token
         sampler = TimeoutSampler(
             wait_timeout=240,
             sleep=5,
@@ -120,7 +116,6 @@ class TestUserPermission:
         test_idp_user: UserTestSession,
         model_registry_instance_rest_endpoint: list[tuple[str, int]],
         created_role_binding_group: RoleBinding,
-        login_as_test_user: None,
     ):
         """
         Test creating a new group and granting it Model Registry access.
@@ -132,6 +127,7 @@ class TestUserPermission:
         """
         assert_positive_mr_registry(
             model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint[0],
+            token=test_idp_user.token,
         )
 
     @pytest.mark.tier1
@@ -143,7 +139,6 @@ class TestUserPermission:
         model_registry_instance_rest_endpoint: list[tuple[str, int]],
         user_credentials_rbac: dict[str, str],
         created_role_binding_user: RoleBinding,
-        login_as_test_user: None,
     ):
         """
         Test granting Model Registry access to a single user.
@@ -165,7 +160,10 @@ class TestUserPermission:
                 break  # Break after first successful iteration
             LOGGER.info("Successfully accessed Model Registry")
         else:
-            assert_positive_mr_registry(model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint[0])
+            assert_positive_mr_registry(
+                model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint[0],
+                token=test_idp_user.token,
+            )
 
 
 class TestUserMultiProjectPermission:
@@ -198,7 +196,6 @@ class TestUserMultiProjectPermission:
         db_deployment_parametrized: list[Deployment],
         user_credentials_rbac: dict[str, str],
         model_registry_instance_parametrized: list[ModelRegistry],
-        login_as_test_user: None,
     ):
         """
         Verify that a user can be granted access to one MR instance at a time.
@@ -226,7 +223,7 @@ class TestUserMultiProjectPermission:
             token = get_mr_user_token(admin_client=admin_client, user_credentials_rbac=user_credentials_rbac)
             rbac_username = "mr-non-admin"
         else:
-            token = get_openshift_token()
+            token = test_idp_user.token
             rbac_username = user_credentials_rbac["username"]
 
         # Test each MR instance sequentially
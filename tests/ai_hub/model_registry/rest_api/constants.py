@@ -34,6 +34,8 @@ CUSTOM_PROPERTY = {
         "my_double_property": {"double_value": 500.01, "metadataType": "MetadataDoubleValue"},
     }
 }
+# Concurrent registrations across models and registries in bulk registration
+MODEL_REGISTRY_REST_MAX_WORKERS: int = 16
 MODEL_VERSION_DESCRIPTION = {"description": "updated model version description"}
 STATE_ARCHIVED = {"state": "ARCHIVED"}
 STATE_LIVE = {"state": "LIVE"}
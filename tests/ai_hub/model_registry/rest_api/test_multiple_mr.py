@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from typing import Self
 
 import pytest
@@ -13,8 +14,9 @@ from tests.ai_hub.constants import (
     NUM_RESOURCES,
 )
 from tests.ai_hub.model_registry.rest_api.utils import (
+    ModelRegistryRestClient,
     get_register_model_data,
-    register_model_rest_api,
+    register_many,
     validate_resource_attributes,
 )
 from tests.ai_hub.utils import get_model_catalog_pod
@@ -89,15 +91,24 @@ class TestModelRegistryMultipleInstances:
         self: Self, model_registry_rest_url: list[str], model_registry_rest_headers: dict[str, str]
     ):
         data = get_register_model_data(num_models=NUM_RESOURCES["num_resources"])
-        for num in range(NUM_RESOURCES["num_resources"]):
-            result = register_model_rest_api(
-                model_registry_rest_url=model_registry_rest_url[num],
-                model_registry_rest_headers=model_registry_rest_headers,
-                data_dict=data[num],
-            )
+        with ExitStack() as stack:
+            registrations = [
+                (
+                    stack.enter_context(
+                        ModelRegistryRestClient(
+                            base_url=model_registry_rest_url[num], headers=model_registry_rest_headers
+                        )
+                    ),
+                    data[num],
+                )
+                for num in range(NUM_RESOURCES["num_resources"])
+            ]
+            results = register_many(registrations=registrations)
+
+        for data_dict, result in zip(data, results):
             for data_key in ["register_model", "model_version", "model_artifact"]:
                 validate_resource_attributes(
-                    expected_params=data[num][f"{data_key}_data"],
+                    expected_params=data_dict[f"{data_key}_data"],
                     actual_resource_data=result[data_key],
                     resource_name=data_key,
                 )
@@ -1,17 +1,18 @@
 import copy
 import json
-import os
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, Self
 
 import requests
 import structlog
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.deployment import Deployment
 from ocp_resources.inference_service import InferenceService
-from pyhelper_utils.shell import run_command
+from requests.adapters import HTTPAdapter
 from timeout_sampler import retry
+from urllib3.util import Retry
 
 from tests.ai_hub.constants import (
     MR_ISVC_ARGS,
@@ -23,7 +24,12 @@ from tests.ai_hub.exceptions import (
     ModelRegistryResourceNotCreated,
     ModelRegistryResourceNotUpdated,
 )
-from tests.ai_hub.model_registry.rest_api.constants import MODEL_REGISTER_DATA, MODEL_REGISTRY_BASE_URI
+from tests.ai_hub.model_registry.rest_api.constants import (
+    MODEL_REGISTER_DATA,
+    MODEL_REGISTRY_BASE_URI,
+    MODEL_REGISTRY_REST_MAX_WORKERS,
+)
+from utilities.certificates_utils import get_certificate_factory
 from utilities.exceptions import ResourceValueMismatch
 from utilities.general import generate_random_name
 
@@ -65,40 +71,115 @@ def execute_model_registry_post_command(
         raise
 
 
+class ModelRegistryRestClient:
+    """
+    Model Registry REST API client over a keep-alive session, one per registry endpoint.
+
+    Thread-safe for concurrent requests; the connection pool is sized for bulk registration.
+    """
+
+    def __init__(self, base_url: str, headers: dict[str, str], verify: bool | str = False) -> None:
+        self.base_url = f"{base_url}{MODEL_REGISTRY_BASE_URI}"
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        self.session.verify = verify
+        adapter = HTTPAdapter(
+            pool_maxsize=MODEL_REGISTRY_REST_MAX_WORKERS,
+            # Only connection errors are retried, e.g. an SSL certificate error fails at once
+            max_retries=Retry(connect=5, read=False, status=False, other=False, backoff_factor=1),
+        )
+        self.session.mount(prefix="https://", adapter=adapter)
+        self.session.mount(prefix="http://", adapter=adapter)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _post(self, api_name: str, data_json: dict[str, Any]) -> dict[str, Any]:
+        url = f"{self.base_url}{api_name}"
+        resp = self.session.post(url=url, json=data_json, timeout=60)
+        LOGGER.info(f"url: {url}, status code: {resp.status_code}, rep: {resp.text}")
+
+        if resp.status_code not in [200, 201]:
+            raise ModelRegistryResourceNotCreated(
+                f"Failed to create ModelRegistry resource: {url}, {resp.status_code}: {resp.text}"
+            )
+        try:
+            return resp.json()
+        except requests.exceptions.JSONDecodeError:
+            LOGGER.error(f"Unable to parse {resp.text}")
+            raise
+
+    def create_registered_model(self, data: dict[str, Any]) -> dict[str, Any]:
+        return self._post(api_name="registered_models", data_json=data)
+
+    def create_model_version(self, registered_model_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        return self._post(api_name="model_versions", data_json={**data, "registeredModelId": registered_model_id})
+
+    def create_model_artifact(self, model_version_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        return self._post(api_name=f"model_versions/{model_version_id}/artifacts", data_json=data)
+
+    def register_model(self, data_dict: dict[str, Any]) -> dict[str, Any]:
+        """
+        Register a model with its version and artifact.
+
+        Args:
+            data_dict: dict with register_model_data, model_version_data and model_artifact_data
+
+        Returns:
+            dict with the created register_model, model_version and model_artifact
+        """
+        register_model = self.create_registered_model(data=data_dict["register_model_data"])
+        model_version = self.create_model_version(
+            registered_model_id=register_model["id"], data=data_dict["model_version_data"]
+        )
+        model_artifact = self.create_model_artifact(
+            model_version_id=model_version["id"], data=data_dict["model_artifact_data"]
+        )
+        LOGGER.info(
+            f"Successfully registered model: {register_model}, with version: {model_version} and "
+            f"associated artifact: {model_artifact}"
+        )
+        return {"register_model": register_model, "model_version": model_version, "model_artifact": model_artifact}
+
+
+def register_many(
+    registrations: list[tuple[ModelRegistryRestClient, dict[str, Any]]],
+    max_workers: int = MODEL_REGISTRY_REST_MAX_WORKERS,
+) -> list[dict[str, Any]]:
+    """
+    Register models concurrently, across models and registries.
+
+    Each model's dependent chain (registered model, version, artifact) runs sequentially in one worker.
+
+    Args:
+        registrations: (client, data_dict) pairs, see ModelRegistryRestClient.register_model
+        max_workers: maximum number of concurrent registrations
+
+    Returns:
+        registration results, in the order of registrations
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda registration: registration[0].register_model(data_dict=registration[1]), registrations)
+        )
+
+
 def register_model_rest_api(
     model_registry_rest_url: str,
     model_registry_rest_headers: dict[str, str],
     data_dict: dict[str, Any],
     verify: bool | str = False,
 ) -> dict[str, Any]:
-    # register a model
-    register_model = execute_model_registry_post_command(
-        url=f"{model_registry_rest_url}{MODEL_REGISTRY_BASE_URI}registered_models",
-        headers=model_registry_rest_headers,
-        data_json=data_dict["register_model_data"],
-        verify=verify,
-    )
-    # create associated model version:
-    model_data = data_dict["model_version_data"]
-    model_data["registeredModelId"] = register_model["id"]
-    model_version = execute_model_registry_post_command(
-        url=f"{model_registry_rest_url}{MODEL_REGISTRY_BASE_URI}model_versions",
-        headers=model_registry_rest_headers,
-        data_json=model_data,
-        verify=verify,
-    )
-    # create associated model artifact
-    model_artifact = execute_model_registry_post_command(
-        url=f"{model_registry_rest_url}{MODEL_REGISTRY_BASE_URI}model_versions/{model_version['id']}/artifacts",
-        headers=model_registry_rest_headers,
-        data_json=data_dict["model_artifact_data"],
-        verify=verify,
-    )
-    LOGGER.info(
-        f"Successfully registered model: {register_model}, with version: {model_version} and "
-        f"associated artifact: {model_artifact}"
-    )
-    return {"register_model": register_model, "model_version": model_version, "model_artifact": model_artifact}
+    with ModelRegistryRestClient(
+        base_url=model_registry_rest_url, headers=model_registry_rest_headers, verify=verify
+    ) as client:
+        return client.register_model(data_dict=data_dict)
 
 
 def validate_resource_attributes(
@@ -154,139 +235,24 @@ def validate_model_inference(endpoint: str, model: str, vllm: bool = False) -> N
 def generate_ca_and_server_cert(
     tmp_dir: str,
     db_service_hostname: str = "db-model-registry.rhoai-model-registries.svc.cluster.local",
-    ca_name: str = "Test CA",
     server_cn: str = "mysql-server",
 ) -> dict[str, str]:
     """
-    Generates a CA and server certificate/key for the MySQL server.
+    Issues a server certificate/key for the MySQL server from the session test CA.
 
     Args:
         tmp_dir: The temporary directory to store the certificates.
         db_service_hostname: The hostname of the MySQL server.
-        ca_name: The name of the CA.
         server_cn: The common name of the server.
 
     Returns:
         Dict[str, str]: A dictionary containing the paths to the CA certificate, server key, and server certificate.
     """
-
-    ca_key = os.path.join(tmp_dir, "ca.key")
-    ca_crt = os.path.join(tmp_dir, "ca.crt")
-    server_key = os.path.join(tmp_dir, "server-key.pem")
-    server_csr = os.path.join(tmp_dir, "server.csr")
-    server_crt = os.path.join(tmp_dir, "server-cert.pem")
-
-    LOGGER.info(f"Generating CA and server cert in {tmp_dir} for DB hostname {db_service_hostname}")
-
-    create_ca_key_and_cert_with_openssl(ca_key=ca_key, ca_crt=ca_crt, ca_name=ca_name)
-    generate_db_server_key_and_csr_with_openssl(server_key=server_key, server_csr=server_csr, server_cn=server_cn)
-    sign_db_server_cert_with_ca_with_openssl(server_crt=server_crt, server_csr=server_csr, ca_crt=ca_crt, ca_key=ca_key)
-
-    return {
-        "ca_crt": ca_crt,
-        "server_key": server_key,
-        "server_crt": server_crt,
-    }
-
-
-def create_ca_key_and_cert_with_openssl(
-    ca_key: str,
-    ca_crt: str,
-    ca_name: str,
-) -> None:
-    """
-    Creates a CA private key and certificate.
-
-    Args:
-        ca_key: The path to the CA private key.
-        ca_crt: The path to the CA certificate.
-        ca_name: The name of the CA.
-
-    Returns:
-        None
-    """
-    run_command(command=["openssl", "genrsa", "-out", ca_key, "2048"], check=True)
-    run_command(
-        command=[
-            "openssl",
-            "req",
-            "-x509",
-            "-new",
-            "-nodes",
-            "-key",
-            ca_key,
-            "-sha256",
-            "-days",
-            "3650",
-            "-out",
-            ca_crt,
-            "-subj",
-            f"/CN={ca_name}",
-        ],
-        check=True,
-    )
-
-
-def generate_db_server_key_and_csr_with_openssl(
-    server_key: str,
-    server_csr: str,
-    server_cn: str,
-) -> None:
-    """
-    Generates a DB server private key and CSR.
-
-    Args:
-        server_key: The path to the DB server private key.
-        server_csr: The path to the DB server CSR.
-        server_cn: The common name of the DB server.
-
-    Returns:
-        None
-    """
-    run_command(command=["openssl", "genrsa", "-out", server_key, "2048"], check=True)
-    run_command(
-        command=["openssl", "req", "-new", "-key", server_key, "-out", server_csr, "-subj", f"/CN={server_cn}"],
-        check=True,
-    )
-
-
-def sign_db_server_cert_with_ca_with_openssl(
-    server_crt: str,
-    server_csr: str,
-    ca_crt: str,
-    ca_key: str,
-) -> None:
-    """
-    Signs a DB server certificate with a CA.
-
-    Args:
-        server_crt: The path to the DB server certificate.
-        server_csr: The path to the DB server CSR.
-        ca_crt: The path to the CA certificate.
-        ca_key: The path to the CA private key.
-
-    Returns:
-        None
-    """
-    run_command(
-        command=[
-            "openssl",
-            "x509",
-            "-req",
-            "-in",
-            server_csr,
-            "-CA",
-            ca_crt,
-            "-CAkey",
-            ca_key,
-            "-CAcreateserial",
-            "-out",
-            server_crt,
-            "-days",
-            "3650",
-            "-sha256",
-        ],
-        check=True,
+    LOGGER.info(f"Issuing server cert in {tmp_dir} for DB hostname {db_service_hostname}")
+    return (
+        get_certificate_factory()
+        .issue_cert(common_name=server_cn, sans=[server_cn, db_service_hostname])
+        .write(directory=tmp_dir)
     )
 
 
@@ -105,8 +105,10 @@ class TestEvalHubReconcileMetrics:
                 operator_metrics_token=operator_metrics_token,
             ):
                 metrics = parse_prometheus_text(text=raw_metrics)
-                bucket_key = f"{RECONCILE_DURATION_METRIC}_bucket"
-                if bucket_key in metrics or RECONCILE_DURATION_METRIC in metrics:
+                if (
+                    metrics.types.get(RECONCILE_DURATION_METRIC) == "histogram"
+                    and f"{RECONCILE_DURATION_METRIC}_bucket" in metrics.families[RECONCILE_DURATION_METRIC]
+                ):
                     return
         except TimeoutExpiredError:
             pytest.fail(f"{RECONCILE_DURATION_METRIC} histogram not found on operator metrics endpoint")
@@ -393,14 +395,7 @@ class TestEvalHubReconcileMetrics:
                 operator_metrics_token=operator_metrics_token,
             ):
                 metrics = parse_prometheus_text(text=raw_metrics)
-                found = set()
-                for metric_name in EVALHUB_RECONCILE_METRICS:
-                    if (
-                        metric_name in metrics
-                        or f"{metric_name}_bucket" in metrics
-                        or f"{metric_name}_total" in metrics
-                    ):
-                        found.add(metric_name)
+                found = {metric_name for metric_name in EVALHUB_RECONCILE_METRICS if metric_name in metrics.families}
                 if found == set(EVALHUB_RECONCILE_METRICS):
                     return
         except TimeoutExpiredError:
@@ -764,21 +759,16 @@ class TestEvalHubReconcilePerformance:
                 operator_metrics_token=operator_metrics_token,
             ):
                 metrics = parse_prometheus_text(text=raw_metrics)
-                sum_key = f"{RECONCILE_DURATION_METRIC}_sum"
-                count_key = f"{RECONCILE_DURATION_METRIC}_count"
-                sum_samples = get_metric_samples(
-                    metrics=metrics,
-                    metric_name=sum_key,
-                    label_filter={METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE},
+                controller_labels = {METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE}
+                total_duration = metrics.get_value(
+                    metric_name=f"{RECONCILE_DURATION_METRIC}_sum", labels=controller_labels
                 )
-                count_samples = get_metric_samples(
-                    metrics=metrics,
-                    metric_name=count_key,
-                    label_filter={METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE},
+                total_count = metrics.get_value(
+                    metric_name=f"{RECONCILE_DURATION_METRIC}_count", labels=controller_labels
                 )
-                if sum_samples and count_samples:
-                    total_duration = float(sum_samples[0]["value"])
-                    total_count = float(count_samples[0]["value"])
+                if total_duration is not None and total_count is not None:
+                    total_duration = float(total_duration)
+                    total_count = float(total_count)
                     if total_count > 0:
                         avg_duration_ms = (total_duration / total_count) * 1000
                         assert avg_duration_ms < 5000, (
@@ -805,20 +795,11 @@ class TestEvalHubReconcilePerformance:
             operator_metrics_token=operator_metrics_token,
         )
         metrics = parse_prometheus_text(text=raw_metrics)
-        sum_key = f"{RECONCILE_DURATION_METRIC}_sum"
-        count_key = f"{RECONCILE_DURATION_METRIC}_count"
-        sum_samples = get_metric_samples(
-            metrics=metrics,
-            metric_name=sum_key,
-            label_filter={METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE},
-        )
-        count_samples = get_metric_samples(
-            metrics=metrics,
-            metric_name=count_key,
-            label_filter={METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE},
-        )
-        if sum_samples and count_samples and float(count_samples[0]["value"]) > 0:
-            avg_duration_s = float(sum_samples[0]["value"]) / float(count_samples[0]["value"])
+        controller_labels = {METRIC_LABEL_CONTROLLER: EVALHUB_CONTROLLER_LABEL_VALUE}
+        total_duration = metrics.get_value(metric_name=f"{RECONCILE_DURATION_METRIC}_sum", labels=controller_labels)
+        total_count = metrics.get_value(metric_name=f"{RECONCILE_DURATION_METRIC}_count", labels=controller_labels)
+        if total_duration is not None and total_count is not None and float(total_count) > 0:
+            avg_duration_s = float(total_duration) / float(total_count)
             assert avg_duration_s < 10, f"Average reconciliation {avg_duration_s:.3f}s suggests O(n) scaling"
         else:
             pytest.skip("Insufficient metric data to evaluate scaling behavior")
@@ -996,7 +977,9 @@ class TestEvalHubReconcileIntegration:
         )
         sensitive_patterns = ["password", "secret", "token", "credential", "apikey"]
         metrics = parse_prometheus_text(text=raw_metrics)
-        evalhub_metric_names = {name for name in metrics if any(name.startswith(m) for m in EVALHUB_RECONCILE_METRICS)}
+        evalhub_metric_names = {
+            name for family in EVALHUB_RECONCILE_METRICS for name in metrics.families.get(family, [])
+        }
         for metric_name in evalhub_metric_names:
             for sample in metrics[metric_name]:
                 for label_key, label_value in sample["labels"].items():
@@ -1283,14 +1266,7 @@ class TestEvalHubReconcileUpgrade:
                 operator_metrics_token=operator_metrics_token,
             ):
                 metrics = parse_prometheus_text(text=raw_metrics)
-                found = set()
-                for metric_name in EVALHUB_RECONCILE_METRICS:
-                    if (
-                        metric_name in metrics
-                        or f"{metric_name}_bucket" in metrics
-                        or f"{metric_name}_total" in metrics
-                    ):
-                        found.add(metric_name)
+                found = {metric_name for metric_name in EVALHUB_RECONCILE_METRICS if metric_name in metrics.families}
                 if found == set(EVALHUB_RECONCILE_METRICS):
                     return
         except TimeoutExpiredError:
@@ -1,4 +1,7 @@
+import re
 import socket
+from collections import UserDict
+from collections.abc import Mapping
 from typing import Any, Final
 
 import pytest
@@ -48,6 +51,20 @@ from utilities.kueue_utils import Workload
 
 LOGGER = structlog.get_logger(name=__name__)
 
+# Prometheus text exposition format: https://prometheus.io/docs/instrumenting/exposition_formats/
+# Quoted label values are matched with unrolled loops, per-character alternation is several times slower
+_PROMETHEUS_SAMPLE_RE: Final = re.compile(
+    r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{([^"}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"}]*)*)\})?\s+(\S+)(?:\s+-?\d+)?\s*$'
+)
+_PROMETHEUS_LABEL_RE: Final = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+_PROMETHEUS_METADATA_RE: Final = re.compile(r"^#\s+(HELP|TYPE)\s+([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\s+(.*))?$")
+_PROMETHEUS_ESCAPE_RE: Final = re.compile(r"\\(.)")
+_PROMETHEUS_ESCAPES: Final = {"n": "\n", "\\": "\\", '"': '"'}
+_PROMETHEUS_FAMILY_SUFFIXES: Final = {
+    "histogram": ("_bucket", "_sum", "_count"),
+    "summary": ("_sum", "_count"),
+}
+
 
 def is_evalhub_crd_available(admin_client: DynamicClient) -> bool:
     """Return True when the EvalHub CRD is installed on the cluster."""
@@ -1398,47 +1415,121 @@ def fetch_trace_collector_logs(trace_collector_pod: Pod, tail_lines: int = 5000)
     return trace_collector_pod.log(container="otel-collector", tail_lines=tail_lines)
 
 
-def parse_prometheus_text(text: str) -> dict[str, list[dict[str, Any]]]:
-    """Parse Prometheus text-format exposition into a dict keyed by metric name.
+class PrometheusMetrics(UserDict[str, list[dict[str, Any]]]):
+    """Parsed Prometheus scrape: metric name to list of samples (dicts with ``labels`` and ``value``).
+
+    Besides the samples, keeps ``HELP``/``TYPE`` metadata, the sample names of each histogram/summary
+    family and per-metric indexes for constant-time lookups, so a scrape is parsed once and reused
+    for many assertions.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.help: dict[str, str] = {}
+        self.types: dict[str, str] = {}
+        self.families: dict[str, list[str]] = {}
+        # Built per metric name on its first lookup, parsing does not pay for metrics never looked up
+        self._value_index: dict[str, dict[frozenset[tuple[str, str]], float | str]] = {}
+        self._label_index: dict[str, dict[tuple[str, str], list[dict[str, Any]]]] = {}
+
+    def get_label_index(self, metric_name: str) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Return (label name, label value) to samples index of a metric."""
+        if metric_name not in self._label_index:
+            label_index: dict[tuple[str, str], list[dict[str, Any]]] = {}
+            for sample in self.data.get(metric_name, []):
+                for label in sample["labels"].items():
+                    label_index.setdefault(label, []).append(sample)
+            self._label_index[metric_name] = label_index
+
+        return self._label_index[metric_name]
+
+    def get_value(self, metric_name: str, labels: dict[str, str] | None = None) -> float | str | None:
+        """Return the value of the sample with exactly ``labels``, None if missing."""
+        if metric_name not in self._value_index:
+            self._value_index[metric_name] = {
+                frozenset(sample["labels"].items()): sample["value"] for sample in self.data.get(metric_name, [])
+            }
+
+        return self._value_index[metric_name].get(frozenset((labels or {}).items()))
+
+
+def _unescape_prometheus_value(value: str) -> str:
+    return _PROMETHEUS_ESCAPE_RE.sub(lambda match: _PROMETHEUS_ESCAPES.get(match.group(1), match.group(0)), value)
+
+
+def _get_prometheus_family_name(metrics: PrometheusMetrics, name: str) -> str:
+    if name in metrics.types:
+        return name
+
+    for family_type, suffixes in _PROMETHEUS_FAMILY_SUFFIXES.items():
+        for suffix in suffixes:
+            family_name = name.removesuffix(suffix)
+            if family_name != name and metrics.types.get(family_name) == family_type:
+                return family_name
+
+    return name
+
+
+def parse_prometheus_text(text: str) -> PrometheusMetrics:
+    """Parse Prometheus text-format exposition into a mapping keyed by metric name.
 
     Each entry maps to a list of sample dicts with keys ``labels`` and ``value``.
+    Label values are unescaped; histogram and summary samples (``_bucket``, ``_sum``, ``_count``)
+    are kept under their sample names and grouped under their family in ``families``.
 
     Args:
         text: Raw text from the operator /metrics endpoint.
 
     Returns:
-        Mapping of metric family name to list of samples.
+        Mapping of metric name to list of samples, with metadata and lookup indexes.
     """
-    import re
-
-    metrics: dict[str, list[dict[str, Any]]] = {}
+    metrics = PrometheusMetrics()
     for line in text.splitlines():
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line:
             continue
-        match = re.match(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.+?)\})?\s+(.+?)(\s+\d+)?$", line)
+
+        if line.startswith("#"):
+            if metadata_match := _PROMETHEUS_METADATA_RE.match(line):
+                keyword, name, description = metadata_match.groups()
+                if keyword == "HELP":
+                    metrics.help[name] = _unescape_prometheus_value(value=description or "")
+                else:
+                    metrics.types[name] = (description or "untyped").strip()
+            continue
+
+        match = _PROMETHEUS_SAMPLE_RE.match(line)
         if not match:
             continue
-        name = match.group(1)
-        labels_raw = match.group(3) or ""
-        value_str = match.group(4)
 
-        labels: dict[str, str] = {}
-        if labels_raw:
-            for label_match in re.finditer(r'(\w+)="([^"]*)"', labels_raw):
-                labels[label_match.group(1)] = label_match.group(2)
+        name, labels_raw, value_str = match.groups()
+        # Most samples have no escaped label values, skip the substitution for them
+        labels = (
+            {
+                label_name: _unescape_prometheus_value(value=label_value) if "\\" in label_value else label_value
+                for label_name, label_value in _PROMETHEUS_LABEL_RE.findall(labels_raw)
+            }
+            if labels_raw
+            else {}
+        )
 
         try:
             value: float | str = float(value_str)
         except ValueError:
             value = value_str
 
-        metrics.setdefault(name, []).append({"labels": labels, "value": value})
+        samples = metrics.data.get(name)
+        if samples is None:
+            samples = metrics.data[name] = []
+            metrics.families.setdefault(_get_prometheus_family_name(metrics=metrics, name=name), []).append(name)
+
+        samples.append({"labels": labels, "value": value})
+
     return metrics
 
 
 def get_metric_samples(
-    metrics: dict[str, list[dict[str, Any]]],
+    metrics: Mapping[str, list[dict[str, Any]]],
     metric_name: str,
     label_filter: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
@@ -1455,11 +1546,17 @@ def get_metric_samples(
     samples = metrics.get(metric_name, [])
     if not label_filter:
         return samples
+
+    if isinstance(metrics, PrometheusMetrics):
+        # Only check the samples of the most selective label pair
+        label_index = metrics.get_label_index(metric_name=metric_name)
+        samples = min((label_index.get(label, []) for label in label_filter.items()), key=len)
+
     return [s for s in samples if all(s["labels"].get(key) == val for key, val in label_filter.items())]
 
 
 def metric_value_sum(
-    metrics: dict[str, list[dict[str, Any]]],
+    metrics: Mapping[str, list[dict[str, Any]]],
     metric_name: str,
     label_filter: dict[str, str] | None = None,
 ) -> float:
@@ -1496,8 +1593,6 @@ def parse_trace_spans_from_logs(logs: str) -> list[dict[str, Any]]:
         List of span dicts with keys: name, trace_id, span_id, parent_span_id,
         status, attributes.
     """
-    import re
-
     try:
         spans: list[dict[str, Any]] = []
         current_span: dict[str, Any] = {}
@@ -1,10 +1,14 @@
 from collections.abc import Generator
+from contextlib import closing
+from datetime import datetime
 from typing import Any
 
 import portforward
 import pytest
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from ocp_resources.cluster_role import ClusterRole
+from ocp_resources.cluster_role_binding import ClusterRoleBinding
 from ocp_resources.cluster_service_version import ClusterServiceVersion
 from ocp_resources.config_map import ConfigMap
 from ocp_resources.deployment import Deployment
@@ -25,18 +29,23 @@ from timeout_sampler import TimeoutSampler
 
 from tests.ai_safety.guardrails.constants import (
     AUTOCONFIG_DETECTOR_LABEL,
+    OTEL_COLLECTOR_NAME,
     OTEL_EXPORTER_PORT,
     SUPER_SECRET,
     TEMPO,
+    TEMPO_QUERY_PORT,
     TEST_TLS_CERTIFICATE,
     TEST_TLS_PRIVATE_KEY,
 )
+from tests.ai_safety.guardrails.utils import TempoClient, get_observability_namespace_name
 from tests.ai_safety.image_constants import AiSafetyImages
 from utilities.constants import (
     KServeDeploymentType,
     RuntimeTemplates,
 )
 from utilities.inference_utils import LOGGER, create_isvc
+from utilities.infra import create_ns
+from utilities.minio import get_free_local_port
 from utilities.operator_utils import get_cluster_service_version
 from utilities.serving_runtime import ServingRuntimeFromTemplate
 
@@ -252,8 +261,27 @@ def hap_detector_route(
         yield route
 
 
-@pytest.fixture(scope="class")
-def installed_tempo_operator(admin_client: DynamicClient, model_namespace: Namespace) -> Generator[None, Any]:
+@pytest.fixture(scope="session")
+def observability_namespace(
+    admin_client: DynamicClient, pytestconfig: pytest.Config, teardown_resources: bool
+) -> Generator[Namespace, Any, Any]:
+    """
+    Namespace of the observability stack (MinIO, TempoStack and OpenTelemetryCollector) shared by the guardrails
+    test classes of one xdist worker; each worker gets its own stack, see get_observability_namespace_name.
+    """
+    namespace_name = get_observability_namespace_name()
+    if pytestconfig.option.post_upgrade:
+        ns = Namespace(client=admin_client, name=namespace_name)
+        yield ns
+        if teardown_resources:
+            ns.clean_up()
+    else:
+        with create_ns(admin_client=admin_client, name=namespace_name, teardown=teardown_resources) as ns:
+            yield ns
+
+
+@pytest.fixture(scope="session")
+def installed_tempo_operator(admin_client: DynamicClient) -> Generator[None, Any]:
     """
     Installs the Tempo operator and waits for its deployment.
     """
@@ -299,16 +327,17 @@ def installed_tempo_operator(admin_client: DynamicClient, model_namespace: Names
         yield
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def tempo_stack(
     admin_client: DynamicClient,
-    model_namespace: Namespace,
+    observability_namespace: Namespace,
+    installed_tempo_operator: None,
     minio_secret_otel: Secret,
     pytestconfig: pytest.Config,
     teardown_resources: bool,
 ) -> Generator[TempoStack, Any]:
     """
-    Create a TempoStack CR in the test namespace, configured to use MinIO backend.
+    Create a TempoStack CR in the observability namespace, configured to use MinIO backend.
     """
     tempo_name = "my-tempo-stack"
 
@@ -317,7 +346,7 @@ def tempo_stack(
         tempo_cr = TempoStack(
             client=admin_client,
             name=tempo_name,
-            namespace=model_namespace.name,
+            namespace=observability_namespace.name,
         )
         tempo_cr.wait_for_condition(
             condition="Ready",
@@ -352,7 +381,7 @@ def tempo_stack(
             raise ResourceNotFoundError(f"No TempoStack dict found in ALM examples for CSV {tempo_csv.name}")
 
         # Customize metadata
-        tempo_stack_dict["metadata"]["namespace"] = model_namespace.name
+        tempo_stack_dict["metadata"]["namespace"] = observability_namespace.name
         tempo_stack_dict["metadata"]["name"] = tempo_name
 
         # Override spec with MinIO backend and resource constraints
@@ -382,7 +411,7 @@ def tempo_stack(
             yield tempo_cr
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def installed_opentelemetry_operator(
     admin_client: DynamicClient, pytestconfig: pytest.Config, teardown_resources: bool
 ) -> Generator[None, Any]:
@@ -435,21 +464,61 @@ def installed_opentelemetry_operator(
         yield
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
+def otel_collector_k8sattributes_rbac(
+    admin_client: DynamicClient,
+    observability_namespace: Namespace,
+    teardown_resources: bool,
+) -> Generator[ClusterRoleBinding, Any, Any]:
+    """
+    Allow the OpenTelemetryCollector service account to read pods metadata for its k8sattributes processor.
+    """
+    name = f"{observability_namespace.name}-{OTEL_COLLECTOR_NAME}-k8sattributes"
+    with (
+        ClusterRole(
+            client=admin_client,
+            name=name,
+            teardown=teardown_resources,
+            rules=[
+                {"apiGroups": [""], "resources": ["pods", "namespaces"], "verbs": ["get", "list", "watch"]},
+                {"apiGroups": ["apps"], "resources": ["replicasets"], "verbs": ["get", "list", "watch"]},
+            ],
+        ) as cluster_role,
+        ClusterRoleBinding(
+            client=admin_client,
+            name=name,
+            teardown=teardown_resources,
+            cluster_role=cluster_role.name,
+            subjects=[
+                {
+                    "kind": "ServiceAccount",
+                    "name": f"{OTEL_COLLECTOR_NAME}-collector",
+                    "namespace": observability_namespace.name,
+                }
+            ],
+        ) as cluster_role_binding,
+    ):
+        yield cluster_role_binding
+
+
+@pytest.fixture(scope="session")
 def otel_collector(
     admin_client: DynamicClient,
-    model_namespace: Namespace,
-    minio_service_otel,
+    observability_namespace: Namespace,
+    installed_opentelemetry_operator: None,
+    otel_collector_k8sattributes_rbac: ClusterRoleBinding,
+    minio_service_otel: Service,
     tempo_stack: TempoStack,
     pytestconfig: pytest.Config,
     teardown_resources: bool,
 ) -> Generator[OpenTelemetryCollector, Any, Any]:
     """
-    Create an OpenTelemetryCollector CR in the test namespace.
+    Create an OpenTelemetryCollector CR in the observability namespace.
     Dynamically uses the Operator CSV example and adjusts configuration for Tempo.
+    Spans are tagged with the sender pod namespace and name, so each test class can search its own traces.
     """
-    otel_name = "my-otelcol"
-    namespace = model_namespace.name
+    otel_name = OTEL_COLLECTOR_NAME
+    namespace = observability_namespace.name
 
     if pytestconfig.option.post_upgrade:
         # During post-upgrade, reuse existing OpenTelemetryCollector
@@ -503,6 +572,12 @@ def otel_collector(
                     "tls": {"insecure": True},
                 }
             },
+            "processors": {
+                "k8sattributes": {
+                    "extract": {"metadata": ["k8s.namespace.name", "k8s.pod.name"]},
+                    "pod_association": [{"sources": [{"from": "connection"}]}],
+                }
+            },
             "receivers": {
                 "otlp": {
                     "protocols": {
@@ -515,6 +590,7 @@ def otel_collector(
                 "pipelines": {
                     "traces": {
                         "exporters": ["otlp"],
+                        "processors": ["k8sattributes"],
                         "receivers": ["otlp"],
                     }
                 },
@@ -629,17 +705,17 @@ def guardrails_orchestrator_pod_with_tls(
     return pod
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def minio_pvc_otel(
     admin_client: DynamicClient,
-    model_namespace: Namespace,
+    observability_namespace: Namespace,
 ) -> Generator[PersistentVolumeClaim, Any, Any]:
     """
     Creates a PVC for MinIO storage backend in the given namespace.
     """
     pvc_kwargs = {
         "name": "minio",
-        "namespace": model_namespace.name,
+        "namespace": observability_namespace.name,
         "client": admin_client,
         "size": "2Gi",
         "accessmodes": "ReadWriteOnce",
@@ -650,8 +726,8 @@ def minio_pvc_otel(
         yield pvc
 
 
-@pytest.fixture(scope="class")
-def minio_deployment_otel(admin_client, model_namespace, minio_pvc_otel):
+@pytest.fixture(scope="session")
+def minio_deployment_otel(admin_client, observability_namespace, minio_pvc_otel):
     selector = {"matchLabels": {"app.kubernetes.io/name": "minio"}}
     pod_template = {
         "metadata": {"labels": {"app.kubernetes.io/name": "minio"}},
@@ -681,7 +757,7 @@ def minio_deployment_otel(admin_client, model_namespace, minio_pvc_otel):
     deployment = Deployment(
         client=admin_client,
         name="minio",
-        namespace=model_namespace.name,
+        namespace=observability_namespace.name,
         selector=selector,
         template=pod_template,
         strategy={"type": "Recreate"},
@@ -693,16 +769,16 @@ def minio_deployment_otel(admin_client, model_namespace, minio_pvc_otel):
         yield deployment
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def minio_service_otel(
-    admin_client, model_namespace, minio_deployment_otel, pytestconfig: pytest.Config, teardown_resources: bool
+    admin_client, observability_namespace, minio_deployment_otel, pytestconfig: pytest.Config, teardown_resources: bool
 ):
     if pytestconfig.option.post_upgrade:
         # During post-upgrade, reuse existing Service
         service = Service(
             client=admin_client,
             name="minio",
-            namespace=model_namespace.name,
+            namespace=observability_namespace.name,
         )
         yield service
         if teardown_resources:
@@ -724,7 +800,7 @@ def minio_service_otel(
         service = Service(
             client=admin_client,
             name="minio",
-            namespace=model_namespace.name,
+            namespace=observability_namespace.name,
             ports=ports,
             selector=selector,
             type="ClusterIP",
@@ -734,16 +810,16 @@ def minio_service_otel(
         yield service
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def minio_secret_otel(
-    admin_client, model_namespace, minio_service_otel, pytestconfig: pytest.Config, teardown_resources: bool
+    admin_client, observability_namespace, minio_service_otel, pytestconfig: pytest.Config, teardown_resources: bool
 ):
     if pytestconfig.option.post_upgrade:
         # During post-upgrade, reuse existing Secret
         secret = Secret(
             client=admin_client,
             name="minio-test",
-            namespace=model_namespace.name,
+            namespace=observability_namespace.name,
         )
         yield secret
         if teardown_resources:
@@ -753,9 +829,9 @@ def minio_secret_otel(
         secret = Secret(
             client=admin_client,
             name="minio-test",
-            namespace=model_namespace.name,
+            namespace=observability_namespace.name,
             string_data={
-                "endpoint": f"http://{minio_service_otel.name}.{model_namespace.name}.svc.cluster.local:9000",
+                "endpoint": f"http://{minio_service_otel.name}.{observability_namespace.name}.svc.cluster.local:9000",
                 "bucket": TEMPO,
                 "access_key_id": TEMPO,  # pragma: allowlist secret
                 "access_key_secret": SUPER_SECRET,  # pragma: allowlist secret
@@ -767,16 +843,16 @@ def minio_secret_otel(
         yield secret
 
 
-@pytest.fixture(scope="class")
-def otelcol_metrics_endpoint(admin_client: DynamicClient, model_namespace: Namespace):
+@pytest.fixture(scope="session")
+def otelcol_endpoint(admin_client: DynamicClient, otel_collector: OpenTelemetryCollector) -> str:
     """
-    Returns the metrics endpoint for the OpenTelemetryCollector by grepping the service name.
+    Returns the OTLP endpoint of the OpenTelemetryCollector, for metrics and traces, by grepping the service name.
     """
 
     service = next(
         Service.get(
             client=admin_client,
-            namespace=model_namespace.name,
+            namespace=otel_collector.namespace,
             label_selector="app.kubernetes.io/component=opentelemetry-collector",
         )
     )
@@ -784,44 +860,43 @@ def otelcol_metrics_endpoint(admin_client: DynamicClient, model_namespace: Names
     service_name = service.name
 
     port = OTEL_EXPORTER_PORT
-    return f"http://{service_name}.{model_namespace.name}.svc.cluster.local:{port}"
-
-
-@pytest.fixture(scope="class")
-def tempo_traces_endpoint(tempo_stack, model_namespace: Namespace, admin_client: DynamicClient):
-    """
-    Returns the TempoStack distributor endpoint dynamically using ocp_resources.Service.
-
-    """
-    service_name = f"tempo-{tempo_stack.name}-distributor"
-
-    port = OTEL_EXPORTER_PORT
+    return f"http://{service_name}.{otel_collector.namespace}.svc.cluster.local:{port}"
 
-    return f"http://{service_name}.{model_namespace.name}.svc.cluster.local:{port}"
 
-
-@pytest.fixture(scope="class")
-def tempo_traces_service_portforward(admin_client, model_namespace, tempo_stack):
+@pytest.fixture(scope="session")
+def tempo_client(tempo_stack: TempoStack) -> Generator[TempoClient, Any, Any]:
     """
-    Port-forwards the Tempo Query Frontend service to access traces locally.
+    Port-forwards the Tempo Query Frontend HTTP API and yields a client for it.
     Equivalent CLI:
-      oc -n <ns> port-forward svc/tempo-my-tempo-stack-query-frontend 16686:16686
+      oc -n <ns> port-forward svc/tempo-my-tempo-stack-query-frontend 3200:3200
     """
-    namespace = model_namespace.name
     service_name = f"tempo-{tempo_stack.name}-query-frontend"
-    local_port = 16686
+    # xdist workers port-forward their own stack concurrently
+    local_port = get_free_local_port()
     local_url = f"http://localhost:{local_port}"
 
     try:
-        with portforward.forward(
-            pod_or_service=f"{service_name}",
-            namespace=namespace,
-            from_port=local_port,
-            to_port=local_port,
-            waiting=20,
+        with (
+            portforward.forward(
+                pod_or_service=service_name,
+                namespace=tempo_stack.namespace,
+                from_port=local_port,
+                to_port=TEMPO_QUERY_PORT,
+                waiting=20,
+            ),
+            closing(TempoClient(base_url=local_url)) as client,
         ):
-            LOGGER.info(f"Tempo traces service port-forward established: {local_url}")
-            yield local_url
+            LOGGER.info(f"Tempo query frontend port-forward established: {local_url}")
+            yield client
     except Exception as e:
         LOGGER.error(f"Failed to set up port forwarding for {service_name}: {e}")
         raise
+
+
+@pytest.fixture(scope="class")
+def tempo_traces_since(guardrails_orchestrator: GuardrailsOrchestrator) -> int:
+    """
+    Start (unix seconds) of the class traces search window: the creation of the class GuardrailsOrchestrator,
+    so traces of a previous orchestrator in the same namespace are not matched.
+    """
+    return int(datetime.fromisoformat(guardrails_orchestrator.instance.metadata.creationTimestamp).timestamp())
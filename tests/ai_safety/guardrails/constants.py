@@ -7,6 +7,11 @@ EXAMPLE_EMAIL_ADDRESS: str = "johndoe@example.com"
 OTEL_EXPORTER_PORT: int = 4317
 SUPER_SECRET = "supersecret"  # pragma: allowlist secret
 TEMPO = "tempo"
+# Tempo query-frontend HTTP API port
+TEMPO_QUERY_PORT: int = 3200
+# Namespace of the session-shared MinIO, TempoStack and OpenTelemetryCollector, suffixed per xdist worker
+OBSERVABILITY_NAMESPACE: str = "guardrails-observability"
+OTEL_COLLECTOR_NAME: str = "my-otelcol"
 HARMLESS_PROMPT: str = "What is the opposite of up?"
 CHAT_COMPLETIONS_DETECTION_ENDPOINT: str = "api/v2/chat/completions-detection"
 PII_ENDPOINT: str = "/pii"
@@ -1,11 +1,9 @@
 import pytest
-import requests
 import structlog
 import yaml
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.custom_resource_definition import CustomResourceDefinition
 from ocp_resources.namespace import Namespace
-from timeout_sampler import retry
 
 from tests.ai_safety.guardrails.constants import (
     AUTOCONFIG_DETECTOR_LABEL,
@@ -21,6 +19,7 @@ from tests.ai_safety.guardrails.constants import (
     TEST_TLS_CERTIFICATE,
 )
 from tests.ai_safety.guardrails.utils import (
+    check_guardrails_traces_in_tempo,
     create_detector_config,
     send_and_verify_negative_detection,
     send_and_verify_standalone_detection,
@@ -400,29 +399,17 @@ class TestGuardrailsOrchestratorWithHuggingFaceDetectors:
         guardrails_gateway_config,
         otel_collector,
         tempo_stack,
-        tempo_traces_service_portforward,
+        tempo_client,
+        tempo_traces_since,
         guardrails_healthcheck,
     ):
         """
         Ensure that OpenTelemetry traces from Guardrails Orchestrator are collected in Tempo.
         Equivalent to clicking 'Find Traces' in the Tempo UI.
         """
-
-        @retry(wait_timeout=60, sleep=5)
-        def check_traces():
-            services = requests.get(f"{tempo_traces_service_portforward}/api/services").json().get("data") or []
-            guardrails_services = [s for s in services if "guardrails" in s]
-            if not guardrails_services:
-                return False
-
-            svc = guardrails_services[0]
-
-            traces = requests.get(f"{tempo_traces_service_portforward}/api/traces?service={svc}").json()
-
-            if traces.get("data"):
-                return traces
-
-        check_traces()
+        check_guardrails_traces_in_tempo(
+            tempo_client=tempo_client, namespace=guardrails_orchestrator.namespace, since=tempo_traces_since
+        )
 
 
 @pytest.mark.parametrize(
@@ -512,10 +512,13 @@ class TestPreUpgradeGuardrailsOrchestratorWithHuggingFaceDetectors:
         guardrails_gateway_config,
         otel_collector,
         tempo_stack,
-        tempo_traces_service_portforward,
+        tempo_client,
+        tempo_traces_since,
     ):
         """Verify OpenTelemetry traces from Guardrails Orchestrator are collected in Tempo before upgrade."""
-        check_guardrails_traces_in_tempo(tempo_traces_service_portforward=tempo_traces_service_portforward)
+        check_guardrails_traces_in_tempo(
+            tempo_client=tempo_client, namespace=guardrails_orchestrator.namespace, since=tempo_traces_since
+        )
 
 
 @pytest.mark.parametrize(
@@ -627,7 +630,10 @@ class TestPostUpgradeGuardrailsOrchestratorWithHuggingFaceDetectors:
         guardrails_gateway_config,
         otel_collector,
         tempo_stack,
-        tempo_traces_service_portforward,
+        tempo_client,
+        tempo_traces_since,
     ):
         """Verify OpenTelemetry traces from Guardrails Orchestrator are collected in Tempo after upgrade."""
-        check_guardrails_traces_in_tempo(tempo_traces_service_portforward=tempo_traces_service_portforward)
+        check_guardrails_traces_in_tempo(
+            tempo_client=tempo_client, namespace=guardrails_orchestrator.namespace, since=tempo_traces_since
+        )
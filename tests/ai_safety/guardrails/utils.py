@@ -1,5 +1,7 @@
 import http
 import json
+import os
+import time
 from typing import Any
 
 import requests
@@ -8,7 +10,7 @@ from requests import Response
 from requests.exceptions import ReadTimeout
 from timeout_sampler import retry
 
-from tests.ai_safety.guardrails.constants import GuardrailsDetectionPrompt
+from tests.ai_safety.guardrails.constants import OBSERVABILITY_NAMESPACE, GuardrailsDetectionPrompt
 from utilities.exceptions import UnexpectedValueError
 from utilities.guardrails import get_auth_headers
 
@@ -388,26 +390,74 @@ def send_and_verify_standalone_detection(
     return response
 
 
-@retry(wait_timeout=60, sleep=5)
-def check_guardrails_traces_in_tempo(tempo_traces_service_portforward: str):
+class TempoClient:
+    """
+    Tempo query-frontend HTTP API client, reusing one HTTP session for all queries.
     """
-    Check for guardrails traces in Tempo.
 
-    Args:
-        tempo_traces_service_portforward: The Tempo traces service port-forward URL
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        self.session = requests.Session()
+
+    def search_traces(self, query: str, start: int, end: int | None = None, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Search traces with a TraceQL query within a time window.
+
+        Args:
+            query: TraceQL query.
+            start: Window start, unix seconds.
+            end: Window end, unix seconds, defaults to now.
+            limit: Maximum number of traces.
+
+        Returns:
+            The matching traces metadata.
+        """
+        response = self.session.get(
+            url=f"{self.base_url}/api/search",
+            params={"q": query, "start": start, "end": end or int(time.time()) + 1, "limit": limit},
+            timeout=30,
+        )
+        response.raise_for_status()
+        return response.json().get("traces") or []
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def get_observability_namespace_name() -> str:
+    """
+    Get the namespace of the session-shared observability stack, one per xdist worker.
 
     Returns:
-        The traces data if found, False otherwise
+        The observability namespace name
     """
-    services = requests.get(f"{tempo_traces_service_portforward}/api/services").json().get("data", [])
+    if worker := os.environ.get("PYTEST_XDIST_WORKER"):
+        return f"{OBSERVABILITY_NAMESPACE}-{worker}"
 
-    guardrails_services = [service for service in services if "guardrails" in service]
-    if not guardrails_services:
-        return False
+    return OBSERVABILITY_NAMESPACE
 
-    svc = guardrails_services[0]
 
-    traces = requests.get(f"{tempo_traces_service_portforward}/api/traces?service={svc}").json()
+@retry(wait_timeout=60, sleep=5)
+def check_guardrails_traces_in_tempo(
+    tempo_client: TempoClient, namespace: str, since: int
+) -> list[dict[str, Any]] | bool:
+    """
+    Check for guardrails traces in Tempo.
+
+    Args:
+        tempo_client: The Tempo query-frontend client
+        namespace: Namespace of the GuardrailsOrchestrator, set on its spans by the collector `k8sattributes`
+            processor, to skip traces of other test classes running concurrently
+        since: Start of the search window (unix seconds), to skip traces of previous orchestrators in the namespace
+
+    Returns:
+        The traces found, False otherwise
+    """
+    traces = tempo_client.search_traces(
+        query=f'{{ resource.k8s.namespace.name = "{namespace}" && resource.service.name =~ ".*guardrails.*" }}',
+        start=since,
+    )
 
-    if traces.get("data"):
+    if traces:
         return traces
+    return False
@@ -1,5 +1,7 @@
 import json
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Any
 
 import pytest
@@ -24,8 +26,13 @@ from tests.ai_safety.lm_eval.constants import (
     FLAN_T5_IMAGE,
     LMEVAL_OCI_REPO,
     LMEVAL_OCI_TAG,
+    LMEVAL_TIER2_SHARDS,
+)
+from tests.ai_safety.lm_eval.utils import (
+    get_lmevaljob_pod,
+    resolve_lmeval_task_list,
+    shard_lmeval_tasks,
 )
-from tests.ai_safety.lm_eval.utils import get_lmevaljob_pod
 from utilities.constants import ApiGroups, KServeDeploymentType, Labels, MinIo, Protocols, RuntimeTemplates
 from utilities.exceptions import MissingParameter
 from utilities.general import b64_encoded_string
@@ -38,30 +45,20 @@ VLLM_EMULATOR_PORT: int = 8000
 LMEVALJOB_NAME: str = "lmeval-test-job"
 
 
-@pytest.fixture(scope="function")
-def lmevaljob_hf(
-    request: FixtureRequest,
-    admin_client: DynamicClient,
-    model_namespace: Namespace,
-    patched_dsc_lmeval_allow_all: DataScienceCluster,
-    lmeval_hf_access_token: Secret,
-) -> Generator[LMEvalJob]:
-    with LMEvalJob(
-        client=admin_client,
-        name=LMEVALJOB_NAME,
-        namespace=model_namespace.name,
-        model="hf",
-        model_args=[{"name": "pretrained", "value": "rgeada/tiny-untrained-granite"}],
-        task_list=request.param.get("task_list"),
-        log_samples=True,
-        allow_online=True,
-        allow_code_execution=True,
-        system_instruction="Be concise. At every point give the shortest acceptable answer.",
-        chat_template={
+def _get_lmevaljob_hf_kwargs(task_list: dict[str, Any] | None) -> dict[str, Any]:
+    return {
+        "model": "hf",
+        "model_args": [{"name": "pretrained", "value": "rgeada/tiny-untrained-granite"}],
+        "task_list": task_list,
+        "log_samples": True,
+        "allow_online": True,
+        "allow_code_execution": True,
+        "system_instruction": "Be concise. At every point give the shortest acceptable answer.",
+        "chat_template": {
             "enabled": True,
         },
-        limit="0.01",
-        pod={
+        "limit": "0.01",
+        "pod": {
             "container": {
                 "resources": {
                     "limits": {"cpu": "1", "memory": "8Gi"},
@@ -81,10 +78,62 @@ def lmevaljob_hf(
                 ],
             },
         },
+    }
+
+
+@pytest.fixture(scope="function")
+def lmevaljob_hf(
+    request: FixtureRequest,
+    admin_client: DynamicClient,
+    model_namespace: Namespace,
+    patched_dsc_lmeval_allow_all: DataScienceCluster,
+    lmeval_hf_access_token: Secret,
+) -> Generator[LMEvalJob]:
+    with LMEvalJob(
+        client=admin_client,
+        name=LMEVALJOB_NAME,
+        namespace=model_namespace.name,
+        **_get_lmevaljob_hf_kwargs(task_list=resolve_lmeval_task_list(task_list=request.param.get("task_list"))),
     ) as job:
         yield job
 
 
+@pytest.fixture(scope="function")
+def lmevaljob_hf_shards(
+    request: FixtureRequest,
+    admin_client: DynamicClient,
+    model_namespace: Namespace,
+    patched_dsc_lmeval_allow_all: DataScienceCluster,
+    lmeval_hf_access_token: Secret,
+) -> Generator[list[LMEvalJob]]:
+    """
+    Sharding mode of lmevaljob_hf: the ``taskNames`` of the task list are split into shards of even task counts
+    (see shard_lmeval_tasks) and one LMEvalJob runs per shard concurrently.
+
+    request.param: ``task_list`` as in lmevaljob_hf and ``shards``, the maximum number of jobs.
+    """
+    task_list = resolve_lmeval_task_list(task_list=request.param.get("task_list"))
+    if not task_list or not task_list.get("taskNames"):
+        raise MissingParameter("lmevaljob_hf_shards requires a task_list with taskNames")
+
+    task_shards = shard_lmeval_tasks(
+        tasks=task_list["taskNames"],
+        shards=request.param.get("shards", LMEVAL_TIER2_SHARDS),
+    )
+    with ExitStack() as stack:
+        yield [
+            stack.enter_context(
+                LMEvalJob(
+                    client=admin_client,
+                    name=f"{LMEVALJOB_NAME}-{index}",
+                    namespace=model_namespace.name,
+                    **_get_lmevaljob_hf_kwargs(task_list={**task_list, "taskNames": task_shard}),
+                )
+            )
+            for index, task_shard in enumerate(task_shards)
+        ]
+
+
 @pytest.fixture(scope="function")
 def lmevaljob_local_offline(
     request: FixtureRequest,
@@ -523,6 +572,16 @@ def lmevaljob_hf_pod(admin_client: DynamicClient, lmevaljob_hf: LMEvalJob) -> Ge
     yield get_lmevaljob_pod(client=admin_client, lmevaljob=lmevaljob_hf)
 
 
+@pytest.fixture(scope="function")
+def lmevaljob_hf_shard_pods(admin_client: DynamicClient, lmevaljob_hf_shards: list[LMEvalJob]) -> list[Pod]:
+    with ThreadPoolExecutor(max_workers=len(lmevaljob_hf_shards)) as executor:
+        return list(
+            executor.map(
+                lambda lmevaljob: get_lmevaljob_pod(client=admin_client, lmevaljob=lmevaljob), lmevaljob_hf_shards
+            )
+        )
+
+
 @pytest.fixture(scope="function")
 def lmevaljob_local_offline_pod(
     admin_client: DynamicClient, lmevaljob_local_offline: LMEvalJob
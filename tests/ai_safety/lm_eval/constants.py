@@ -1,3 +1,5 @@
+import os
+
 from tests.ai_safety.image_constants import AiSafetyImages
 
 CUSTOM_UNITXT_TASK_DATA = {
@@ -122,6 +124,14 @@ CA_BUNDLE_MOUNT_PATH: str = "/etc/ssl/certs/odh-ca-bundle.crt"
 MERGED_CA_BUNDLE_KEY: str = "merged-ca-bundle.crt"
 LAST_SCHEDULED_GENERATION_ANNOTATION: str = "trustyai.opendatahub.io/last-scheduled-generation"
 LMEVALJOB_COMPLETE_STATE: str = "Complete"
+LMEVAL_TASKS_CSV_PATH: str = "tests/ai_safety/lm_eval/data/new_task_list.csv"
+# Pre-parsed LM-Eval task catalog, keyed by the CSV content hash
+LMEVAL_TASKS_CACHE_DIR: str = os.getenv(
+    "LMEVAL_TASKS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "lmeval"),
+)
+# Number of concurrent LMEvalJobs the tier2 task list is split into
+LMEVAL_TIER2_SHARDS: int = int(os.getenv("LMEVAL_TIER2_SHARDS", "4"))
 ODH_TRUSTED_CA_BUNDLE_CONFIGMAP: str = "odh-trusted-ca-bundle"
 
 # Accelerator identifier mapping for GPU types
@@ -15,14 +15,16 @@ from tests.ai_safety.lm_eval.constants import (
     LLMAAJ_TASK_DATA,
     LMEVAL_OCI_REPO,
     LMEVAL_OCI_TAG,
+    LMEVAL_TIER2_SHARDS,
     LMEVALJOB_COMPLETE_STATE,
     ODH_TRUSTED_CA_BUNDLE_CONFIGMAP,
 )
 from tests.ai_safety.lm_eval.utils import (
-    get_lmeval_tasks,
+    LMEvalTaskSelection,
     validate_ca_bundle_injected,
     validate_ca_bundle_not_injected,
     validate_lmeval_job_pod_and_logs,
+    validate_lmeval_job_pods_and_logs,
     wait_for_lmevaljob_state,
     wait_for_vllm_model_ready,
 )
@@ -30,11 +32,9 @@ from tests.ai_safety.utils import validate_tai_component_images
 from utilities.constants import OCIRegistry
 from utilities.registry_utils import pull_manifest_from_oci_registry
 
-TIER1_LMEVAL_TASKS: list[str] = get_lmeval_tasks(min_downloads=10000)
+TIER1_LMEVAL_TASKS = LMEvalTaskSelection(min_downloads=10000)
 
-TIER2_LMEVAL_TASKS: list[str] = list(
-    set(get_lmeval_tasks(min_downloads=0.70, max_downloads=10000)) - set(TIER1_LMEVAL_TASKS)
-)
+TIER2_LMEVAL_TASKS = LMEvalTaskSelection(min_downloads=0.70, max_downloads=10000, exclude=TIER1_LMEVAL_TASKS)
 
 LOGGER = structlog.get_logger(name=__name__)
 
@@ -87,19 +87,20 @@ def test_lmeval_huggingface_model(admin_client, model_namespace, lmevaljob_hf_po
 @pytest.mark.skip_on_disconnected
 @pytest.mark.tier2
 @pytest.mark.parametrize(
-    "model_namespace, lmevaljob_hf",
+    "model_namespace, lmevaljob_hf_shards",
     [
         pytest.param(
             {"name": "test-lmeval-hf-tier2"},
-            {"task_list": {"taskNames": TIER2_LMEVAL_TASKS}},
+            {"task_list": {"taskNames": TIER2_LMEVAL_TASKS}, "shards": LMEVAL_TIER2_SHARDS},
         ),
     ],
     indirect=True,
 )
-def test_lmeval_huggingface_model_tier2(admin_client, model_namespace, lmevaljob_hf_pod):
+def test_lmeval_huggingface_model_tier2(admin_client, model_namespace, lmevaljob_hf_shard_pods):
     """Tests that verify running common evaluations (and a custom one) on a model pulled directly from HuggingFace.
-    On each test we run a different evaluation task, limiting it to 0.5% of the questions on each eval."""
-    validate_lmeval_job_pod_and_logs(lmevaljob_pod=lmevaljob_hf_pod)
+    On each test we run a different evaluation task, limiting it to 0.5% of the questions on each eval.
+    The task list is split across concurrent LMEvalJobs, all of them must succeed."""
+    validate_lmeval_job_pods_and_logs(lmevaljob_pods=lmevaljob_hf_shard_pods)
 
 
 @pytest.mark.parametrize(
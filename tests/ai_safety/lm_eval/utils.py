@@ -1,6 +1,13 @@
+import hashlib
+import os
+import pickle
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import structlog
 from kubernetes.client.rest import ApiException
 from kubernetes.dynamic import DynamicClient
@@ -14,6 +21,8 @@ from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 from tests.ai_safety.lm_eval.constants import (
     CA_BUNDLE_MOUNT_PATH,
     CA_BUNDLE_VOLUME_NAME,
+    LMEVAL_TASKS_CACHE_DIR,
+    LMEVAL_TASKS_CSV_PATH,
     MERGED_CA_BUNDLE_KEY,
     MERGED_CA_CONFIGMAP_SUFFIX,
 )
@@ -24,8 +33,13 @@ from utilities.exceptions import (
 )
 from utilities.general import collect_pod_information
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 LOGGER = structlog.get_logger(name=__name__)
 
+LMEVAL_TASKS_COLUMNS: tuple[str, ...] = ("Name", "HF dataset downloads", "Exists", "Dataset", "OpenLLM leaderboard")
+
 
 def get_lmevaljob_pod(client: DynamicClient, lmevaljob: LMEvalJob, timeout: int = 600) -> Pod:
     """
@@ -50,6 +64,40 @@ def get_lmevaljob_pod(client: DynamicClient, lmevaljob: LMEvalJob, timeout: int
     return lmeval_pod
 
 
+@cache
+def get_lmeval_task_catalog() -> pd.DataFrame:
+    """
+    Load the LM-Eval task catalog CSV, once per process.
+
+    The parsed catalog is kept in a pickle keyed by the CSV sha256, so only the first load after
+    a CSV change pays for the CSV parsing. pandas is imported here so that collecting the tests
+    does not import it.
+
+    Returns:
+        LM-Eval task catalog DataFrame
+    """
+    import pandas as pd
+
+    with open(LMEVAL_TASKS_CSV_PATH, "rb") as csv_file:
+        csv_digest = hashlib.file_digest(csv_file, "sha256").hexdigest()
+
+    cache_path = os.path.join(LMEVAL_TASKS_CACHE_DIR, f"new_task_list-{csv_digest}-pandas{pd.__version__}.pkl")
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError, pickle.UnpicklingError, EOFError:
+        pass
+
+    lmeval_tasks = pd.read_csv(filepath_or_buffer=LMEVAL_TASKS_CSV_PATH, usecols=list(LMEVAL_TASKS_COLUMNS))
+    os.makedirs(LMEVAL_TASKS_CACHE_DIR, exist_ok=True)
+    # Atomic replace, concurrent xdist workers may build the cache at the same time
+    with tempfile.NamedTemporaryFile(dir=LMEVAL_TASKS_CACHE_DIR, delete=False) as tmp:
+        pickle.dump(lmeval_tasks, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp.name, cache_path)
+
+    return lmeval_tasks
+
+
 def get_lmeval_tasks(min_downloads: float, max_downloads: float | None = None) -> list[str]:
     """
     Gets the list of supported LM-Eval tasks that have above a certain number of minimum downloads on HuggingFace.
@@ -61,10 +109,15 @@ def get_lmeval_tasks(min_downloads: float, max_downloads: float | None = None) -
     Returns:
         List of LM-Eval task names
     """
+    return list(_get_lmeval_tasks(min_downloads=min_downloads, max_downloads=max_downloads))
+
+
+@cache
+def _get_lmeval_tasks(min_downloads: float, max_downloads: float | None = None) -> tuple[str, ...]:
     if min_downloads <= 0:
         raise ValueError("Minimum downloads must be greater than 0")
 
-    lmeval_tasks = pd.read_csv(filepath_or_buffer="tests/ai_safety/lm_eval/data/new_task_list.csv")
+    lmeval_tasks = get_lmeval_task_catalog()
 
     if isinstance(min_downloads, float):
         if not 0 <= min_downloads <= 1:
@@ -97,7 +150,34 @@ def get_lmeval_tasks(min_downloads: float, max_downloads: float | None = None) -
 
     LOGGER.info(f"Number of unique LMEval tasks with more than {min_downloads} downloads: {len(unique_tasks)}")
 
-    return unique_tasks
+    return tuple(unique_tasks)
+
+
+@dataclass(frozen=True)
+class LMEvalTaskSelection:
+    """
+    Lazily resolved selection of catalog tasks by HuggingFace downloads, see get_lmeval_tasks.
+
+    Used as ``taskNames`` in test parametrization, so the catalog is only loaded when a test using it is set up.
+    """
+
+    min_downloads: float
+    max_downloads: float | None = None
+    exclude: LMEvalTaskSelection | None = None
+
+    def resolve(self) -> list[str]:
+        tasks = get_lmeval_tasks(min_downloads=self.min_downloads, max_downloads=self.max_downloads)
+        if self.exclude:
+            excluded_tasks = set(self.exclude.resolve())
+            tasks = [task for task in tasks if task not in excluded_tasks]
+        return tasks
+
+
+def resolve_lmeval_task_list(task_list: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the LMEvalJob task_list with a LMEvalTaskSelection ``taskNames`` resolved to task names."""
+    if task_list and isinstance(task_names := task_list.get("taskNames"), LMEvalTaskSelection):
+        return {**task_list, "taskNames": task_names.resolve()}
+    return task_list
 
 
 def validate_lmeval_job_pod_and_logs(lmevaljob_pod: Pod) -> None:
@@ -121,6 +201,50 @@ def validate_lmeval_job_pod_and_logs(lmevaljob_pod: Pod) -> None:
         raise PodLogMissMatchError("LMEval job pod failed.")
 
 
+def shard_lmeval_tasks(tasks: list[str], shards: int) -> list[list[str]]:
+    """
+    Split tasks into shards of even task counts, keeping the task list order within each shard.
+
+    Args:
+        tasks: Task names.
+        shards: Maximum number of shards.
+
+    Returns:
+        list[list[str]]: non-empty shards of task names.
+    """
+    shards_count = max(1, min(shards, len(tasks)))
+    sharded_tasks = [tasks[index::shards_count] for index in range(shards_count)]
+    for index, shard in enumerate(sharded_tasks):
+        LOGGER.info(f"LM-Eval shard {index}: {len(shard)} tasks")
+
+    return [shard for shard in sharded_tasks if shard]
+
+
+def validate_lmeval_job_pods_and_logs(lmevaljob_pods: list[Pod]) -> None:
+    """Validate all LMEval job shard pods concurrently, see validate_lmeval_job_pod_and_logs.
+
+    Args:
+        lmevaljob_pods: The LMEvalJob pods.
+
+    Raises:
+        UnexpectedFailureError: If any of the pods failed, listing all failed pods.
+    """
+
+    def _validate(lmevaljob_pod: Pod) -> Exception | None:
+        try:
+            validate_lmeval_job_pod_and_logs(lmevaljob_pod=lmevaljob_pod)
+        except (TimeoutExpiredError, UnexpectedFailureError, PodLogMissMatchError) as ex:
+            LOGGER.error(f"LMEval job pod {lmevaljob_pod.name} failed: {ex}")
+            return ex
+        return None
+
+    with ThreadPoolExecutor(max_workers=len(lmevaljob_pods)) as executor:
+        results = list(zip(lmevaljob_pods, executor.map(_validate, lmevaljob_pods)))
+
+    if failed_pods := {pod.name: repr(ex) for pod, ex in results if ex}:
+        raise UnexpectedFailureError(f"{len(failed_pods)}/{len(lmevaljob_pods)} LMEval job pods failed: {failed_pods}")
+
+
 def validate_ca_bundle_injected(pod: Pod, job_name: str) -> None:
     """Assert the pod has CA bundle volume, mount, and REQUESTS_CA_BUNDLE env var.
 
@@ -56,7 +56,7 @@ from utilities.constants import (
     Protocols,
     RuntimeTemplates,
 )
-from utilities.data_science_cluster_utils import update_components_in_dsc
+from utilities.data_science_cluster_utils import DscComponentStateManager, update_components_in_dsc
 from utilities.exceptions import ClusterLoginError
 from utilities.image_constants import SharedImages
 from utilities.infra import (
@@ -580,6 +580,24 @@ def dsc_resource(admin_client: DynamicClient) -> DataScienceCluster:
     return DataScienceCluster(client=admin_client, name=py_config["dsc_name"], ensure_exists=True)
 
 
+@pytest.fixture(scope="session")
+def dsc_component_state_manager(
+    pytestconfig: pytest.Config,
+    dsc_resource: DataScienceCluster,
+) -> Generator[DscComponentStateManager, Any, Any]:
+    dsc_component_state_manager = DscComponentStateManager(
+        dsc=dsc_resource,
+        # Set when the DSC state planner ordered the tests
+        keep_states=getattr(pytestconfig.option, "dsc_state_plan", None) is not None,
+    )
+    if dsc_component_state_manager.keep_states:
+        # Released between tests by `pytest_runtest_teardown`
+        pytestconfig.option.dsc_component_state_manager = dsc_component_state_manager
+
+    yield dsc_component_state_manager
+    dsc_component_state_manager.restore()
+
+
 @pytest.fixture(scope="package")
 def enabled_modelmesh_in_dsc(
     dsc_resource: DataScienceCluster,
@@ -77,12 +77,12 @@ def guardrails_orchestrator(
             gorch_kwargs["enable_built_in_detectors"] = enable_built_in_detectors
 
         if request.param.get("otel_exporter_config"):
-            metrics_endpoint = request.getfixturevalue(argname="otelcol_metrics_endpoint")
-            traces_endpoint = request.getfixturevalue(argname="tempo_traces_endpoint")
+            # Traces go through the collector, which tags them with the orchestrator pod namespace
+            otelcol_endpoint = request.getfixturevalue(argname="otelcol_endpoint")
             gorch_kwargs["otel_exporter"] = {
                 "protocol": "grpc",
-                "metricsEndpoint": metrics_endpoint,
-                "tracesEndpoint": traces_endpoint,
+                "metricsEndpoint": otelcol_endpoint,
+                "tracesEndpoint": otelcol_endpoint,
                 "otlpExport": "metrics,traces",
             }
         with GuardrailsOrchestrator(**gorch_kwargs, teardown=teardown_resources) as gorch:
@@ -57,6 +57,7 @@ def mlserver_model_pvc(
 @pytest.fixture(scope="class")
 def mlserver_pvc_downloaded_model_data(
     request: FixtureRequest,
+    pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     model_namespace: Namespace,
     mlserver_model_pvc: PersistentVolumeClaim,
@@ -75,6 +76,7 @@ def mlserver_pvc_downloaded_model_data(
     Args:
         request: Pytest request with parameters:
             - model-dir: Path in S3 bucket (e.g., "sklearn")
+        pytestconfig: Pytest config, `--model-pvc-cache` reuses the model data of previous classes and runs
         admin_client: Kubernetes admin client
         model_namespace: Namespace for the download job
         mlserver_model_pvc: PVC to download into
@@ -99,6 +101,7 @@ def mlserver_pvc_downloaded_model_data(
         model_path=request.param["model-dir"],
         use_sub_path=True,
         restricted_scc_init=True,
+        use_cache=pytestconfig.option.model_pvc_cache,
     )
 
 
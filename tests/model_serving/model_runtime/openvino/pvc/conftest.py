@@ -43,6 +43,7 @@ def openvino_model_pvc(
 @pytest.fixture(scope="class")
 def openvino_pvc_downloaded_model_data(
     request: FixtureRequest,
+    pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     model_namespace: Namespace,
     openvino_model_pvc: PersistentVolumeClaim,
@@ -65,6 +66,7 @@ def openvino_pvc_downloaded_model_data(
         model_path=request.param["model-dir"],
         use_sub_path=True,
         restricted_scc_init=True,
+        use_cache=pytestconfig.option.model_pvc_cache,
     )
 
 
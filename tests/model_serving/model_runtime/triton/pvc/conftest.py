@@ -141,6 +141,7 @@ def triton_model_pvc(
 @pytest.fixture(scope="class")
 def triton_pvc_downloaded_model_data(
     request: FixtureRequest,
+    pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     model_namespace: Namespace,
     triton_model_pvc: PersistentVolumeClaim,
@@ -168,6 +169,7 @@ def triton_pvc_downloaded_model_data(
         model_path=request.param["model-dir"],
         use_sub_path=True,
         restricted_scc_init=True,
+        use_cache=pytestconfig.option.model_pvc_cache,
     )
 
 
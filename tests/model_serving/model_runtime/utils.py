@@ -1,14 +1,18 @@
 import os
 import re
 import subprocess
-from collections.abc import Iterable
+import threading
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from typing import Any
 
 import portforward
+import requests
 import structlog
 from ocp_resources.inference_service import InferenceService
 from ocp_resources.pod import Pod
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 from tests.model_serving.model_runtime.vllm.modelcar.constant import (
     AUDIO_FILE_LOCAL_PATH,
@@ -21,7 +25,7 @@ from tests.model_serving.model_runtime.vllm.modelcar.constant import (
 from utilities.constants import Ports
 from utilities.exceptions import NotSupportedError
 from utilities.inference_utils import get_exposed_isvc_url
-from utilities.plugins.constant import OpenAIEnpoints
+from utilities.plugins.constant import OpenAIEnpoints, RestHeader
 from utilities.plugins.openai_plugin import OpenAIClient
 
 LOGGER = structlog.get_logger(name=__name__)
@@ -35,6 +39,12 @@ ERROR_INDICATORS = re.compile(
     re.IGNORECASE,
 )
 VALID_FINISH_REASONS = ["stop", "length", "eos_token", "stop_sequence"]
+# Attempts per inference query; OpenAIClient requests also retry each HTTP call on their own
+INFERENCE_QUERY_MAX_ATTEMPTS = 3
+
+query_retry = retry(
+    stop=stop_after_attempt(INFERENCE_QUERY_MAX_ATTEMPTS), wait=wait_exponential(min=1, max=6), reraise=True
+)
 
 
 class InferenceValidationError(Exception):
@@ -282,7 +292,154 @@ def validate_embedding_inference_output(model_info: Any, embedding_responses: It
     LOGGER.info(f"All {len(embedding_responses)} embedding responses passed validation")
 
 
-@retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=6))
+class InferenceHost:
+    """Inference host of a query set: an external URL, or a port-forward tunnel to a pod.
+
+    The tunnel is reopened when a query fails with a connection error, so the remaining queries resume on a new one.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        pod_name: str | None = None,
+        namespace: str | None = None,
+        port: int | None = None,
+    ) -> None:
+        self.pod_name = pod_name
+        self.namespace = namespace
+        self.port = port
+        self.url = url or f"http://localhost:{port}"
+        # Incremented on each reopen, so concurrent queries failing on the same tunnel reopen it only once
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._forward = ExitStack()
+
+    @property
+    def is_tunnel(self) -> bool:
+        return self.pod_name is not None
+
+    def open(self) -> None:
+        if not self.is_tunnel:
+            return
+
+        self._forward.enter_context(
+            portforward.forward(
+                pod_or_service=self.pod_name,
+                namespace=self.namespace,
+                from_port=self.port,
+                to_port=self.port,
+            )
+        )
+
+    def close(self) -> None:
+        self._forward.close()
+
+    def reopen(self, generation: int) -> None:
+        """Reopen the tunnel, unless it was already reopened since *generation*."""
+        with self._lock:
+            if not self.is_tunnel or generation != self.generation:
+                return
+
+            LOGGER.warning("Port-forward tunnel to pod %s broke, reopening it", self.pod_name)
+            self.close()
+            self.open()
+            self.generation += 1
+
+
+def is_connection_error(ex: BaseException) -> bool:
+    """Whether *ex*, or the last attempt of a tenacity RetryError, is a connection error."""
+    if isinstance(ex, RetryError) and ex.last_attempt.failed:
+        ex = ex.last_attempt.exception()
+
+    return isinstance(ex, requests.exceptions.ConnectionError)
+
+
+def run_inference_queries(
+    request_func: Callable[[Any], Any],
+    queries: Iterable[Any],
+    max_workers: int = 1,
+    host: InferenceHost | None = None,
+) -> list[Any]:
+    """Run a set of inference queries, retrying only the failed query with backoff.
+
+    Completed results are kept when another query fails, instead of replaying the whole set. On connection errors
+    the *host* tunnel is reopened before the query is retried.
+
+    Args:
+        request_func: Sends one query and returns its response.
+        queries: Independent queries.
+        max_workers: Number of queries dispatched concurrently.
+        host: Host the queries are sent to.
+
+    Returns:
+        Responses, in queries order.
+    """
+
+    def _request(query: Any) -> Any:
+        generation = host.generation if host else 0
+        try:
+            return request_func(query)
+        except Exception as ex:
+            if host and is_connection_error(ex=ex):
+                host.reopen(generation=generation)
+            raise
+
+    run_query = query_retry(_request)
+    if max_workers <= 1:
+        return [run_query(query) for query in queries]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_query, queries))
+
+
+def get_models_info(host: InferenceHost) -> Any:
+    """Return the models served on *host*, retried like the inference queries.
+
+    OpenAIClient.get_request_http returns None on request errors instead of raising, so it cannot be retried and
+    would not reopen a broken tunnel.
+    """
+
+    def _get_models_info(endpoint: str) -> Any:
+        response = requests.get(url=f"{host.url}{endpoint}", headers=RestHeader.HEADERS, verify=False, timeout=60)
+        response.raise_for_status()
+        data = response.json().get("data", [])
+        return OpenAIClient._remove_keys(data=data, keys_to_remove=["created", "id"]) if data else data
+
+    return run_inference_queries(request_func=_get_models_info, queries=[OpenAIEnpoints.MODELS_INFO], host=host)[0]
+
+
+@contextmanager
+def inference_host(
+    url: str | None = None,
+    pod_name: str | None = None,
+    namespace: str | None = None,
+    port: int | None = Ports.REST_PORT,
+) -> Generator[InferenceHost, Any, Any]:
+    """Yield the inference host, keeping one port-forward tunnel open for a whole query set.
+
+    Args:
+        url: External URL; used as is when provided.
+        pod_name: Pod to port-forward to when url is not provided.
+        namespace: Pod namespace.
+        port: Pod port, forwarded to the same local port.
+    """
+    if url is not None:
+        LOGGER.info("Using provided URL for inference: %s", url)
+        yield InferenceHost(url=url)
+        return
+
+    LOGGER.info("Using port forwarding for inference on pod: %s", pod_name)
+    if pod_name is None or namespace is None or port is None:
+        raise ValueError("pod_name, namespace, and port are required when url is not provided")
+
+    host = InferenceHost(pod_name=pod_name, namespace=namespace, port=port)
+    host.open()
+    try:
+        yield host
+    finally:
+        host.close()
+
+
 def run_raw_inference(
     isvc: InferenceService,
     endpoint: str,
@@ -290,37 +447,20 @@ def run_raw_inference(
     url: str | None = None,
     pod_name: str | None = None,
     port: int | None = Ports.REST_PORT,
+    max_workers: int = 1,
 ) -> tuple[Any, list[Any]]:
-    if url is not None:
-        LOGGER.info("Using external route for inference: %s", url)
-        if endpoint == "openai":
-            return fetch_openai_response(
-                url=url,
-                model_name=isvc.instance.metadata.name,
-                completion_query=completion_query,
-            )
+    if endpoint != "openai":
         raise NotSupportedError(f"{endpoint} endpoint")
 
-    LOGGER.info("Using port forwarding for inference on pod: %s", pod_name)
-    if pod_name is None or port is None:
-        raise ValueError("pod_name and port are required when url is not provided")
-
-    with portforward.forward(
-        pod_or_service=pod_name,
-        namespace=isvc.namespace,
-        from_port=port,
-        to_port=port,
-    ):
-        if endpoint == "openai":
-            return fetch_openai_response(
-                url=f"http://localhost:{port}",
-                model_name=isvc.instance.metadata.name,
-                completion_query=completion_query,
-            )
-        raise NotSupportedError(f"{endpoint} endpoint")
+    with inference_host(url=url, pod_name=pod_name, namespace=isvc.namespace, port=port) as host:
+        return fetch_openai_response(
+            host=host,
+            model_name=isvc.instance.metadata.name,
+            completion_query=completion_query,
+            max_workers=max_workers,
+        )
 
 
-@retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=6))
 def run_embedding_inference(
     endpoint: str,
     model_name: str,
@@ -329,46 +469,24 @@ def run_embedding_inference(
     isvc: InferenceService | None = None,
     port: int | None = Ports.REST_PORT,
     embedding_query: list[dict[str, str]] = EMBEDDING_QUERY,
+    max_workers: int = 1,
 ) -> tuple[Any, list[Any]]:
     LOGGER.info("Running embedding inference for model: %s on endpoint: %s", model_name, endpoint)
-    if url is not None:
-        LOGGER.info("Using provided URL for inference: %s", url)
-        inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
-        embedding_responses = []
-        for query in embedding_query:
-            embedding_response = inference_client.request_http(
-                endpoint=OpenAIEnpoints.EMBEDDINGS,
-                query=query,
-            )
-            embedding_responses.append(embedding_response)
-        model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
+    if endpoint != "openai":
+        raise NotSupportedError(f"{endpoint} endpoint for embedding inference")
+
+    with inference_host(url=url, pod_name=pod_name, namespace=isvc.namespace if isvc else None, port=port) as host:
+        inference_client = OpenAIClient(host=host.url, model_name=model_name, streaming=True)
+        embedding_responses = run_inference_queries(
+            request_func=lambda query: inference_client.request_http(endpoint=OpenAIEnpoints.EMBEDDINGS, query=query),
+            queries=embedding_query,
+            max_workers=max_workers,
+            host=host,
+        )
+        model_info = get_models_info(host=host)
         return model_info, embedding_responses
-    else:
-        LOGGER.info("Using port forwarding for inference on pod: %s", pod_name)
-        if pod_name is None or isvc is None or port is None:
-            raise ValueError("pod_name, isvc, and port are required when url is not provided")
-
-        with portforward.forward(
-            pod_or_service=pod_name,
-            namespace=isvc.namespace,
-            from_port=port,
-            to_port=port,
-        ):
-            if endpoint == "openai":
-                embedding_responses = []
-                inference_client = OpenAIClient(host=f"http://localhost:{port}", model_name=model_name, streaming=True)
-                for query in embedding_query:
-                    embedding_response = inference_client.request_http(endpoint=OpenAIEnpoints.EMBEDDINGS, query=query)
-                    embedding_responses.append(embedding_response)
-                model_info = OpenAIClient.get_request_http(
-                    host=f"http://localhost:{port}", endpoint=OpenAIEnpoints.MODELS_INFO
-                )
-                return model_info, embedding_responses
-            else:
-                raise NotSupportedError(f"{endpoint} endpoint for embedding inference")
 
 
-@retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=6))
 def run_audio_inference(
     endpoint: str,
     model_name: str,
@@ -380,44 +498,22 @@ def run_audio_inference(
     port: int | None = Ports.REST_PORT,
 ) -> tuple[Any, list[Any]]:
     LOGGER.info("Running audio inference for model: %s on endpoint: %s", model_name, endpoint)
+    if endpoint != "openai":
+        raise NotSupportedError(f"{endpoint} endpoint for audio inference")
+
     download_audio_file(audio_file_url=audio_file_url, destination_path=audio_file_path)
 
-    if url is not None:
-        LOGGER.info("Using provided URL for inference: %s", url)
-        inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
-        completion_responses = []
-        completion_response = inference_client.request_audio(
-            endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION,
-            audio_file_path=audio_file_path,
-            model_name=model_name,
+    with inference_host(url=url, pod_name=pod_name, namespace=isvc.namespace if isvc else None, port=port) as host:
+        inference_client = OpenAIClient(host=host.url, model_name=model_name, streaming=True)
+        completion_responses = run_inference_queries(
+            request_func=lambda audio_path: inference_client.request_audio(
+                endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION, audio_file_path=audio_path, model_name=model_name
+            ),
+            queries=[audio_file_path],
+            host=host,
         )
-        completion_responses.append(completion_response)
-        model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
+        model_info = get_models_info(host=host)
         return model_info, completion_responses
-    else:
-        LOGGER.info("Using port forwarding for inference on pod: %s", pod_name)
-        if pod_name is None or isvc is None or port is None:
-            raise ValueError("pod_name, isvc, and port are required when url is not provided")
-
-        with portforward.forward(
-            pod_or_service=pod_name,
-            namespace=isvc.namespace,
-            from_port=port,
-            to_port=port,
-        ):
-            if endpoint == "openai":
-                completion_responses = []
-                inference_client = OpenAIClient(host=f"http://localhost:{port}", model_name=model_name, streaming=True)
-                completion_response = inference_client.request_audio(
-                    endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION, audio_file_path=audio_file_path, model_name=model_name
-                )
-                completion_responses.append(completion_response)
-                model_info = OpenAIClient.get_request_http(
-                    host=f"http://localhost:{port}", endpoint=OpenAIEnpoints.MODELS_INFO
-                )
-                return model_info, completion_responses
-            else:
-                raise NotSupportedError(f"{endpoint} endpoint for audio inference")
 
 
 def validate_raw_openai_inference_request(
@@ -530,21 +626,23 @@ def pod_is_ready(pod: Pod) -> bool:
 
 
 def fetch_openai_response(
-    url: str,
+    host: InferenceHost,
     model_name: str,
     completion_query: list[dict[str, str]] | None = None,
+    max_workers: int = 1,
 ) -> tuple[Any, list[Any]]:
-    model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
+    model_info = get_models_info(host=host)
     model_name = model_info[0]["id"] if model_info else model_name
     if completion_query is None:
         completion_query = COMPLETION_QUERY
-    completion_responses = []
-    inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
-    if completion_query:
-        for query in completion_query:
-            completion_response = inference_client.request_http(
-                endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
-            )
-            completion_responses.append(completion_response)
+    inference_client = OpenAIClient(host=host.url, model_name=model_name, streaming=True)
+    completion_responses = run_inference_queries(
+        request_func=lambda query: inference_client.request_http(
+            endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
+        ),
+        queries=completion_query,
+        max_workers=max_workers,
+        host=host,
+    )
 
     return model_info, completion_responses
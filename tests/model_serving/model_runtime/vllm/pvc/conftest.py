@@ -47,6 +47,7 @@ def vllm_model_pvc(
 @pytest.fixture(scope="class")
 def pvc_downloaded_model_data(
     request: FixtureRequest,
+    pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     model_namespace: Namespace,
     vllm_model_pvc: PersistentVolumeClaim,
@@ -76,6 +77,7 @@ def pvc_downloaded_model_data(
         use_sub_path=True,
         restricted_scc_init=True,
         node_selector=node_selector,
+        use_cache=pytestconfig.option.model_pvc_cache,
     )
 
 
@@ -24,6 +24,7 @@ LOGGER = structlog.get_logger(name=__name__)
 @pytest.fixture(scope="class")
 def ci_bucket_downloaded_model_data(
     request: FixtureRequest,
+    pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     unprivileged_model_namespace: Namespace,
     model_pvc: PersistentVolumeClaim,
@@ -45,6 +46,7 @@ def ci_bucket_downloaded_model_data(
         model_path=request.param["model-dir"],
         use_sub_path=True,
         restricted_scc_init=True,
+        use_cache=pytestconfig.option.model_pvc_cache,
     )
 
 
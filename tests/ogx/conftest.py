@@ -38,7 +38,7 @@ from tests.ogx.utils import (
 )
 from utilities import infra
 from utilities.constants import Annotations, DscComponents
-from utilities.data_science_cluster_utils import update_components_in_dsc
+from utilities.data_science_cluster_utils import DscComponentStateManager
 from utilities.general import generate_random_name
 from utilities.resources.ogx_server import OgxServer
 
@@ -65,13 +65,11 @@ def distribution_name(pytestconfig: pytest.Config) -> str:
 
 
 @pytest.fixture(scope="class")
-def enabled_ogx_operator(dsc_resource: DataScienceCluster) -> Generator[DataScienceCluster, Any, Any]:
-    with update_components_in_dsc(
-        dsc=dsc_resource,
-        components={
-            DscComponents.OGX: DscComponents.ManagementState.MANAGED,
-        },
-        wait_for_components_state=True,
+def enabled_ogx_operator(
+    dsc_component_state_manager: DscComponentStateManager,
+) -> Generator[DataScienceCluster, Any, Any]:
+    with dsc_component_state_manager.update_components(
+        components={DscComponents.OGX: DscComponents.ManagementState.MANAGED}
     ) as dsc:
         yield dsc
 
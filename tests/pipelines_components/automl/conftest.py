@@ -2,6 +2,7 @@ import os
 import shlex
 import uuid
 from collections.abc import Generator
+from contextlib import ExitStack
 from typing import Any
 
 import pytest
@@ -19,7 +20,6 @@ from tests.pipelines_components.constants import (
     AUTOML_TASK_CONFIGS,
     AUTOML_TIMESERIES_CONFIG,
     AUTOML_TIMESERIES_TRAIN_DATA_FILE_KEY,
-    AUTOML_TRAIN_DATA_FILE_KEY,
     DSPA_NAME,
     DSPA_READY_BUFFER_SECONDS,
     DSPA_S3_BUCKET,
@@ -113,56 +113,79 @@ def automl_pipeline_id(
         )
 
 
-@pytest.fixture(scope="function")
-def automl_run_id(
+@pytest.fixture(scope="class")
+def automl_runs(
     dspa_api_url: str,
     dspa_auth_headers: dict[str, str],
     dspa_ca_bundle_file: str,
     automl_pipeline_id: str,
     automl_managed_pipeline: dict[str, str] | None,
     pipelines_namespace: Namespace,
-    task_type: str,
-) -> Generator[str, Any, Any]:
-    """Create a pipeline run and yield the run ID. Deletes the run on teardown."""
-    task_config = AUTOML_TASK_CONFIGS[task_type]
+    automl_train_data: dict[str, str],
+) -> Generator[dict[str, str], Any, Any]:
+    """Submit the pipeline runs of all selected AutoML tasks up front and yield task type to run ID.
+
+    The runs execute concurrently on the cluster; each parametrized test only awaits its own run.
+    Deletes the runs on teardown.
+    """
+    skip_teardown = os.getenv("SKIP_TEARDOWN", "").lower() in ("true", "1", "yes")
+    run_ids: dict[str, str] = {}
+    with ExitStack() as stack:
+        for task_type, train_data_file_key in automl_train_data.items():
+            task_config = AUTOML_TASK_CONFIGS[task_type]
+
+            parameters: dict[str, Any] = {
+                "train_data_secret_name": DSPA_S3_SECRET,
+                "train_data_bucket_name": DSPA_S3_BUCKET,
+                "train_data_file_key": train_data_file_key,
+                "label_column": task_config["label_column"],
+                "task_type": task_config["task_type"],
+                "top_n": task_config["top_n"],
+            }
 
-    parameters: dict[str, Any] = {
-        "train_data_secret_name": DSPA_S3_SECRET,
-        "train_data_bucket_name": DSPA_S3_BUCKET,
-        "train_data_file_key": AUTOML_TRAIN_DATA_FILE_KEY,
-        "label_column": task_config["label_column"],
-        "task_type": task_config["task_type"],
-        "top_n": task_config["top_n"],
-    }
+            if automl_managed_pipeline is not None:
+                run_ids[task_type] = create_pipeline_run_managed(
+                    api_url=dspa_api_url,
+                    headers=dspa_auth_headers,
+                    pipeline_id=automl_managed_pipeline["pipeline_id"],
+                    pipeline_version_id=automl_managed_pipeline["pipeline_version_id"],
+                    run_name=f"automl-smoke-{task_type}-{pipelines_namespace.name}",
+                    parameters=parameters,
+                    ca_bundle=dspa_ca_bundle_file,
+                )
+            else:
+                run_ids[task_type] = create_pipeline_run(
+                    api_url=dspa_api_url,
+                    headers=dspa_auth_headers,
+                    pipeline_id=automl_pipeline_id,
+                    run_name=f"automl-smoke-{task_type}-{pipelines_namespace.name}",
+                    parameters=parameters,
+                    ca_bundle=dspa_ca_bundle_file,
+                )
+            LOGGER.info(f"Submitted AutoML {task_type} pipeline run {run_ids[task_type]}")
+
+            # Registered as soon as submitted, so a later submission failure still deletes the earlier runs
+            if not skip_teardown:
+                stack.callback(
+                    delete_pipeline_run,
+                    api_url=dspa_api_url,
+                    headers=dspa_auth_headers,
+                    run_id=run_ids[task_type],
+                    ca_bundle=dspa_ca_bundle_file,
+                )
+
+        yield run_ids
 
-    if automl_managed_pipeline is not None:
-        run_id = create_pipeline_run_managed(
-            api_url=dspa_api_url,
-            headers=dspa_auth_headers,
-            pipeline_id=automl_managed_pipeline["pipeline_id"],
-            pipeline_version_id=automl_managed_pipeline["pipeline_version_id"],
-            run_name=f"automl-smoke-{pipelines_namespace.name}",
-            parameters=parameters,
-            ca_bundle=dspa_ca_bundle_file,
-        )
-    else:
-        run_id = create_pipeline_run(
-            api_url=dspa_api_url,
-            headers=dspa_auth_headers,
-            pipeline_id=automl_pipeline_id,
-            run_name=f"automl-smoke-{pipelines_namespace.name}",
-            parameters=parameters,
-            ca_bundle=dspa_ca_bundle_file,
-        )
 
-    yield run_id
-    if os.getenv("SKIP_TEARDOWN", "").lower() not in ("true", "1", "yes"):
-        delete_pipeline_run(
-            api_url=dspa_api_url,
-            headers=dspa_auth_headers,
-            run_id=run_id,
-            ca_bundle=dspa_ca_bundle_file,
-        )
+@pytest.fixture(scope="function")
+def automl_run_id(automl_runs: dict[str, str], task_type: str) -> str:
+    """Run ID of the AutoML pipeline run submitted for the test task type."""
+    env_var = f"AUTOML_{task_type.upper()}_S3_TRAIN_DATA_KEY"
+    assert task_type in automl_runs, (
+        f"Environment variable '{env_var}' is not set. "
+        f"Set it in .env or shell to provide the S3 key for {task_type} training data."
+    )
+    return automl_runs[task_type]
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,4 @@
 import pytest
-from kubernetes.dynamic import DynamicClient
 from ocp_resources.namespace import Namespace
 from ocp_resources.secret import Secret
 
@@ -21,15 +20,14 @@ class TestAutoMLSmoke:
     def test_automl_pipeline_completes(
         self,
         task_type: str,
-        admin_client: DynamicClient,
         pipelines_namespace: Namespace,
-        dspa_s3_credentials: Secret,
-        automl_train_data: str,
         automl_run_id: str,
     ) -> None:
-        """Given a DSPA with training data in S3, when an AutoML pipeline run is submitted, then it succeeds."""
+        """Given a DSPA with training data in S3, when an AutoML pipeline run is submitted, then it succeeds.
+
+        The runs of all task types are submitted together by the class-scoped ``automl_runs`` fixture.
+        """
         phase = wait_for_pipeline_run(
-            admin_client=admin_client,
             namespace=pipelines_namespace.name,
             run_id=automl_run_id,
             timeout=AUTOML_PIPELINE_TIMEOUT,
@@ -37,7 +35,6 @@ class TestAutoMLSmoke:
 
         if phase != WORKFLOW_SUCCEEDED:
             collect_pipeline_pod_logs(
-                admin_client=admin_client,
                 namespace=pipelines_namespace.name,
                 run_id=automl_run_id,
             )
@@ -49,7 +46,6 @@ class TestAutoMLSmoke:
 
     def test_timeseries_pipeline_completes(
         self,
-        admin_client: DynamicClient,
         pipelines_namespace: Namespace,
         dspa_s3_credentials: Secret,
         timeseries_train_data: str,
@@ -57,7 +53,6 @@ class TestAutoMLSmoke:
     ) -> None:
         """Given a DSPA with timeseries data in S3, when a timeseries pipeline run is submitted, then it succeeds."""
         phase = wait_for_pipeline_run(
-            admin_client=admin_client,
             namespace=pipelines_namespace.name,
             run_id=timeseries_run_id,
             timeout=AUTOML_PIPELINE_TIMEOUT,
@@ -65,7 +60,6 @@ class TestAutoMLSmoke:
 
         if phase != WORKFLOW_SUCCEEDED:
             collect_pipeline_pod_logs(
-                admin_client=admin_client,
                 namespace=pipelines_namespace.name,
                 run_id=timeseries_run_id,
             )
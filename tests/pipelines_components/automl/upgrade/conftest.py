@@ -64,6 +64,7 @@ from tests.pipelines_components.utils import (
     upload_pipeline,
     use_managed_pipelines,
     wait_for_managed_pipeline,
+    workflow_tracker,
 )
 from utilities.certificates_utils import create_ca_bundle_file
 from utilities.constants import (
@@ -169,15 +170,19 @@ def upgrade_namespace(
                 f"Namespace {UPGRADE_NAMESPACE} already exists. "
                 "This indicates a previous test run did not clean up properly."
             )
-        with create_ns(
-            admin_client=admin_client,
-            name=UPGRADE_NAMESPACE,
-            teardown=should_cleanup,
-        ) as ns:
+        with (
+            create_ns(
+                admin_client=admin_client,
+                name=UPGRADE_NAMESPACE,
+                teardown=should_cleanup,
+            ) as ns,
+            workflow_tracker(client=admin_client, namespace=ns.name),
+        ):
             yield ns
     else:
         ns = Namespace(client=admin_client, name=UPGRADE_NAMESPACE)
-        yield ns
+        with workflow_tracker(client=admin_client, namespace=ns.name):
+            yield ns
         if should_cleanup:
             ns.clean_up()
 
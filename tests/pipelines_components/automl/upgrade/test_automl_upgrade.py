@@ -9,7 +9,6 @@ RHOAI upgrade.
 """
 
 import pytest
-from kubernetes.dynamic import DynamicClient
 from ocp_resources.inference_service import InferenceService
 from ocp_resources.namespace import Namespace
 
@@ -51,13 +50,11 @@ class TestPreUpgradeAutoML:
     @pytest.mark.pre_upgrade
     def test_automl_experiment_completes(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         upgrade_run_id: str,
     ) -> None:
         """Given a DSPA with training data, when a regression pipeline run is submitted, then it succeeds."""
         phase = wait_for_pipeline_run(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=upgrade_run_id,
             timeout=AUTOML_PIPELINE_TIMEOUT,
@@ -65,7 +62,6 @@ class TestPreUpgradeAutoML:
 
         if phase != WORKFLOW_SUCCEEDED:
             collect_pipeline_pod_logs(
-                admin_client=admin_client,
                 namespace=upgrade_namespace.name,
                 run_id=upgrade_run_id,
             )
@@ -79,13 +75,11 @@ class TestPreUpgradeAutoML:
     @pytest.mark.pre_upgrade
     def test_automl_experiment_has_artifacts(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         upgrade_run_id: str,
     ) -> None:
         """Verify the completed pipeline has workflow nodes with execution records."""
         workflow_nodes = get_workflow_completed_nodes(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=upgrade_run_id,
         )
@@ -193,7 +187,6 @@ class TestPostUpgradeAutoML:
     @pytest.mark.dependency(depends=["automl_run_accessible"])
     def test_automl_workflow_survived(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         automl_upgrade_baseline: dict,
     ) -> None:
@@ -201,7 +194,6 @@ class TestPostUpgradeAutoML:
         run_id = automl_upgrade_baseline["run_id"]
 
         phase = get_workflow_phase(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=run_id,
         )
@@ -214,7 +206,6 @@ class TestPostUpgradeAutoML:
     @pytest.mark.dependency(depends=["automl_run_accessible"])
     def test_automl_artifacts_survived(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         automl_upgrade_baseline: dict,
     ) -> None:
@@ -222,7 +213,6 @@ class TestPostUpgradeAutoML:
         run_id = automl_upgrade_baseline["run_id"]
 
         workflow_nodes = get_workflow_completed_nodes(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=run_id,
         )
@@ -279,13 +269,11 @@ class TestPreUpgradeAutoMLTimeseries:
     @pytest.mark.pre_upgrade
     def test_ts_experiment_completes(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         upgrade_ts_run_id: str,
     ) -> None:
         """Given a DSPA with timeseries data, when a timeseries pipeline run is submitted, then it succeeds."""
         phase = wait_for_pipeline_run(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=upgrade_ts_run_id,
             timeout=AUTOML_PIPELINE_TIMEOUT,
@@ -293,7 +281,6 @@ class TestPreUpgradeAutoMLTimeseries:
 
         if phase != WORKFLOW_SUCCEEDED:
             collect_pipeline_pod_logs(
-                admin_client=admin_client,
                 namespace=upgrade_namespace.name,
                 run_id=upgrade_ts_run_id,
             )
@@ -307,13 +294,11 @@ class TestPreUpgradeAutoMLTimeseries:
     @pytest.mark.pre_upgrade
     def test_ts_experiment_has_artifacts(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         upgrade_ts_run_id: str,
     ) -> None:
         """Verify the completed timeseries pipeline has workflow nodes with execution records."""
         workflow_nodes = get_workflow_completed_nodes(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=upgrade_ts_run_id,
         )
@@ -411,7 +396,6 @@ class TestPostUpgradeAutoMLTimeseries:
     @pytest.mark.dependency(depends=["ts_run_accessible"])
     def test_ts_workflow_survived(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         ts_upgrade_baseline: dict,
     ) -> None:
@@ -419,7 +403,6 @@ class TestPostUpgradeAutoMLTimeseries:
         run_id = ts_upgrade_baseline["run_id"]
 
         phase = get_workflow_phase(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=run_id,
         )
@@ -433,7 +416,6 @@ class TestPostUpgradeAutoMLTimeseries:
     @pytest.mark.dependency(depends=["ts_run_accessible"])
     def test_ts_artifacts_survived(
         self,
-        admin_client: DynamicClient,
         upgrade_namespace: Namespace,
         ts_upgrade_baseline: dict,
     ) -> None:
@@ -441,7 +423,6 @@ class TestPostUpgradeAutoMLTimeseries:
         run_id = ts_upgrade_baseline["run_id"]
 
         workflow_nodes = get_workflow_completed_nodes(
-            admin_client=admin_client,
             namespace=upgrade_namespace.name,
             run_id=run_id,
         )
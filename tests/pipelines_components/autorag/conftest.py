@@ -2,7 +2,7 @@ import os
 import shlex
 import uuid
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import httpx
@@ -50,6 +50,8 @@ from tests.pipelines_components.constants import (
     MINIO_UPLOADER_SECURITY_CONTEXT,
 )
 from tests.pipelines_components.utils import (
+    BringUpStage,
+    bring_up_stages,
     create_pipeline_run,
     create_pipeline_run_managed,
     delete_pipeline,
@@ -58,9 +60,10 @@ from tests.pipelines_components.utils import (
     upload_pipeline,
     use_managed_pipelines,
     wait_for_managed_pipeline,
+    workflow_tracker,
 )
 from utilities.constants import Annotations, DscComponents, KServeDeploymentType, RuntimeTemplates
-from utilities.data_science_cluster_utils import update_components_in_dsc
+from utilities.data_science_cluster_utils import DscComponentStateManager
 from utilities.exceptions import UnexpectedResourceCountError
 from utilities.general import generate_random_name
 from utilities.image_constants import SharedImages
@@ -181,10 +184,13 @@ def _validate_autorag_env() -> None:
 
 @pytest.fixture(scope="class")
 def pipelines_namespace(admin_client: DynamicClient) -> Generator[Namespace, Any, Any]:  # noqa: UFN001
-    with create_ns(
-        admin_client=admin_client,
-        name=f"autorag-aqa-{uuid.uuid4().hex[:8]}",
-    ) as namespace:
+    with (
+        create_ns(
+            admin_client=admin_client,
+            name=f"autorag-aqa-{uuid.uuid4().hex[:8]}",
+        ) as namespace,
+        workflow_tracker(client=admin_client, namespace=namespace.name),
+    ):
         yield namespace
 
 
@@ -227,7 +233,7 @@ def autorag_model_service_account(
     admin_client: DynamicClient,
     pipelines_namespace: Namespace,
     autorag_hf_token_secret: Secret,
-) -> Generator[Any, Any, Any]:
+) -> Generator[ServiceAccount, Any, Any]:
     """ServiceAccount with HF token secret for KServe storage initializer."""
     with ServiceAccount(
         client=admin_client,
@@ -238,16 +244,15 @@ def autorag_model_service_account(
         yield sa
 
 
-@pytest.fixture(scope="class")
-def autorag_inference_runtime(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
+@contextmanager
+def _create_autorag_runtime(
+    client: DynamicClient, name: str, namespace: str, template_name: str
 ) -> Generator[ServingRuntimeFromTemplate, Any, Any]:
     with ServingRuntimeFromTemplate(
-        client=admin_client,
-        name="autorag-vllm-inference",
-        namespace=pipelines_namespace.name,
-        template_name="vllm-cpu-runtime-template",  # that need to be changed when #RHOAIENG-68247 will be fixed
+        client=client,
+        name=name,
+        namespace=namespace,
+        template_name=template_name,
         multi_model=False,
         enable_http=True,
         enable_grpc=False,
@@ -255,33 +260,31 @@ def autorag_inference_runtime(
         yield runtime
 
 
-@pytest.fixture(scope="class")
-def autorag_inference_service(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_inference_runtime: ServingRuntimeFromTemplate,
-    autorag_model_service_account: Any,
-) -> Generator[InferenceService, Any, Any]:
+def _create_autorag_inference_service(
+    client: DynamicClient,
+    namespace: str,
+    runtime: ServingRuntimeFromTemplate,
+    model_service_account: ServiceAccount,
+) -> AbstractContextManager[InferenceService]:
     served_model_name = AUTORAG_LLAMA_STACK_INFERENCE_MODEL_ID or AUTORAG_INFERENCE_MODEL_NAME
-    with create_isvc(
-        client=admin_client,
+    return create_isvc(
+        client=client,
         name="autorag-inference",
-        namespace=pipelines_namespace.name,
+        namespace=namespace,
         model_format="vLLM",
-        runtime=autorag_inference_runtime.name,
+        runtime=runtime.name,
         storage_uri=AUTORAG_INFERENCE_MODEL_URI,
         deployment_mode=KServeDeploymentType.RAW_DEPLOYMENT,
         wait=True,
         timeout=1800,
-        model_service_account=autorag_model_service_account.name,
+        model_service_account=model_service_account.name,
         resources={
             "requests": {"cpu": "2", "memory": "4Gi"},
             "limits": {"cpu": "4", "memory": "8Gi"},
         },
         model_env_variables=[{"name": "VLLM_CPU_KVCACHE_SPACE", "value": "2"}],
         argument=["--served-model-name", served_model_name, "--max-model-len", "4096"],
-    ) as isvc:
-        yield isvc
+    )
 
 
 @pytest.fixture(scope="class")
@@ -291,41 +294,23 @@ def autorag_inference_url(autorag_inference_service: InferenceService) -> str:
     return f"{url}/v1"
 
 
-@pytest.fixture(scope="class")
-def autorag_embedding_runtime(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-) -> Generator[ServingRuntimeFromTemplate, Any, Any]:
-    with ServingRuntimeFromTemplate(
-        client=admin_client,
-        name="autorag-vllm-embedding",
-        namespace=pipelines_namespace.name,
-        template_name=RuntimeTemplates.VLLM_CPU_x86,
-        multi_model=False,
-        enable_http=True,
-        enable_grpc=False,
-    ) as runtime:
-        yield runtime
-
-
-@pytest.fixture(scope="class")
-def autorag_embedding_service(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_embedding_runtime: ServingRuntimeFromTemplate,
-    autorag_model_service_account: Any,
-) -> Generator[InferenceService, Any, Any]:
-    with create_isvc(
-        client=admin_client,
+def _create_autorag_embedding_service(
+    client: DynamicClient,
+    namespace: str,
+    runtime: ServingRuntimeFromTemplate,
+    model_service_account: ServiceAccount,
+) -> AbstractContextManager[InferenceService]:
+    return create_isvc(
+        client=client,
         name="autorag-embedding",
-        namespace=pipelines_namespace.name,
+        namespace=namespace,
         model_format="vLLM",
-        runtime=autorag_embedding_runtime.name,
+        runtime=runtime.name,
         storage_uri=AUTORAG_EMBEDDING_MODEL_URI,
         deployment_mode=KServeDeploymentType.RAW_DEPLOYMENT,
         wait=True,
         timeout=1800,
-        model_service_account=autorag_model_service_account.name,
+        model_service_account=model_service_account.name,
         resources={
             "requests": {"cpu": "2", "memory": "4Gi"},
             "limits": {"cpu": "4", "memory": "8Gi"},
@@ -344,8 +329,7 @@ def autorag_embedding_service(
             "--max-model-len",
             AUTORAG_EMBEDDING_MAX_MODEL_LEN,
         ],
-    ) as isvc:
-        yield isvc
+    )
 
 
 @pytest.fixture(scope="class")
@@ -362,12 +346,10 @@ def autorag_embedding_url(autorag_embedding_service: InferenceService) -> str:
 
 @pytest.fixture(scope="class")
 def autorag_ogx_operator(
-    dsc_resource: DataScienceCluster,
+    dsc_component_state_manager: DscComponentStateManager,
 ) -> Generator[DataScienceCluster, Any, Any]:
-    with update_components_in_dsc(
-        dsc=dsc_resource,
-        components={DscComponents.OGX: DscComponents.ManagementState.MANAGED},
-        wait_for_components_state=True,
+    with dsc_component_state_manager.update_components(
+        components={DscComponents.OGX: DscComponents.ManagementState.MANAGED}
     ) as dsc:
         yield dsc
 
@@ -421,45 +403,41 @@ def _get_postgres_template(secret_name: str, app_label: str) -> dict[str, Any]:
     }
 
 
-@pytest.fixture(scope="class")
-def autorag_postgres_deployment(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_run_suffix: str,
-    autorag_ogx_secret: Secret,
+@contextmanager
+def _create_autorag_deployment(
+    client: DynamicClient,
+    namespace: str,
+    name: str,
+    template: dict[str, Any],
+    timeout: int,
+    min_ready_seconds: int | None = None,
 ) -> Generator[Deployment, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-pg-{autorag_run_suffix}"
+    template["metadata"]["labels"]["app"] = name
     with Deployment(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-pg-{autorag_run_suffix}",
-        min_ready_seconds=5,
+        client=client,
+        namespace=namespace,
+        name=name,
+        min_ready_seconds=min_ready_seconds,
         replicas=1,
-        selector={"matchLabels": {"app": app_label}},
+        selector={"matchLabels": {"app": name}},
         strategy={"type": "Recreate"},
-        template=_get_postgres_template(secret_name=autorag_ogx_secret.name, app_label=app_label),
+        template=template,
     ) as deployment:
-        deployment.wait_for_replicas(deployed=True, timeout=240)
+        deployment.wait_for_replicas(deployed=True, timeout=timeout)
         yield deployment
 
 
-@pytest.fixture(scope="class")
-def autorag_postgres_service(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_run_suffix: str,
-    autorag_postgres_deployment: Deployment,
-) -> Generator[Service, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-pg-{autorag_run_suffix}"
-    with Service(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-pg-{autorag_run_suffix}",
-        ports=[{"port": 5432, "targetPort": 5432}],
-        selector={"app": app_label},
+def _create_autorag_service(
+    client: DynamicClient, namespace: str, name: str, ports: list[dict[str, Any]]
+) -> AbstractContextManager[Service]:
+    return Service(
+        client=client,
+        namespace=namespace,
+        name=name,
+        ports=ports,
+        selector={"app": name},
         wait_for_resource=True,
-    ) as service:
-        yield service
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -489,90 +467,137 @@ def _get_milvus_template(etcd_service_name: str) -> dict[str, Any]:
 
 
 @pytest.fixture(scope="class")
-def autorag_etcd_deployment(
+def autorag_backend_stack(
     admin_client: DynamicClient,
     pipelines_namespace: Namespace,
     autorag_run_suffix: str,
-) -> Generator[Deployment, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}"
-    service_name = f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}"
-    template = _get_etcd_template(etcd_service_name=service_name)
-    template["metadata"]["labels"]["app"] = app_label
-    with Deployment(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}",
-        replicas=1,
-        selector={"matchLabels": {"app": app_label}},
-        strategy={"type": "Recreate"},
-        template=template,
-    ) as deployment:
-        deployment.wait_for_replicas(deployed=True, timeout=120)
-        yield deployment
-
+    autorag_model_service_account: ServiceAccount,
+    autorag_ogx_secret: Secret,
+) -> Generator[dict[str, Any], Any, Any]:
+    """Model servers and OGX databases, brought up concurrently following their dependencies.
 
-@pytest.fixture(scope="class")
-def autorag_etcd_service(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_run_suffix: str,
-    autorag_etcd_deployment: Deployment,
-) -> Generator[Service, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}"
-    with Service(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}",
-        ports=[{"port": 2379, "targetPort": 2379}],
-        selector={"app": app_label},
-        wait_for_resource=True,
-    ) as service:
-        yield service
+    The two InferenceServices and the postgres, etcd and Milvus deployments do not depend on each other,
+    so setup time is the slowest chain (the vLLM InferenceService) instead of the sum of all of them.
+    """
+    namespace = pipelines_namespace.name
+    postgres_name = f"{AUTORAG_RESOURCE_PREFIX}-pg-{autorag_run_suffix}"
+    etcd_name = f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}"
+    milvus_name = f"{AUTORAG_RESOURCE_PREFIX}-milvus-{autorag_run_suffix}"
+
+    with bring_up_stages(
+        stages=[
+            BringUpStage(
+                name="inference_runtime",
+                create=lambda _: _create_autorag_runtime(
+                    client=admin_client,
+                    name="autorag-vllm-inference",
+                    namespace=namespace,
+                    # that need to be changed when #RHOAIENG-68247 will be fixed
+                    template_name="vllm-cpu-runtime-template",
+                ),
+            ),
+            BringUpStage(
+                name="inference_service",
+                create=lambda stages: _create_autorag_inference_service(
+                    client=admin_client,
+                    namespace=namespace,
+                    runtime=stages["inference_runtime"],
+                    model_service_account=autorag_model_service_account,
+                ),
+                depends_on=("inference_runtime",),
+            ),
+            BringUpStage(
+                name="embedding_runtime",
+                create=lambda _: _create_autorag_runtime(
+                    client=admin_client,
+                    name="autorag-vllm-embedding",
+                    namespace=namespace,
+                    template_name=RuntimeTemplates.VLLM_CPU_x86,
+                ),
+            ),
+            BringUpStage(
+                name="embedding_service",
+                create=lambda stages: _create_autorag_embedding_service(
+                    client=admin_client,
+                    namespace=namespace,
+                    runtime=stages["embedding_runtime"],
+                    model_service_account=autorag_model_service_account,
+                ),
+                depends_on=("embedding_runtime",),
+            ),
+            BringUpStage(
+                name="postgres_deployment",
+                create=lambda _: _create_autorag_deployment(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=postgres_name,
+                    template=_get_postgres_template(secret_name=autorag_ogx_secret.name, app_label=postgres_name),
+                    timeout=240,
+                    min_ready_seconds=5,
+                ),
+            ),
+            BringUpStage(
+                name="postgres_service",
+                create=lambda _: _create_autorag_service(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=postgres_name,
+                    ports=[{"port": 5432, "targetPort": 5432}],
+                ),
+            ),
+            BringUpStage(
+                name="etcd_deployment",
+                create=lambda _: _create_autorag_deployment(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=etcd_name,
+                    template=_get_etcd_template(etcd_service_name=etcd_name),
+                    timeout=120,
+                ),
+            ),
+            BringUpStage(
+                name="etcd_service",
+                create=lambda _: _create_autorag_service(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=etcd_name,
+                    ports=[{"port": 2379, "targetPort": 2379}],
+                ),
+            ),
+            BringUpStage(
+                name="milvus_deployment",
+                create=lambda _: _create_autorag_deployment(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=milvus_name,
+                    template=_get_milvus_template(etcd_service_name=etcd_name),
+                    timeout=240,
+                    min_ready_seconds=5,
+                ),
+                depends_on=("etcd_deployment", "etcd_service"),
+            ),
+            BringUpStage(
+                name="milvus_service",
+                create=lambda _: _create_autorag_service(
+                    client=admin_client,
+                    namespace=namespace,
+                    name=milvus_name,
+                    ports=[{"name": "grpc", "port": 19530, "targetPort": 19530}],
+                ),
+            ),
+        ]
+    ) as backend_stack:
+        yield backend_stack
 
 
 @pytest.fixture(scope="class")
-def autorag_milvus_deployment(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_run_suffix: str,
-    autorag_etcd_deployment: Deployment,
-    autorag_etcd_service: Service,
-) -> Generator[Deployment, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-milvus-{autorag_run_suffix}"
-    etcd_service_name = f"{AUTORAG_RESOURCE_PREFIX}-etcd-{autorag_run_suffix}"
-    template = _get_milvus_template(etcd_service_name=etcd_service_name)
-    template["metadata"]["labels"]["app"] = app_label
-    with Deployment(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-milvus-{autorag_run_suffix}",
-        min_ready_seconds=5,
-        replicas=1,
-        selector={"matchLabels": {"app": app_label}},
-        strategy={"type": "Recreate"},
-        template=template,
-    ) as deployment:
-        deployment.wait_for_replicas(deployed=True, timeout=240)
-        yield deployment
+def autorag_inference_service(autorag_backend_stack: dict[str, Any]) -> InferenceService:
+    return autorag_backend_stack["inference_service"]
 
 
 @pytest.fixture(scope="class")
-def autorag_milvus_service(
-    admin_client: DynamicClient,
-    pipelines_namespace: Namespace,
-    autorag_run_suffix: str,
-    autorag_milvus_deployment: Deployment,
-) -> Generator[Service, Any, Any]:
-    app_label = f"{AUTORAG_RESOURCE_PREFIX}-milvus-{autorag_run_suffix}"
-    with Service(
-        client=admin_client,
-        namespace=pipelines_namespace.name,
-        name=f"{AUTORAG_RESOURCE_PREFIX}-milvus-{autorag_run_suffix}",
-        ports=[{"name": "grpc", "port": 19530, "targetPort": 19530}],
-        selector={"app": app_label},
-        wait_for_resource=True,
-    ) as service:
-        yield service
+def autorag_embedding_service(autorag_backend_stack: dict[str, Any]) -> InferenceService:
+    return autorag_backend_stack["embedding_service"]
 
 
 @pytest.fixture(scope="class")
@@ -581,9 +606,7 @@ def autorag_ogx_server(
     pipelines_namespace: Namespace,
     autorag_ogx_operator: DataScienceCluster,
     autorag_ogx_secret: Secret,
-    autorag_postgres_deployment: Deployment,
-    autorag_postgres_service: Service,
-    autorag_milvus_service: Service,
+    autorag_backend_stack: dict[str, Any],
     autorag_inference_url: str,
     autorag_embedding_url: str,
     autorag_inference_route: Route,
@@ -596,7 +619,7 @@ def autorag_ogx_server(
     )
 
     secret_name = autorag_ogx_secret.name
-    postgres_service_name = autorag_postgres_service.name
+    postgres_service_name = autorag_backend_stack["postgres_service"].name
 
     env_vars = [
         {"name": "INFERENCE_MODEL", "value": inference_catalog_model_id},
@@ -630,7 +653,7 @@ def autorag_ogx_server(
         },
         {"name": "POSTGRES_DB", "value": "ps_db"},
         {"name": "POSTGRES_TABLE_NAME", "value": "llamastack_kvstore"},
-        {"name": "MILVUS_ENDPOINT", "value": f"http://{autorag_milvus_service.name}:19530"},
+        {"name": "MILVUS_ENDPOINT", "value": f"http://{autorag_backend_stack['milvus_service'].name}:19530"},
         {
             "name": "MILVUS_TOKEN",
             "valueFrom": {"secretKeyRef": {"name": secret_name, "key": "milvus-token"}},
@@ -1,5 +1,4 @@
 import pytest
-from kubernetes.dynamic import DynamicClient
 from ocp_resources.namespace import Namespace
 
 from tests.pipelines_components.constants import (
@@ -22,14 +21,12 @@ class TestAutoRAGSmoke:
 
     def test_autorag_pipeline_completes(
         self,
-        admin_client: DynamicClient,
         autorag_run_id: str,
         pipelines_namespace: Namespace,
     ) -> None:
         """Given a DSPA with documents and benchmark data, when an AutoRAG pipeline run is submitted,
         then it succeeds."""
         phase = wait_for_pipeline_run(
-            admin_client=admin_client,
             namespace=pipelines_namespace.name,
             run_id=autorag_run_id,
             timeout=AUTORAG_PIPELINE_TIMEOUT,
@@ -37,7 +34,6 @@ class TestAutoRAGSmoke:
 
         if phase != WORKFLOW_SUCCEEDED:
             collect_pipeline_pod_logs(
-                admin_client=admin_client,
                 namespace=pipelines_namespace.name,
                 run_id=autorag_run_id,
             )
@@ -79,6 +79,13 @@ EXTERNAL_S3_SECRET: str = "external-s3-credentials"
 # Timeouts (seconds)
 AUTOML_PIPELINE_TIMEOUT: int = int(os.getenv("AUTOML_PIPELINE_TIMEOUT", "1800"))
 PIPELINE_POLL_INTERVAL: int = int(os.getenv("PIPELINE_POLL_INTERVAL", "30"))
+# On-disk cache of pipeline YAMLs downloaded from URLs, revalidated with their ETag
+PIPELINE_YAML_CACHE_DIR: str = os.getenv(
+    "PIPELINE_YAML_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "pipelines"),
+)
+# Server-side timeout of the Workflow watch, it is re-established from the last seen resourceVersion
+PIPELINE_WATCH_TIMEOUT: int = int(os.getenv("PIPELINE_WATCH_TIMEOUT", "300"))
 
 MINIO_MC_IMAGE: str = os.getenv(
     "MINIO_MC_IMAGE",
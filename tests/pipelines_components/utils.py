@@ -1,29 +1,315 @@
-import atexit
+import base64
+import hashlib
 import json
 import os
 import tempfile
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass
+from functools import cache
+from graphlib import TopologicalSorter
 from pathlib import Path
 from typing import Any
 
+import pytest
 import requests
 import structlog
+from kubernetes import watch
 from kubernetes.client.rest import ApiException
 from kubernetes.dynamic import DynamicClient
+from ocp_resources.secret import Secret
+from ocp_resources.service import Service
+from requests.adapters import HTTPAdapter
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
-from tests.pipelines_components.constants import PIPELINE_POLL_INTERVAL
+from tests.pipelines_components.constants import (
+    AUTOML_TASK_CONFIGS,
+    AUTOML_TRAIN_DATA_FILE_KEY,
+    DSPA_NAME,
+    DSPA_S3_BUCKET,
+    DSPA_S3_SECRET,
+    PIPELINE_POLL_INTERVAL,
+    PIPELINE_WATCH_TIMEOUT,
+    PIPELINE_YAML_CACHE_DIR,
+)
+from utilities.minio import ensure_s3_bucket, get_s3_client, minio_s3_client, transfer_s3_objects
 from utilities.resources.workflow import Workflow
 
 LOGGER = structlog.get_logger(name=__name__)
 
 WORKFLOW_SUCCEEDED: str = "Succeeded"
 WORKFLOW_TERMINAL_PHASES: set[str] = {"Succeeded", "Failed", "Error"}
+WORKFLOW_FAILED_PHASES: set[str] = {"Failed", "Error"}
+WORKFLOW_RUN_ID_LABEL: str = "pipeline/runid"
+PIPELINE_YAML_ETAG_COMMENT: str = "# ETag: "
+PIPELINE_YAML_DIGEST_PREFIX: str = "sha256:"
+XDIST_WHOLE_CLASS_DIST_MODES: set[str] = {"loadfile", "loadscope"}
+
+
+class WorkflowTracker:
+    """Track the Argo Workflows of pipeline runs in one namespace through a single watch.
+
+    The namespace is listed once, then a background thread follows a ``pipeline/runid`` label-selected
+    watch and keeps every run's phase and node map in memory. Waiters are woken as soon as the watch
+    event with a terminal phase arrives, instead of re-fetching the Workflow every poll interval.
+    Any watch failure is logged and followed by a resync from a fresh list; if the watch thread is not
+    running, waiters fall back to listing the Workflows every poll interval.
+    """
+
+    def __init__(self, client: DynamicClient, namespace: str) -> None:
+        self.client = client
+        self.namespace = namespace
+        self._api = client.resources.get(api_version=f"{Workflow.api_group}/{Workflow.api_version}", kind="Workflow")
+        self._condition = threading.Condition()
+        self._workflows: dict[str, dict[str, Any]] = {}
+        self._stopped = threading.Event()
+        self._watcher = watch.Watch()
+        self._resource_version = self._list()
+        self._watch_thread = threading.Thread(target=self._watch, name=f"workflow-tracker-{namespace}", daemon=True)
+        self._watch_thread.start()
+
+    def _update(self, workflow: dict[str, Any], deleted: bool = False) -> None:
+        if not (run_id := workflow["metadata"].get("labels", {}).get(WORKFLOW_RUN_ID_LABEL)):
+            return
+
+        with self._condition:
+            if deleted:
+                self._workflows.pop(run_id, None)
+            else:
+                self._workflows[run_id] = workflow.get("status", {})
+            self._condition.notify_all()
+
+    def _list(self) -> str:
+        workflows = self._api.get(namespace=self.namespace, label_selector=WORKFLOW_RUN_ID_LABEL).to_dict()
+        with self._condition:
+            self._workflows.clear()
+        for workflow in workflows["items"]:
+            self._update(workflow=workflow)
+        return workflows["metadata"]["resourceVersion"]
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                for event in self._api.watch(
+                    namespace=self.namespace,
+                    label_selector=WORKFLOW_RUN_ID_LABEL,
+                    resource_version=self._resource_version,
+                    timeout=PIPELINE_WATCH_TIMEOUT,
+                    watcher=self._watcher,
+                ):
+                    raw_object = event["raw_object"]
+                    if event["type"] == "ERROR":
+                        # 410 Gone: the resource version is too old, resync from a fresh list
+                        raise ApiException(status=raw_object.get("code"), reason=raw_object.get("message"))
+
+                    self._update(workflow=raw_object, deleted=event["type"] == "DELETED")
+                    self._resource_version = raw_object["metadata"]["resourceVersion"]
+
+            except Exception as exc:  # noqa: BLE001
+                if self._stopped.is_set():
+                    return
+
+                LOGGER.warning(f"Workflow watch in {self.namespace} failed: {exc!r}, resyncing")
+                self._stopped.wait(timeout=PIPELINE_POLL_INTERVAL)
+                self._resync()
+
+    def _resync(self) -> None:
+        try:
+            self._resource_version = self._list()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning(f"Workflow list in {self.namespace} failed: {exc!r}")
+
+    def close(self) -> None:
+        """Stop the watch thread."""
+        self._stopped.set()
+        self._watcher.stop()
+        self._watch_thread.join(timeout=PIPELINE_POLL_INTERVAL)
+
+    def get_phase(self, run_id: str) -> str | None:
+        """Return the current phase of the run's Workflow, or None if it does not exist (yet)."""
+        with self._condition:
+            return self._workflows.get(run_id, {}).get("phase")
+
+    def get_nodes(self, run_id: str) -> dict[str, dict[str, Any]]:
+        """Return the current node map of the run's Workflow."""
+        with self._condition:
+            return dict(self._workflows.get(run_id, {}).get("nodes", {}))
+
+    def wait(self, run_ids: list[str], timeout: int) -> dict[str, str]:
+        """Wait until all runs reach a terminal phase.
+
+        Args:
+            run_ids (list[str]): pipeline run IDs.
+            timeout (int): overall timeout in seconds.
+
+        Returns:
+            dict[str, str]: run ID to terminal phase.
+
+        Raises:
+            TimeoutExpiredError: if not all runs reached a terminal phase within the timeout.
+        """
+        reported_phases: dict[str, str | None] = {}
+        deadline = time.monotonic() + timeout
+
+        def _all_terminal() -> bool:
+            for run_id in run_ids:
+                phase = self._workflows.get(run_id, {}).get("phase")
+                if reported_phases.get(run_id, "") != phase:
+                    reported_phases[run_id] = phase
+                    LOGGER.info(f"Pipeline run {run_id}: {phase}")
+            return all(phase in WORKFLOW_TERMINAL_PHASES for phase in reported_phases.values())
+
+        while True:
+            with self._condition:
+                if self._condition.wait_for(
+                    predicate=_all_terminal,
+                    timeout=max(min(deadline - time.monotonic(), PIPELINE_POLL_INTERVAL), 0),
+                ):
+                    return {run_id: str(phase) for run_id, phase in reported_phases.items()}
+
+            if time.monotonic() >= deadline:
+                pending = [run_id for run_id, phase in reported_phases.items() if phase not in WORKFLOW_TERMINAL_PHASES]
+                raise TimeoutExpiredError(f"Pipeline runs {pending} did not complete within {timeout}s")
+
+            if not self._watch_thread.is_alive():
+                LOGGER.warning(f"Workflow watch in {self.namespace} is not running, polling")
+                self._resync()
+
+
+_WORKFLOW_TRACKERS: dict[str, WorkflowTracker] = {}
+_WORKFLOW_TRACKERS_LOCK = threading.Lock()
+
+
+def get_workflow_tracker(namespace: str) -> WorkflowTracker:
+    """Return the WorkflowTracker of *namespace* started by `workflow_tracker`.
+
+    Raises:
+        ValueError: if *namespace* is not inside a `workflow_tracker` scope, its watch thread would never be stopped.
+    """
+    with _WORKFLOW_TRACKERS_LOCK:
+        if namespace not in _WORKFLOW_TRACKERS:
+            raise ValueError(f"No workflow tracker for namespace {namespace}, wrap its lifetime in workflow_tracker()")
+        return _WORKFLOW_TRACKERS[namespace]
+
+
+@contextmanager
+def workflow_tracker(client: DynamicClient, namespace: str) -> Generator[WorkflowTracker, Any, Any]:
+    """Start the WorkflowTracker of *namespace* for the namespace lifetime; its watch is stopped on exit."""
+    tracker = WorkflowTracker(client=client, namespace=namespace)
+    with _WORKFLOW_TRACKERS_LOCK:
+        _WORKFLOW_TRACKERS[namespace] = tracker
+    try:
+        yield tracker
+    finally:
+        with _WORKFLOW_TRACKERS_LOCK:
+            _WORKFLOW_TRACKERS.pop(namespace, None)
+        tracker.close()
+
+
+@cache
+def get_dspa_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session used for all DSPA API calls."""
+    session = requests.Session()
+    session.mount(prefix="https://", adapter=HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+@dataclass(frozen=True)
+class BringUpStage:
+    """One stage of a dependency-graph bring-up.
+
+    ``create`` receives the results of the already brought-up stages and returns a context manager that
+    creates the stage resource, waits for it to be ready and tears it down on exit.
+    """
+
+    name: str
+    create: Callable[[dict[str, Any]], AbstractContextManager[Any]]
+    depends_on: tuple[str, ...] = ()
+
+
+@contextmanager
+def bring_up_stages(stages: list[BringUpStage]) -> Generator[dict[str, Any], Any, Any]:
+    """Bring up stages concurrently, each one as soon as the stages it depends on are ready.
+
+    Setup time is the critical path of the graph instead of the sum of the stages. Stages are torn down
+    in reverse order of readiness, so dependents go before their dependencies. If a stage fails, the
+    in-flight stages are awaited and everything already brought up is torn down.
+
+    Args:
+        stages (list[BringUpStage]): stages to bring up.
+
+    Yields:
+        dict[str, Any]: stage name to the value its context manager entered with.
+
+    Raises:
+        graphlib.CycleError: if the stages dependencies contain a cycle.
+    """
+    stages_by_name = {stage.name: stage for stage in stages}
+    sorter = TopologicalSorter({stage.name: stage.depends_on for stage in stages})
+    sorter.prepare()
+
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    start_time = time.monotonic()
+
+    with ExitStack() as stack:
+
+        def _enter_stage(stage: BringUpStage) -> Any:
+            stage_start_time = time.monotonic()
+            LOGGER.info(f"Bring-up stage {stage.name}: starting")
+            # enter_context only appends to the stack, which is safe from concurrent threads
+            result = stack.enter_context(stage.create(results))
+            timings[stage.name] = time.monotonic() - stage_start_time
+            LOGGER.info(f"Bring-up stage {stage.name}: ready in {timings[stage.name]:.0f}s")
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures: dict[Future, str] = {}
+            try:
+                while sorter.is_active():
+                    for name in sorter.get_ready():
+                        futures[executor.submit(_enter_stage, stages_by_name[name])] = name
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = futures.pop(future)
+                        results[name] = future.result()
+                        sorter.done(name)
+            except BaseException:
+                # Let in-flight stages register on the stack, so they are torn down as well
+                wait(futures)
+                raise
+
+        LOGGER.info(
+            f"Bring-up completed in {time.monotonic() - start_time:.0f}s "
+            f"(sum of stages {sum(timings.values()):.0f}s): "
+            + ", ".join(f"{name}={duration:.0f}s" for name, duration in timings.items())
+        )
+        yield results
+
+
+def get_cached_pipeline_yaml_etag(path: str) -> str | None:
+    """Return the ETag recorded in the first line of a cached pipeline YAML, None if there is none."""
+    try:
+        with open(path) as fd:
+            first_line = fd.readline().rstrip("\n")
+    except FileNotFoundError:
+        return None
+
+    if not first_line.startswith(PIPELINE_YAML_ETAG_COMMENT):
+        return None
+
+    return first_line.removeprefix(PIPELINE_YAML_ETAG_COMMENT)
 
 
 def resolve_pipeline_yaml(value: str) -> str:
     """Resolve a pipeline YAML value to a local file path.
 
-    If the value is a URL (https://), downloads the file to a temp location.
+    If the value is a URL (https://), downloads the file into the on-disk cache, revalidating a cached
+    copy with its ETag (If-None-Match) instead of downloading it again.
     If it's a local path, validates the file exists.
 
     Returns:
@@ -33,14 +319,30 @@ def resolve_pipeline_yaml(value: str) -> str:
         FileNotFoundError: If the local path does not exist or the download fails.
     """
     if value.startswith(("https://", "http://")):
+        os.makedirs(PIPELINE_YAML_CACHE_DIR, exist_ok=True)
+        cached_path = os.path.join(PIPELINE_YAML_CACHE_DIR, f"{hashlib.sha256(value.encode()).hexdigest()}.yaml")
+
+        headers: dict[str, str] = {}
+        if etag := get_cached_pipeline_yaml_etag(path=cached_path):
+            headers["If-None-Match"] = etag
+
         LOGGER.info(f"Downloading pipeline YAML from {value}")
-        resp = requests.get(url=value, timeout=60)
+        resp = get_dspa_session().get(url=value, headers=headers, timeout=60)
+        if resp.status_code == requests.codes.not_modified:
+            LOGGER.info(f"Pipeline YAML not modified, using cached {cached_path}")
+            return cached_path
+
         resp.raise_for_status()
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
+        # The ETag is kept in a comment of the YAML itself, so both are replaced in one atomic rename;
+        # concurrent workers may resolve the same URL
+        with tempfile.NamedTemporaryFile(dir=PIPELINE_YAML_CACHE_DIR, suffix=".yaml", delete=False) as tmp:
+            if etag := resp.headers.get("ETag"):
+                tmp.write(f"{PIPELINE_YAML_ETAG_COMMENT}{etag}\n".encode())
             tmp.write(resp.content)
-        atexit.register(os.unlink, path=tmp.name)  # noqa: FCN001
-        LOGGER.info(f"Pipeline YAML downloaded to {tmp.name}")
-        return tmp.name
+        os.replace(tmp.name, cached_path)
+
+        LOGGER.info(f"Pipeline YAML downloaded to {cached_path}")
+        return cached_path
 
     path = Path(value)  # noqa: FCN001
     if not path.is_file():
@@ -51,6 +353,78 @@ def resolve_pipeline_yaml(value: str) -> str:
     return str(path.resolve())
 
 
+def get_automl_task_train_data_key(task_type: str) -> str:
+    """Return the DSPA MinIO key of the training CSV of *task_type*, so concurrent runs do not share data."""
+    base_key, extension = os.path.splitext(AUTOML_TRAIN_DATA_FILE_KEY)
+    return f"{base_key}-{task_type}{extension}"
+
+
+def get_class_automl_task_types(request: pytest.FixtureRequest) -> list[str]:
+    """Return the AutoML task types the selected tests of the requesting class are parametrized with.
+
+    Every xdist worker collects the whole session, so the class tests are only known to run on this worker when
+    whole files or classes are sent to it: with ``--dist loadfile``, ``--dist loadscope`` or ``--duration-scheduler``.
+    """
+    if hasattr(request.config, "workerinput"):
+        sends_whole_classes = request.config.workerinput.get("dist") in XDIST_WHOLE_CLASS_DIST_MODES
+        assert sends_whole_classes or request.config.getoption("--duration-scheduler"), (
+            f"AutoML tests of {request.cls.__name__} may be split across xdist workers, "
+            "run them with '--dist loadfile' or '--duration-scheduler'"
+        )
+
+    selected_task_types = {
+        callspec.params["task_type"]
+        for item in request.session.items
+        if item.cls is request.cls and (callspec := getattr(item, "callspec", None)) and "task_type" in callspec.params
+    }
+    return [task_type for task_type in AUTOML_TASK_CONFIGS if task_type in selected_task_types]
+
+
+def upload_s3_objects_to_dspa_minio(
+    client: DynamicClient,
+    namespace: str,
+    src_bucket: str,
+    objects: dict[str, str],
+) -> None:
+    """Stream objects from the external S3 bucket into the DSPA MinIO bucket through a port-forward.
+
+    Objects are transferred concurrently by the test runner, without an uploader pod or a local copy.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        namespace (str): namespace of the DSPA.
+        src_bucket (str): external S3 bucket.
+        objects (dict[str, str]): DSPA MinIO key to external S3 key.
+    """
+    aws_access_key_id = os.environ.get("AWS_ACCESS_KEY_ID")
+    aws_secret_access_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
+    assert aws_access_key_id and aws_secret_access_key, (
+        "Environment variables 'AWS_ACCESS_KEY_ID' and 'AWS_SECRET_ACCESS_KEY' must be set "
+        "to provide external S3 credentials."
+    )
+    src_client = get_s3_client(
+        endpoint_url=os.environ.get("AWS_S3_ENDPOINT", "https://s3.amazonaws.com"),
+        access_key=aws_access_key_id,
+        secret_key=aws_secret_access_key,
+        region=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+    )
+
+    dspa_secret_data = Secret(client=client, name=DSPA_S3_SECRET, namespace=namespace, ensure_exists=True).instance.data
+    with minio_s3_client(
+        minio_service=Service(client=client, name=f"minio-{DSPA_NAME}", namespace=namespace, ensure_exists=True),
+        access_key=base64.b64decode(dspa_secret_data["accesskey"]).decode(),
+        secret_key=base64.b64decode(dspa_secret_data["secretkey"]).decode(),
+    ) as dst_client:
+        ensure_s3_bucket(s3_client=dst_client, bucket=DSPA_S3_BUCKET)
+        transfer_s3_objects(
+            src_client=src_client,
+            src_bucket=src_bucket,
+            dst_client=dst_client,
+            dst_bucket=DSPA_S3_BUCKET,
+            objects=objects,
+        )
+
+
 def _raise_for_status(resp: requests.Response) -> None:
     """Raise on HTTP errors, including the server response body in the message."""
     try:
@@ -62,6 +436,44 @@ def _raise_for_status(resp: requests.Response) -> None:
         ) from exc
 
 
+def get_file_sha256(path: str) -> str:
+    """Return the sha256 hex digest of the file content."""
+    with open(path, "rb") as fd:
+        return hashlib.file_digest(fd, "sha256").hexdigest()
+
+
+def find_pipeline_by_yaml_digest(
+    api_url: str,
+    headers: dict[str, str],
+    yaml_digest: str,
+    ca_bundle: str,
+) -> str | None:
+    """Search the DSPA for a pipeline uploaded from a YAML with the given sha256 digest.
+
+    Returns the pipeline ID or None.
+    """
+    resp = get_dspa_session().get(
+        url=f"{api_url}/apis/v2beta1/pipelines",
+        headers=headers,
+        params={
+            "filter": json.dumps({
+                "predicates": [
+                    {
+                        "key": "description",
+                        "operation": "EQUALS",
+                        "string_value": f"{PIPELINE_YAML_DIGEST_PREFIX}{yaml_digest}",
+                    }
+                ]
+            })
+        },
+        verify=ca_bundle,
+        timeout=60,
+    )
+    _raise_for_status(resp=resp)
+    pipelines = resp.json().get("pipelines", [])
+    return pipelines[0]["pipeline_id"] if pipelines else None
+
+
 def upload_pipeline(
     api_url: str,
     headers: dict[str, str],
@@ -69,13 +481,28 @@ def upload_pipeline(
     pipeline_name: str,
     ca_bundle: str,
 ) -> str:
-    """Upload a compiled pipeline YAML to the DSPA and return the pipeline ID."""
+    """Upload a compiled pipeline YAML to the DSPA and return the pipeline ID.
+
+    The pipeline description is the sha256 digest of the YAML. A pipeline already uploaded to the same
+    DSPA from an identical YAML, e.g. by a retried upload whose response was lost or by the pre-upgrade
+    run, is reused whatever its display name.
+    """
+    yaml_digest = get_file_sha256(path=pipeline_yaml_path)
+    if pipeline_id := find_pipeline_by_yaml_digest(
+        api_url=api_url,
+        headers=headers,
+        yaml_digest=yaml_digest,
+        ca_bundle=ca_bundle,
+    ):
+        LOGGER.info(f"Reusing pipeline {pipeline_id} uploaded from an identical YAML ({yaml_digest[:12]})")
+        return pipeline_id
+
     with open(pipeline_yaml_path, "rb") as yaml_file:
-        resp = requests.post(
+        resp = get_dspa_session().post(
             url=f"{api_url}/apis/v2beta1/pipelines/upload",
             headers=headers,
             files={"uploadfile": (f"{pipeline_name}.yaml", yaml_file, "application/x-yaml")},
-            params={"name": pipeline_name},
+            params={"name": pipeline_name, "description": f"{PIPELINE_YAML_DIGEST_PREFIX}{yaml_digest}"},
             verify=ca_bundle,
             timeout=60,
         )
@@ -92,7 +519,7 @@ def create_pipeline_run(
     ca_bundle: str,
 ) -> str:
     """Create a pipeline run and return the run ID."""
-    resp = requests.post(
+    resp = get_dspa_session().post(
         url=f"{api_url}/apis/v2beta1/runs",
         headers=headers,
         json={
@@ -108,19 +535,14 @@ def create_pipeline_run(
 
 
 def get_workflow_phase(
-    admin_client: DynamicClient,
     namespace: str,
     run_id: str,
 ) -> str | None:
     """Get the phase of the Argo Workflow associated with a pipeline run ID."""
-    workflows = list(Workflow.get(client=admin_client, namespace=namespace, label_selector=f"pipeline/runid={run_id}"))
-    if workflows:
-        return workflows[0].instance.get("status", {}).get("phase")
-    return None
+    return get_workflow_tracker(namespace=namespace).get_phase(run_id=run_id)
 
 
 def get_workflow_completed_nodes(
-    admin_client: DynamicClient,
     namespace: str,
     run_id: str,
 ) -> list[dict]:
@@ -129,45 +551,34 @@ def get_workflow_completed_nodes(
     Returns a list of node dicts that reached a terminal phase (Succeeded, Failed, etc.).
     Useful for verifying that pipeline steps actually executed and their records persist.
     """
-    workflows = list(Workflow.get(client=admin_client, namespace=namespace, label_selector=f"pipeline/runid={run_id}"))
-    if not workflows:
-        return []
-
-    nodes = workflows[0].instance.get("status", {}).get("nodes", {})
+    nodes = get_workflow_tracker(namespace=namespace).get_nodes(run_id=run_id)
     return [
         node for node in nodes.values() if node.get("phase") in WORKFLOW_TERMINAL_PHASES and node.get("type") == "Pod"
     ]
 
 
-def wait_for_pipeline_run(
-    admin_client: DynamicClient,
+def wait_for_pipeline_runs(
     namespace: str,
-    run_id: str,
+    run_ids: list[str],
     timeout: int,
-) -> str:
-    """Poll the Argo Workflow until it reaches a terminal phase. Returns the phase string."""
-    LOGGER.info(f"Waiting for pipeline run {run_id} (timeout={timeout}s)")
+) -> dict[str, str]:
+    """Wait until all Argo Workflows of *run_ids* reach a terminal phase. Returns run ID to phase."""
+    LOGGER.info(f"Waiting for pipeline runs {run_ids} (timeout={timeout}s)")
 
     try:
-        for phase in TimeoutSampler(
-            wait_timeout=timeout,
-            sleep=PIPELINE_POLL_INTERVAL,
-            func=get_workflow_phase,
-            exceptions_dict={ApiException: [], ConnectionError: [], TimeoutError: []},
-            admin_client=admin_client,
-            namespace=namespace,
-            run_id=run_id,
-        ):
-            LOGGER.info(f"Pipeline run {run_id}: {phase}")
-            if phase and phase in WORKFLOW_TERMINAL_PHASES:
-                return phase
+        return get_workflow_tracker(namespace=namespace).wait(run_ids=run_ids, timeout=timeout)
     except TimeoutExpiredError as err:
-        msg = f"Pipeline run {run_id} did not complete within {timeout}s"
-        LOGGER.error(msg)
-        raise TimeoutExpiredError(msg) from err
+        LOGGER.error(str(err))
+        raise
 
-    msg = f"Pipeline run {run_id} exited polling without reaching terminal state"
-    raise RuntimeError(msg)
+
+def wait_for_pipeline_run(
+    namespace: str,
+    run_id: str,
+    timeout: int,
+) -> str:
+    """Wait until the Argo Workflow reaches a terminal phase. Returns the phase string."""
+    return wait_for_pipeline_runs(namespace=namespace, run_ids=[run_id], timeout=timeout)[run_id]
 
 
 def get_pipeline_run(
@@ -177,7 +588,7 @@ def get_pipeline_run(
     ca_bundle: str,
 ) -> dict:
     """Get a pipeline run by ID from the DSPA."""
-    resp = requests.get(
+    resp = get_dspa_session().get(
         url=f"{api_url}/apis/v2beta1/runs/{run_id}",
         headers=headers,
         verify=ca_bundle,
@@ -194,7 +605,7 @@ def delete_pipeline(
     ca_bundle: str,
 ) -> None:
     """Delete a pipeline and all its versions from the DSPA."""
-    resp = requests.delete(
+    resp = get_dspa_session().delete(
         url=f"{api_url}/apis/v2beta1/pipelines/{pipeline_id}",
         headers=headers,
         params={"cascade": "true"},
@@ -212,7 +623,7 @@ def delete_pipeline_run(
     ca_bundle: str,
 ) -> None:
     """Delete a pipeline run from the DSPA."""
-    resp = requests.delete(
+    resp = get_dspa_session().delete(
         url=f"{api_url}/apis/v2beta1/runs/{run_id}",
         headers=headers,
         verify=ca_bundle,
@@ -223,24 +634,21 @@ def delete_pipeline_run(
 
 
 def collect_pipeline_pod_logs(
-    admin_client: DynamicClient,
     namespace: str,
     run_id: str,
 ) -> None:
     """Log failed workflow node messages for post-failure debugging."""
-    workflows = list(Workflow.get(client=admin_client, namespace=namespace, label_selector=f"pipeline/runid={run_id}"))
-    if not workflows:
+    workflow_tracker = get_workflow_tracker(namespace=namespace)
+    if workflow_tracker.get_phase(run_id=run_id) is None:
         LOGGER.warning(f"No Argo Workflow found for pipeline run {run_id} in namespace {namespace}")
         return
 
-    for workflow in workflows:
-        nodes = workflow.instance.get("status", {}).get("nodes", {})
-        for node_name, node in nodes.items():
-            node_phase = node.get("phase", "")
-            if node_phase in ("Failed", "Error"):
-                message = node.get("message", "<no message>")
-                display_name = node.get("displayName", node_name)
-                LOGGER.error(f"Workflow node '{display_name}' {node_phase}: {message}")
+    for node_name, node in workflow_tracker.get_nodes(run_id=run_id).items():
+        node_phase = node.get("phase", "")
+        if node_phase in WORKFLOW_FAILED_PHASES:
+            message = node.get("message", "<no message>")
+            display_name = node.get("displayName", node_name)
+            LOGGER.error(f"Workflow node '{display_name}' {node_phase}: {message}")
 
 
 # ---------------------------------------------------------------------------
@@ -263,7 +671,7 @@ def find_pipeline_by_display_name(
 
     Returns {"pipeline_id": ..., "pipeline_version_id": ...} or None.
     """
-    resp = requests.get(
+    resp = get_dspa_session().get(
         url=f"{api_url}/apis/v2beta1/pipelines",
         headers=headers,
         params={
@@ -287,7 +695,7 @@ def find_pipeline_by_display_name(
 
     pipeline_id = pipelines[0]["pipeline_id"]
 
-    version_resp = requests.get(
+    version_resp = get_dspa_session().get(
         url=f"{api_url}/apis/v2beta1/pipelines/{pipeline_id}/versions",
         headers=headers,
         params={"sort_by": "created_at desc", "page_size": "1"},
@@ -342,7 +750,7 @@ def create_pipeline_run_managed(
     ca_bundle: str,
 ) -> str:
     """Create a pipeline run for a managed pipeline (with version_id) and return the run ID."""
-    resp = requests.post(
+    resp = get_dspa_session().post(
         url=f"{api_url}/apis/v2beta1/runs",
         headers=headers,
         json={
@@ -1,7 +1,8 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import pytest
+import pytest_asyncio
 from fastmcp.client.transports import StreamableHttpTransport
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.cluster_role import ClusterRole
@@ -19,19 +20,27 @@ from tests.rhoai_mcp.constants import (
     RHOAI_MCP_ENDPOINT_PATH,
     RHOAI_MCP_HEALTH_PATH,
     RHOAI_MCP_MODEL_DEPLOY_NAMESPACE,
+    RHOAI_MCP_MODEL_DEPLOYER_PERSONA,
     RHOAI_MCP_MODEL_DEPLOYER_ROLE_NAME,
     RHOAI_MCP_NAMESPACE,
     RHOAI_MCP_PORT,
+    RHOAI_MCP_RBAC_DEPLOYER_PERSONA,
     RHOAI_MCP_RBAC_DEPLOYER_ROLE_NAME,
+    RHOAI_MCP_RBAC_READER_PERSONA,
     RHOAI_MCP_RBAC_READER_ROLE_NAME,
 )
 from tests.rhoai_mcp.utils import (
+    McpPersona,
+    McpPersonaSpec,
+    McpSession,
+    create_mcp_personas,
     deployment_template_with_image,
     get_rhoai_mcp_image,
+    mcp_session,
     probe_health,
 )
 from utilities.certificates_utils import create_ca_bundle_file
-from utilities.infra import create_inference_token, create_ns
+from utilities.infra import create_ns
 
 
 @pytest.fixture(scope="class")
@@ -264,6 +273,13 @@ def rhoai_mcp_transport(
     )
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def rhoai_mcp_session(rhoai_mcp_transport: StreamableHttpTransport) -> AsyncGenerator[McpSession, Any]:
+    """MCP session authenticated as the current cluster user, shared by the tests of the class."""
+    async with mcp_session(transport=rhoai_mcp_transport) as session:
+        yield session
+
+
 @pytest.fixture(scope="class")
 def rhoai_mcp_ca_bundle(admin_client: DynamicClient) -> str:
     """CA bundle file for verifying TLS on the rhoai-mcp route."""
@@ -316,32 +332,12 @@ def mcp_model_deploy_namespace(
 _KSERVE_API_GROUP = "serving.kserve.io"
 _TEMPLATE_API_GROUP = "template.openshift.io"
 
-
-@pytest.fixture(scope="class")
-def mcp_model_deployer_sa(
-    admin_client: DynamicClient,
-    rhoai_mcp_namespace: Namespace,
-) -> Generator[ServiceAccount, Any, Any]:
-    """ServiceAccount for the model deployment lifecycle tests."""
-    with ServiceAccount(
-        client=admin_client,
-        name="rhoai-mcp-model-deployer",
-        namespace=rhoai_mcp_namespace.name,
-    ) as sa:
-        yield sa
-
-
-@pytest.fixture(scope="class")
-def mcp_model_deployer_cluster_role(
-    admin_client: DynamicClient,
-    teardown_resources: bool,
-) -> Generator[ClusterRole, Any, Any]:
-    """ClusterRole with full permissions for model deployment lifecycle."""
-    with ClusterRole(
-        client=admin_client,
-        name=RHOAI_MCP_MODEL_DEPLOYER_ROLE_NAME,
-        teardown=teardown_resources,
-        rules=[
+_MCP_PERSONA_SPECS: list[McpPersonaSpec] = [
+    McpPersonaSpec(
+        name=RHOAI_MCP_MODEL_DEPLOYER_PERSONA,
+        service_account_name="rhoai-mcp-model-deployer",
+        role_name=RHOAI_MCP_MODEL_DEPLOYER_ROLE_NAME,
+        rules=(
             {
                 "apiGroups": [""],
                 "resources": ["namespaces"],
@@ -367,43 +363,65 @@ def mcp_model_deployer_cluster_role(
                 "resources": ["serviceaccounts"],
                 "verbs": ["get"],
             },
-        ],
-    ) as cr:
-        yield cr
+        ),
+    ),
+    # RBAC test personas – reader (get/list on ISVC/SR) and deployer (+ create on ISVC/PVC/Secrets)
+    McpPersonaSpec(
+        name=RHOAI_MCP_RBAC_READER_PERSONA,
+        service_account_name="rhoai-mcp-reader",
+        role_name=RHOAI_MCP_RBAC_READER_ROLE_NAME,
+        rules=(
+            {
+                "apiGroups": [_KSERVE_API_GROUP],
+                "resources": ["inferenceservices", "servingruntimes"],
+                "verbs": ["get", "list"],
+            },
+        ),
+    ),
+    McpPersonaSpec(
+        name=RHOAI_MCP_RBAC_DEPLOYER_PERSONA,
+        service_account_name="rhoai-mcp-deployer",
+        role_name=RHOAI_MCP_RBAC_DEPLOYER_ROLE_NAME,
+        rules=(
+            {
+                "apiGroups": [_KSERVE_API_GROUP],
+                "resources": ["inferenceservices"],
+                "verbs": ["get", "list", "create"],
+            },
+            {
+                "apiGroups": [_KSERVE_API_GROUP],
+                "resources": ["servingruntimes"],
+                "verbs": ["get", "list"],
+            },
+            {
+                "apiGroups": [""],
+                "resources": ["persistentvolumeclaims", "secrets"],
+                "verbs": ["get", "list", "create"],
+            },
+        ),
+    ),
+]
 
 
 @pytest.fixture(scope="class")
-def mcp_model_deployer_crb(
+def mcp_personas(
+    request: pytest.FixtureRequest,
     admin_client: DynamicClient,
     rhoai_mcp_namespace: Namespace,
-    mcp_model_deployer_sa: ServiceAccount,
-    mcp_model_deployer_cluster_role: ClusterRole,
     teardown_resources: bool,
-) -> Generator[ClusterRoleBinding, Any, Any]:
-    """Bind model-deployer SA to its ClusterRole."""
-    with ClusterRoleBinding(
+) -> Generator[dict[str, McpPersona], Any, Any]:
+    """MCP test personas of the class, provisioned and verified in one concurrent pass.
+
+    Classes select the personas they use with a `{"personas": [...]}` indirect param; all personas otherwise.
+    """
+    persona_names = getattr(request, "param", {}).get("personas")
+    with create_mcp_personas(
         client=admin_client,
-        name=RHOAI_MCP_MODEL_DEPLOYER_ROLE_NAME,
+        namespace=rhoai_mcp_namespace.name,
+        specs=[spec for spec in _MCP_PERSONA_SPECS if not persona_names or spec.name in persona_names],
         teardown=teardown_resources,
-        cluster_role=mcp_model_deployer_cluster_role.name,
-        subjects=[
-            {
-                "kind": "ServiceAccount",
-                "name": mcp_model_deployer_sa.name,
-                "namespace": rhoai_mcp_namespace.name,
-            }
-        ],
-    ) as crb:
-        yield crb
-
-
-@pytest.fixture(scope="class")
-def mcp_model_deployer_token(
-    mcp_model_deployer_sa: ServiceAccount,
-    mcp_model_deployer_crb: ClusterRoleBinding,
-) -> str:
-    """Short-lived token for the model-deployer ServiceAccount."""
-    return create_inference_token(model_service_account=mcp_model_deployer_sa)
+    ) as personas:
+        yield personas
 
 
 @pytest.fixture(scope="class")
@@ -411,84 +429,23 @@ def mcp_model_deployer_transport(
     rhoai_mcp_endpoint_url: str,
     rhoai_mcp_ca_bundle: str,
     rhoai_mcp_ready: None,
-    mcp_model_deployer_token: str,
+    mcp_personas: dict[str, McpPersona],
 ) -> StreamableHttpTransport:
     """MCP transport authenticated as the model-deployer persona."""
     return StreamableHttpTransport(
         url=rhoai_mcp_endpoint_url,
-        auth=mcp_model_deployer_token,
+        auth=mcp_personas[RHOAI_MCP_MODEL_DEPLOYER_PERSONA].token,
         verify=rhoai_mcp_ca_bundle,
     )
 
 
-# RBAC test personas – reader (get/list on ISVC/SR) and deployer (+ create on ISVC/PVC/Secrets)
-@pytest.fixture(scope="class")
-def rbac_reader_sa(
-    admin_client: DynamicClient,
-    rhoai_mcp_namespace: Namespace,
-) -> Generator[ServiceAccount, Any, Any]:
-    """ServiceAccount representing a read-only inference viewer."""
-    with ServiceAccount(
-        client=admin_client,
-        name="rhoai-mcp-reader",
-        namespace=rhoai_mcp_namespace.name,
-    ) as sa:
-        yield sa
-
-
-@pytest.fixture(scope="class")
-def rbac_reader_cluster_role(
-    admin_client: DynamicClient,
-    teardown_resources: bool,
-) -> Generator[ClusterRole, Any, Any]:
-    """ClusterRole granting get/list on InferenceServices and ServingRuntimes."""
-    with ClusterRole(
-        client=admin_client,
-        name=RHOAI_MCP_RBAC_READER_ROLE_NAME,
-        teardown=teardown_resources,
-        rules=[
-            {
-                "apiGroups": [_KSERVE_API_GROUP],
-                "resources": ["inferenceservices", "servingruntimes"],
-                "verbs": ["get", "list"],
-            },
-        ],
-    ) as cr:
-        yield cr
-
-
-@pytest.fixture(scope="class")
-def rbac_reader_crb(
-    admin_client: DynamicClient,
-    rhoai_mcp_namespace: Namespace,
-    rbac_reader_sa: ServiceAccount,
-    rbac_reader_cluster_role: ClusterRole,
-    teardown_resources: bool,
-) -> Generator[ClusterRoleBinding, Any, Any]:
-    """Bind reader SA to its ClusterRole."""
-    with ClusterRoleBinding(
-        client=admin_client,
-        name=RHOAI_MCP_RBAC_READER_ROLE_NAME,
-        teardown=teardown_resources,
-        cluster_role=rbac_reader_cluster_role.name,
-        subjects=[
-            {
-                "kind": "ServiceAccount",
-                "name": rbac_reader_sa.name,
-                "namespace": rhoai_mcp_namespace.name,
-            }
-        ],
-    ) as crb:
-        yield crb
-
-
-@pytest.fixture(scope="class")
-def rbac_reader_token(
-    rbac_reader_sa: ServiceAccount,
-    rbac_reader_crb: ClusterRoleBinding,
-) -> str:
-    """Short-lived token for the reader ServiceAccount."""
-    return create_inference_token(model_service_account=rbac_reader_sa)
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def mcp_model_deployer_session(
+    mcp_model_deployer_transport: StreamableHttpTransport,
+) -> AsyncGenerator[McpSession, Any]:
+    """MCP session authenticated as the model-deployer persona, shared by the tests of the class."""
+    async with mcp_session(transport=mcp_model_deployer_transport) as session:
+        yield session
 
 
 @pytest.fixture(scope="class")
@@ -496,93 +453,23 @@ def rbac_reader_transport(
     rhoai_mcp_endpoint_url: str,
     rhoai_mcp_ca_bundle: str,
     rhoai_mcp_ready: None,
-    rbac_reader_token: str,
+    mcp_personas: dict[str, McpPersona],
 ) -> StreamableHttpTransport:
     """MCP transport authenticated as the reader persona."""
     return StreamableHttpTransport(
         url=rhoai_mcp_endpoint_url,
-        auth=rbac_reader_token,
+        auth=mcp_personas[RHOAI_MCP_RBAC_READER_PERSONA].token,
         verify=rhoai_mcp_ca_bundle,
     )
 
 
-@pytest.fixture(scope="class")
-def rbac_deployer_sa(
-    admin_client: DynamicClient,
-    rhoai_mcp_namespace: Namespace,
-) -> Generator[ServiceAccount, Any, Any]:
-    """ServiceAccount representing a user who can also deploy models."""
-    with ServiceAccount(
-        client=admin_client,
-        name="rhoai-mcp-deployer",
-        namespace=rhoai_mcp_namespace.name,
-    ) as sa:
-        yield sa
-
-
-@pytest.fixture(scope="class")
-def rbac_deployer_cluster_role(
-    admin_client: DynamicClient,
-    teardown_resources: bool,
-) -> Generator[ClusterRole, Any, Any]:
-    """ClusterRole: read+create on ISVC, read on SR, read/create on PVCs and Secrets."""
-    with ClusterRole(
-        client=admin_client,
-        name=RHOAI_MCP_RBAC_DEPLOYER_ROLE_NAME,
-        teardown=teardown_resources,
-        rules=[
-            {
-                "apiGroups": [_KSERVE_API_GROUP],
-                "resources": ["inferenceservices"],
-                "verbs": ["get", "list", "create"],
-            },
-            {
-                "apiGroups": [_KSERVE_API_GROUP],
-                "resources": ["servingruntimes"],
-                "verbs": ["get", "list"],
-            },
-            {
-                "apiGroups": [""],
-                "resources": ["persistentvolumeclaims", "secrets"],
-                "verbs": ["get", "list", "create"],
-            },
-        ],
-    ) as cr:
-        yield cr
-
-
-@pytest.fixture(scope="class")
-def rbac_deployer_crb(
-    admin_client: DynamicClient,
-    rhoai_mcp_namespace: Namespace,
-    rbac_deployer_sa: ServiceAccount,
-    rbac_deployer_cluster_role: ClusterRole,
-    teardown_resources: bool,
-) -> Generator[ClusterRoleBinding, Any, Any]:
-    """Bind deployer SA to its ClusterRole."""
-    with ClusterRoleBinding(
-        client=admin_client,
-        name=RHOAI_MCP_RBAC_DEPLOYER_ROLE_NAME,
-        teardown=teardown_resources,
-        cluster_role=rbac_deployer_cluster_role.name,
-        subjects=[
-            {
-                "kind": "ServiceAccount",
-                "name": rbac_deployer_sa.name,
-                "namespace": rhoai_mcp_namespace.name,
-            }
-        ],
-    ) as crb:
-        yield crb
-
-
-@pytest.fixture(scope="class")
-def rbac_deployer_token(
-    rbac_deployer_sa: ServiceAccount,
-    rbac_deployer_crb: ClusterRoleBinding,
-) -> str:
-    """Short-lived token for the deployer ServiceAccount."""
-    return create_inference_token(model_service_account=rbac_deployer_sa)
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def rbac_reader_session(
+    rbac_reader_transport: StreamableHttpTransport,
+) -> AsyncGenerator[McpSession, Any]:
+    """MCP session authenticated as the reader persona, shared by the tests of the class."""
+    async with mcp_session(transport=rbac_reader_transport) as session:
+        yield session
 
 
 @pytest.fixture(scope="class")
@@ -590,11 +477,20 @@ def rbac_deployer_transport(
     rhoai_mcp_endpoint_url: str,
     rhoai_mcp_ca_bundle: str,
     rhoai_mcp_ready: None,
-    rbac_deployer_token: str,
+    mcp_personas: dict[str, McpPersona],
 ) -> StreamableHttpTransport:
     """MCP transport authenticated as the deployer persona."""
     return StreamableHttpTransport(
         url=rhoai_mcp_endpoint_url,
-        auth=rbac_deployer_token,
+        auth=mcp_personas[RHOAI_MCP_RBAC_DEPLOYER_PERSONA].token,
         verify=rhoai_mcp_ca_bundle,
     )
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def rbac_deployer_session(
+    rbac_deployer_transport: StreamableHttpTransport,
+) -> AsyncGenerator[McpSession, Any]:
+    """MCP session authenticated as the deployer persona, shared by the tests of the class."""
+    async with mcp_session(transport=rbac_deployer_transport) as session:
+        yield session
@@ -36,6 +36,11 @@ RHOAI_MCP_EXPECTED_PROMPTS: tuple[str, ...] = (
     "find-gpus",
 )
 
+# MCP test personas, see the mcp_personas fixture
+RHOAI_MCP_MODEL_DEPLOYER_PERSONA: str = "model-deployer"
+RHOAI_MCP_RBAC_READER_PERSONA: str = "rbac-reader"
+RHOAI_MCP_RBAC_DEPLOYER_PERSONA: str = "rbac-deployer"
+
 RHOAI_MCP_RBAC_READER_ROLE_NAME: str = "test-rhoai-mcp-reader"
 RHOAI_MCP_RBAC_DEPLOYER_ROLE_NAME: str = "test-rhoai-mcp-deployer"
 
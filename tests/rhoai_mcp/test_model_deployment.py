@@ -7,8 +7,6 @@ in tests/model_serving/ but driven by the rhoai-mcp server.
 """
 
 import pytest
-from fastmcp import Client
-from fastmcp.client.transports import StreamableHttpTransport
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.inference_service import InferenceService
 from ocp_resources.namespace import Namespace
@@ -17,14 +15,20 @@ from tests.rhoai_mcp.constants import (
     RHOAI_MCP_MODEL_DEPLOY_FORMAT,
     RHOAI_MCP_MODEL_DEPLOY_NAME,
     RHOAI_MCP_MODEL_DEPLOY_RUNTIME_TEMPLATE,
+    RHOAI_MCP_MODEL_DEPLOYER_PERSONA,
 )
-from tests.rhoai_mcp.utils import parse_tool_result, wait_for_model_ready
+from tests.rhoai_mcp.utils import McpSession, parse_tool_result, wait_for_model_ready
 from utilities.image_constants import SharedImages
 
 STORAGE_URI: str = SharedImages.MODELCAR_MNIST_8_1
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mcp_personas",
+    [pytest.param({"personas": [RHOAI_MCP_MODEL_DEPLOYER_PERSONA]})],
+    indirect=True,
+)
+@pytest.mark.asyncio(loop_scope="class")
 @pytest.mark.tier1
 @pytest.mark.usefixtures("mcp_model_deploy_namespace")
 class TestRhoaiMcpModelDeployment:
@@ -43,21 +47,20 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="list_runtimes")
     async def test_list_serving_runtimes(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a namespace with no existing runtimes
         When list_serving_runtimes is called with include_templates=True
         Then the OVMS kserve template is discoverable with openvino_ir support
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="list_serving_runtimes",
-                arguments={
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "include_templates": True,
-                },
-            )
+        result = await mcp_model_deployer_session.call_tool(
+            name="list_serving_runtimes",
+            arguments={
+                "namespace": mcp_model_deploy_namespace.name,
+                "include_templates": True,
+            },
+        )
         data = parse_tool_result(result=result)
 
         runtimes = data["result"]
@@ -74,22 +77,21 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="check_prereqs", depends=["list_runtimes"])
     async def test_check_deployment_prerequisites(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given the target namespace, model format, and OCI storage URI
         When check_deployment_prerequisites is called
         Then all pre-flight checks pass (namespace, runtime, storage)
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="check_deployment_prerequisites",
-                arguments={
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "model_format": RHOAI_MCP_MODEL_DEPLOY_FORMAT,
-                    "storage_uri": STORAGE_URI,
-                },
-            )
+        result = await mcp_model_deployer_session.call_tool(
+            name="check_deployment_prerequisites",
+            arguments={
+                "namespace": mcp_model_deploy_namespace.name,
+                "model_format": RHOAI_MCP_MODEL_DEPLOY_FORMAT,
+                "storage_uri": STORAGE_URI,
+            },
+        )
         data = parse_tool_result(result=result)
 
         checks = {c["name"]: c for c in data["checks"]}
@@ -101,21 +103,20 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="create_runtime", depends=["check_prereqs"])
     async def test_create_serving_runtime(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given the kserve-ovms template exists in the platform namespace
         When create_serving_runtime is called for the model deployment namespace
         Then a ServingRuntime is created that supports openvino_ir
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="create_serving_runtime",
-                arguments={
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "template_name": RHOAI_MCP_MODEL_DEPLOY_RUNTIME_TEMPLATE,
-                },
-            )
+        result = await mcp_model_deployer_session.call_tool(
+            name="create_serving_runtime",
+            arguments={
+                "namespace": mcp_model_deploy_namespace.name,
+                "template_name": RHOAI_MCP_MODEL_DEPLOY_RUNTIME_TEMPLATE,
+            },
+        )
         data = parse_tool_result(result=result)
 
         assert data.get("success") is True, f"create_serving_runtime failed: {data}"
@@ -127,37 +128,36 @@ class TestRhoaiMcpModelDeployment:
     async def test_deploy_model(
         self,
         admin_client: DynamicClient,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a namespace with an OVMS serving runtime
         When deploy_model is called with the MNIST OCI ModelCar image
         Then an InferenceService is created successfully with managed-by ownership label
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            # Discover the runtime name that was created from the template
-            rt_result = await client.call_tool(
-                name="list_serving_runtimes",
-                arguments={
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "include_templates": False,
-                },
-            )
-            rt_data = parse_tool_result(result=rt_result)
-            existing_runtimes = rt_data["result"]
-            assert existing_runtimes, "No serving runtime found in namespace after creation"
-            runtime_name = existing_runtimes[0]["name"]
-
-            result = await client.call_tool(
-                name="deploy_model",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "runtime": runtime_name,
-                    "model_format": RHOAI_MCP_MODEL_DEPLOY_FORMAT,
-                    "storage_uri": STORAGE_URI,
-                },
-            )
+        # Discover the runtime name that was created from the template
+        rt_result = await mcp_model_deployer_session.call_tool(
+            name="list_serving_runtimes",
+            arguments={
+                "namespace": mcp_model_deploy_namespace.name,
+                "include_templates": False,
+            },
+        )
+        rt_data = parse_tool_result(result=rt_result)
+        existing_runtimes = rt_data["result"]
+        assert existing_runtimes, "No serving runtime found in namespace after creation"
+        runtime_name = existing_runtimes[0]["name"]
+
+        result = await mcp_model_deployer_session.call_tool(
+            name="deploy_model",
+            arguments={
+                "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
+                "namespace": mcp_model_deploy_namespace.name,
+                "runtime": runtime_name,
+                "model_format": RHOAI_MCP_MODEL_DEPLOY_FORMAT,
+                "storage_uri": STORAGE_URI,
+            },
+        )
         data = parse_tool_result(result=result)
 
         assert data["name"] == RHOAI_MCP_MODEL_DEPLOY_NAME
@@ -176,19 +176,18 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="model_ready", depends=["deploy_model"])
     async def test_model_reaches_ready(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a newly deployed InferenceService
         When get_inference_service is polled over time
         Then the model eventually reports status Ready
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            data = await wait_for_model_ready(
-                client=client,
-                name=RHOAI_MCP_MODEL_DEPLOY_NAME,
-                namespace=mcp_model_deploy_namespace.name,
-            )
+        data = await wait_for_model_ready(
+            session=mcp_model_deployer_session,
+            name=RHOAI_MCP_MODEL_DEPLOY_NAME,
+            namespace=mcp_model_deploy_namespace.name,
+        )
 
         assert data["status"] == "Ready"
         assert data.get("model_format") == RHOAI_MCP_MODEL_DEPLOY_FORMAT
@@ -197,52 +196,44 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="endpoint_accessible", depends=["model_ready"])
     async def test_model_endpoint_accessible(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a model that has reached Ready status
         When get_model_endpoint and test_model_endpoint are called
         Then the endpoint URL is populated and the model is accessible
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            endpoint_result = await client.call_tool(
-                name="get_model_endpoint",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                },
-            )
-            endpoint_data = parse_tool_result(result=endpoint_result)
-
-            assert endpoint_data["status"] == "Ready"
-            assert endpoint_data.get("url"), "Model endpoint URL is empty"
-
-            test_result = await client.call_tool(
-                name="test_model_endpoint",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                },
-            )
-            test_data = parse_tool_result(result=test_result)
+        model_arguments = {
+            "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
+            "namespace": mcp_model_deploy_namespace.name,
+        }
+        # Both tools are read-only, issue them concurrently on the shared session
+        endpoint_result, test_result = await mcp_model_deployer_session.call_tools(
+            calls=[("get_model_endpoint", model_arguments), ("test_model_endpoint", model_arguments)]
+        )
+        endpoint_data = parse_tool_result(result=endpoint_result)
+
+        assert endpoint_data["status"] == "Ready"
+        assert endpoint_data.get("url"), "Model endpoint URL is empty"
+
+        test_data = parse_tool_result(result=test_result)
 
         assert test_data["accessible"] is True, f"Model endpoint not accessible: {test_data.get('issues')}"
 
     @pytest.mark.dependency(depends=["model_ready"])
     async def test_model_appears_in_listing(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a deployed and ready model
         When list_inference_services is called for the namespace
         Then the model appears in the listing with Ready status
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="list_inference_services",
-                arguments={"namespace": mcp_model_deploy_namespace.name},
-            )
+        result = await mcp_model_deployer_session.call_tool(
+            name="list_inference_services",
+            arguments={"namespace": mcp_model_deploy_namespace.name},
+        )
         data = parse_tool_result(result=result)
 
         items = data.get("items", [])
@@ -257,56 +248,54 @@ class TestRhoaiMcpModelDeployment:
     @pytest.mark.dependency(name="delete_no_confirm", depends=["model_ready"])
     async def test_delete_inference_service_without_confirm(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a deployed model with managed-by ownership label
         When delete_inference_service is called without confirm
         Then the deletion is rejected and the model is not deleted
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="delete_inference_service",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                },
-            )
-            data = parse_tool_result(result=result)
-
-            assert "error" in data, f"Expected error response when confirm is not passed, got: {data}"
-            assert "confirm" in data.get("message", "").lower(), f"Expected confirmation prompt in message, got: {data}"
-
-            verify_result = await client.call_tool(
-                name="get_inference_service",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                },
-            )
-            verify_data = parse_tool_result(result=verify_result)
+        result = await mcp_model_deployer_session.call_tool(
+            name="delete_inference_service",
+            arguments={
+                "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
+                "namespace": mcp_model_deploy_namespace.name,
+            },
+        )
+        data = parse_tool_result(result=result)
+
+        assert "error" in data, f"Expected error response when confirm is not passed, got: {data}"
+        assert "confirm" in data.get("message", "").lower(), f"Expected confirmation prompt in message, got: {data}"
+
+        verify_result = await mcp_model_deployer_session.call_tool(
+            name="get_inference_service",
+            arguments={
+                "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
+                "namespace": mcp_model_deploy_namespace.name,
+            },
+        )
+        verify_data = parse_tool_result(result=verify_result)
 
         assert verify_data["status"] == "Ready", "Model should still be Ready after rejected deletion"
 
     @pytest.mark.dependency(depends=["delete_no_confirm"])
     async def test_delete_inference_service(
         self,
-        mcp_model_deployer_transport: StreamableHttpTransport,
+        mcp_model_deployer_session: McpSession,
         mcp_model_deploy_namespace: Namespace,
     ) -> None:
         """Given a deployed model with managed-by ownership label
         When delete_inference_service is called with confirm=True
         Then the model is deleted successfully
         """
-        async with Client(mcp_model_deployer_transport) as client:
-            result = await client.call_tool(
-                name="delete_inference_service",
-                arguments={
-                    "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
-                    "namespace": mcp_model_deploy_namespace.name,
-                    "confirm": True,
-                },
-            )
+        result = await mcp_model_deployer_session.call_tool(
+            name="delete_inference_service",
+            arguments={
+                "name": RHOAI_MCP_MODEL_DEPLOY_NAME,
+                "namespace": mcp_model_deploy_namespace.name,
+                "confirm": True,
+            },
+        )
         data = parse_tool_result(result=result)
 
         assert data["deleted"] is True
@@ -6,8 +6,6 @@ SubjectAccessReview checks at both ListToolsRequest and CallToolRequest time.
 """
 
 import pytest
-from fastmcp import Client
-from fastmcp.client.transports import StreamableHttpTransport
 from fastmcp.exceptions import ToolError
 
 from tests.rhoai_mcp.constants import (
@@ -16,10 +14,18 @@ from tests.rhoai_mcp.constants import (
     RHOAI_MCP_INFERENCE_READ_TOOLS,
     RHOAI_MCP_INFERENCE_RESTRICTED_TOOLS,
     RHOAI_MCP_NAMESPACE,
+    RHOAI_MCP_RBAC_DEPLOYER_PERSONA,
+    RHOAI_MCP_RBAC_READER_PERSONA,
 )
+from tests.rhoai_mcp.utils import McpSession
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mcp_personas",
+    [pytest.param({"personas": [RHOAI_MCP_RBAC_READER_PERSONA, RHOAI_MCP_RBAC_DEPLOYER_PERSONA]})],
+    indirect=True,
+)
+@pytest.mark.asyncio(loop_scope="class")
 @pytest.mark.tier1
 class TestRhoaiMcpRbac:
     """Verify rhoai-mcp filters MCP tools based on Kubernetes RBAC permissions.
@@ -33,28 +39,27 @@ class TestRhoaiMcpRbac:
 
     async def test_reader_sees_read_tools_only(
         self,
-        rbac_reader_transport: StreamableHttpTransport,
+        rbac_reader_session: McpSession,
     ) -> None:
         """Given a user with get/list access to InferenceServices and ServingRuntimes
         When tools/list is called via an MCP client authenticated as that user
         Then the response includes read-only inference tools and catalog tools
         And the response excludes tools that require create or delete permissions
         """
-        async with Client(rbac_reader_transport) as client:
-            tools = await client.list_tools()
-            tool_names = {tool.name for tool in tools}
+        tools = await rbac_reader_session.list_tools()
+        tool_names = {tool.name for tool in tools}
 
-            expected_visible = set(RHOAI_MCP_INFERENCE_READ_TOOLS) | set(RHOAI_MCP_EXPECTED_CATALOG_TOOLS)
-            missing = expected_visible - tool_names
-            assert not missing, f"Read/catalog tools not visible to reader: {missing}"
+        expected_visible = set(RHOAI_MCP_INFERENCE_READ_TOOLS) | set(RHOAI_MCP_EXPECTED_CATALOG_TOOLS)
+        missing = expected_visible - tool_names
+        assert not missing, f"Read/catalog tools not visible to reader: {missing}"
 
-            expected_hidden = set(RHOAI_MCP_INFERENCE_DEPLOY_TOOLS) | set(RHOAI_MCP_INFERENCE_RESTRICTED_TOOLS)
-            leaked = expected_hidden & tool_names
-            assert not leaked, f"Write tools should be hidden from reader: {leaked}"
+        expected_hidden = set(RHOAI_MCP_INFERENCE_DEPLOY_TOOLS) | set(RHOAI_MCP_INFERENCE_RESTRICTED_TOOLS)
+        leaked = expected_hidden & tool_names
+        assert not leaked, f"Write tools should be hidden from reader: {leaked}"
 
     async def test_reader_cannot_call_deploy_tool(
         self,
-        rbac_reader_transport: StreamableHttpTransport,
+        rbac_reader_session: McpSession,
     ) -> None:
         """Given a user with only get/list access to InferenceServices
         When tools/call is invoked for deploy_model by that user
@@ -63,40 +68,38 @@ class TestRhoaiMcpRbac:
         Note: deploy_model is not advertised to the Reader Persona
         yet invoked manually to prove RBAC checks are enforced in MCP
         """
-        async with Client(rbac_reader_transport) as client:
-            with pytest.raises(ToolError, match=r"deploy_model.*not permitted for the current user"):
-                await client.call_tool(
-                    name="deploy_model",
-                    arguments={
-                        "name": "rbac-denied-test",
-                        "namespace": RHOAI_MCP_NAMESPACE,
-                        "runtime": "vllm-runtime",
-                        "model_format": "vLLM",
-                        "storage_uri": "hf://instructlab/granite-7b-lab",
-                    },
-                )
+        with pytest.raises(ToolError, match=r"deploy_model.*not permitted for the current user"):
+            await rbac_reader_session.call_tool(
+                name="deploy_model",
+                arguments={
+                    "name": "rbac-denied-test",
+                    "namespace": RHOAI_MCP_NAMESPACE,
+                    "runtime": "vllm-runtime",
+                    "model_format": "vLLM",
+                    "storage_uri": "hf://instructlab/granite-7b-lab",
+                },
+            )
 
     async def test_deployer_sees_read_and_deploy_tools(
         self,
-        rbac_deployer_transport: StreamableHttpTransport,
+        rbac_deployer_session: McpSession,
     ) -> None:
         """Given a user with read+create on ISVC, read on SR, read+create on PVCs/Secrets
         When tools/list is called via an MCP client authenticated as that user
         Then the response includes read-only inference tools, deploy/prepare tools, and catalog tools
         And the response still excludes delete and create serving runtime tools
         """
-        async with Client(rbac_deployer_transport) as client:
-            tools = await client.list_tools()
-            tool_names = {tool.name for tool in tools}
+        tools = await rbac_deployer_session.list_tools()
+        tool_names = {tool.name for tool in tools}
 
-            expected_visible = (
-                set(RHOAI_MCP_INFERENCE_READ_TOOLS)
-                | set(RHOAI_MCP_INFERENCE_DEPLOY_TOOLS)
-                | set(RHOAI_MCP_EXPECTED_CATALOG_TOOLS)
-            )
-            missing = expected_visible - tool_names
-            assert not missing, f"Expected tools not visible to deployer: {missing}"
+        expected_visible = (
+            set(RHOAI_MCP_INFERENCE_READ_TOOLS)
+            | set(RHOAI_MCP_INFERENCE_DEPLOY_TOOLS)
+            | set(RHOAI_MCP_EXPECTED_CATALOG_TOOLS)
+        )
+        missing = expected_visible - tool_names
+        assert not missing, f"Expected tools not visible to deployer: {missing}"
 
-            expected_hidden = set(RHOAI_MCP_INFERENCE_RESTRICTED_TOOLS)
-            leaked = expected_hidden & tool_names
-            assert not leaked, f"Delete/create-runtime tools should be hidden from deployer: {leaked}"
+        expected_hidden = set(RHOAI_MCP_INFERENCE_RESTRICTED_TOOLS)
+        leaked = expected_hidden & tool_names
+        assert not leaked, f"Delete/create-runtime tools should be hidden from deployer: {leaked}"
@@ -1,10 +1,23 @@
+import asyncio
 import copy
 import json
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import requests
+import structlog
 from fastmcp import Client
+from fastmcp.client.client import CallToolResult
+from fastmcp.client.transports import StreamableHttpTransport
 from kubernetes.dynamic import DynamicClient
+from mcp.types import InitializeResult, Prompt, Tool
+from ocp_resources.cluster_role import ClusterRole
+from ocp_resources.cluster_role_binding import ClusterRoleBinding
+from ocp_resources.resource import Resource as OcpResource
+from ocp_resources.service_account import ServiceAccount
 from pytest_testconfig import config as py_config
 from tenacity import retry as tenacity_retry
 from tenacity import retry_if_not_result, stop_after_delay, wait_exponential
@@ -18,7 +31,10 @@ from tests.rhoai_mcp.constants import (
     RHOAI_MCP_RHOAI_VERSION,
 )
 from tests.rhoai_mcp.image_constants import RhoaiMcpImages
-from utilities.infra import is_disconnected_cluster
+from utilities.infra import create_inference_token, is_disconnected_cluster
+from utilities.user_utils import get_token_client
+
+LOGGER = structlog.get_logger(name=__name__)
 
 _RETRY_EXCEPTIONS: dict[type, list] = {
     requests.exceptions.ConnectTimeout: [],
@@ -104,12 +120,192 @@ _DEPLOYMENT_TEMPLATE: dict[str, Any] = {
 }
 
 
+@dataclass(frozen=True)
+class McpPersonaSpec:
+    """Declarative MCP test persona: a ServiceAccount bound to a ClusterRole with *rules*."""
+
+    name: str
+    service_account_name: str
+    role_name: str
+    rules: tuple[dict[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class McpPersona:
+    """Provisioned MCP test persona."""
+
+    spec: McpPersonaSpec
+    service_account: ServiceAccount
+    token: str
+    client: DynamicClient
+
+
+def get_persona_access_reviews(persona: McpPersona) -> list[dict[str, str]]:
+    """Expand the persona rules into one resourceAttributes dict per (apiGroup, resource, verb)."""
+    return [
+        {"group": api_group, "resource": resource, "verb": verb}
+        for rule in persona.spec.rules
+        for api_group in rule["apiGroups"]
+        for resource in rule["resources"]
+        for verb in rule["verbs"]
+    ]
+
+
+def is_persona_access_allowed(persona: McpPersona, resource_attributes: dict[str, str]) -> bool:
+    """Run a SelfSubjectAccessReview authenticated as *persona*."""
+    review = persona.client.resources.get(api_version="authorization.k8s.io/v1", kind="SelfSubjectAccessReview").create(
+        body={
+            "apiVersion": "authorization.k8s.io/v1",
+            "kind": "SelfSubjectAccessReview",
+            "spec": {"resourceAttributes": resource_attributes},
+        }
+    )
+    return bool(review.status.allowed)
+
+
+@retry(wait_timeout=60, sleep=2)
+def verify_mcp_personas_access(personas: dict[str, McpPersona]) -> bool:
+    """Verify every persona is granted every rule of its spec, with one concurrent batch of reviews.
+
+    Retried until RBAC propagates the new ClusterRoleBindings.
+
+    Raises:
+        TimeoutExpiredError: if a permission is still denied when the retry window is exhausted.
+    """
+    reviews = [
+        (persona, resource_attributes)
+        for persona in personas.values()
+        for resource_attributes in get_persona_access_reviews(persona=persona)
+    ]
+    with ThreadPoolExecutor(max_workers=len(reviews)) as executor:
+        allowed = executor.map(
+            lambda review: is_persona_access_allowed(persona=review[0], resource_attributes=review[1]),
+            reviews,
+        )
+        denied = [
+            f"{persona.spec.name}: {resource_attributes}"
+            for (persona, resource_attributes), is_allowed in zip(reviews, allowed)
+            if not is_allowed
+        ]
+
+    if denied:
+        LOGGER.warning(f"MCP personas permissions not granted yet: {denied}")
+        return False
+
+    return True
+
+
+@contextmanager
+def create_mcp_personas(
+    client: DynamicClient,
+    namespace: str,
+    specs: list[McpPersonaSpec],
+    teardown: bool = True,
+) -> Generator[dict[str, McpPersona], Any, Any]:
+    """Provision MCP test personas in one concurrent pass.
+
+    All ServiceAccounts, ClusterRoles and ClusterRoleBindings are applied concurrently (a binding does not
+    need its subjects or role to exist), tokens are minted concurrently and every persona's permissions are
+    checked with one batch of SelfSubjectAccessReviews, through a token client built once per persona.
+
+    Args:
+        client (DynamicClient): admin client.
+        namespace (str): namespace of the personas ServiceAccounts.
+        specs (list[McpPersonaSpec]): personas to provision.
+        teardown (bool): whether to delete the cluster-scoped roles and bindings on exit.
+
+    Yields:
+        dict[str, McpPersona]: persona name to provisioned persona.
+    """
+    service_accounts = {
+        spec.name: ServiceAccount(client=client, name=spec.service_account_name, namespace=namespace) for spec in specs
+    }
+    resources: list[OcpResource] = [*service_accounts.values()]
+    for spec in specs:
+        resources.extend([
+            ClusterRole(client=client, name=spec.role_name, teardown=teardown, rules=list(spec.rules)),
+            ClusterRoleBinding(
+                client=client,
+                name=spec.role_name,
+                teardown=teardown,
+                cluster_role=spec.role_name,
+                subjects=[{"kind": "ServiceAccount", "name": spec.service_account_name, "namespace": namespace}],
+            ),
+        ])
+
+    with ExitStack() as stack:
+        with ThreadPoolExecutor(max_workers=len(resources)) as executor:
+            # enter_context only appends to the stack, which is safe from concurrent threads
+            list(executor.map(stack.enter_context, resources))
+            tokens = list(
+                executor.map(
+                    lambda spec: create_inference_token(model_service_account=service_accounts[spec.name]), specs
+                )
+            )
+
+        personas = {
+            spec.name: McpPersona(
+                spec=spec,
+                service_account=service_accounts[spec.name],
+                token=token,
+                client=get_token_client(client=client, token=token),
+            )
+            for spec, token in zip(specs, tokens)
+        }
+        verify_mcp_personas_access(personas=personas)
+        LOGGER.info(f"Provisioned MCP personas: {list(personas)}")
+        yield personas
+
+
 @retry(wait_timeout=120, sleep=5, exceptions_dict=_RETRY_EXCEPTIONS)
 def probe_health(url: str, ca_bundle_file: str) -> requests.Response:
     """GET the health endpoint, retrying on transient network failures."""
     return requests.get(url, verify=ca_bundle_file, timeout=10)
 
 
+class McpSession:
+    """Long-lived MCP client session shared by all tests of one persona.
+
+    The TLS connection, ``initialize`` exchange and capability negotiation happen once;
+    ``list_tools``/``list_prompts`` results are cached for the session.
+    """
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self._tools: list[Tool] | None = None
+        self._prompts: list[Prompt] | None = None
+
+    @property
+    def initialize_result(self) -> InitializeResult:
+        return self.client.initialize_result
+
+    async def list_tools(self) -> list[Tool]:
+        if self._tools is None:
+            self._tools = await self.client.list_tools()
+        return self._tools
+
+    async def list_prompts(self) -> list[Prompt]:
+        if self._prompts is None:
+            self._prompts = await self.client.list_prompts()
+        return self._prompts
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        return await self.client.call_tool(name=name, arguments=arguments)
+
+    async def call_tools(self, calls: list[tuple[str, dict[str, Any]]]) -> list[CallToolResult]:
+        """Issue independent tool calls concurrently over the session, results in ``calls`` order."""
+        return list(
+            await asyncio.gather(*(self.call_tool(name=name, arguments=arguments) for name, arguments in calls))
+        )
+
+
+@asynccontextmanager
+async def mcp_session(transport: StreamableHttpTransport) -> AsyncGenerator[McpSession, Any]:
+    """Open an MCP client session over *transport* for the lifetime of the context."""
+    async with Client(transport) as client:
+        yield McpSession(client=client)
+
+
 def parse_tool_result(result: object) -> dict:
     """Parse the JSON payload from a call_tool response."""
     return json.loads(result.content[0].text)
@@ -120,9 +316,9 @@ def parse_tool_result(result: object) -> dict:
     wait=wait_exponential(min=5, max=30),
     retry=retry_if_not_result(lambda data: data.get("status") == "Ready"),
 )
-async def wait_for_model_ready(client: Client, name: str, namespace: str) -> dict:
-    """Poll get_inference_service until the model reports Ready or timeout."""
-    result = await client.call_tool(
+async def wait_for_model_ready(session: McpSession, name: str, namespace: str) -> dict:
+    """Poll get_inference_service over the shared session until the model reports Ready or timeout."""
+    result = await session.call_tool(
         name="get_inference_service",
         arguments={"name": name, "namespace": namespace},
     )
@@ -15,8 +15,10 @@ from ocp_resources.role_binding import RoleBinding
 from ocp_resources.service_account import ServiceAccount
 
 from tests.spark.upgrade.utils import (
+    SparkApplicationSnapshot,
     capture_spark_application_baseline,
     create_spark_pi_application_spec,
+    get_spark_application_snapshot,
     load_baseline_from_configmap,
     save_baseline_to_configmap,
 )
@@ -324,6 +326,15 @@ def new_spark_application_fixture(
             spark_app.clean_up()
 
 
+@pytest.fixture(scope="class")
+def spark_application_snapshot(
+    admin_client: DynamicClient,
+    spark_application_fixture: SparkApplication,
+) -> SparkApplicationSnapshot:
+    """Snapshot of the SparkApplication and its pods, shared by the post-upgrade checks of the class."""
+    return get_spark_application_snapshot(client=admin_client, spark_app=spark_application_fixture)
+
+
 def _capture_and_save_baseline(
     pytestconfig: pytest.Config,
     admin_client: DynamicClient,
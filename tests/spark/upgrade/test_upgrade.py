@@ -8,6 +8,7 @@ import pytest
 
 from tests.spark.upgrade.utils import (
     get_spark_app_baseline,
+    get_spark_application_snapshot,
     verify_pods_not_restarted,
     verify_spark_app_completed,
     verify_spark_app_generation,
@@ -51,16 +52,16 @@ class TestPostUpgradeSpark:
     @pytest.mark.dependency(depends=["spark_app_exists"])
     def test_spark_application_post_upgrade_not_modified(
         self,
-        spark_application_fixture,
+        spark_application_snapshot,
         spark_upgrade_baseline_fixture,
     ):
         """Test that SparkApplication is not modified during upgrade"""
         baseline = get_spark_app_baseline(
             baselines=spark_upgrade_baseline_fixture,
-            spark_app_name=spark_application_fixture.name,
+            spark_app_name=spark_application_snapshot.name,
         )
         verify_spark_app_generation(
-            spark_app=spark_application_fixture,
+            snapshot=spark_application_snapshot,
             expected_generation=baseline["generation"],
         )
 
@@ -68,26 +69,27 @@ class TestPostUpgradeSpark:
     @pytest.mark.dependency(depends=["spark_app_exists"])
     def test_spark_application_post_upgrade_pods_not_restarted(
         self,
-        admin_client,
-        spark_application_fixture,
+        spark_application_snapshot,
         spark_upgrade_baseline_fixture,
     ):
         """Verify SparkApplication pods have not restarted beyond pre-upgrade baseline"""
         baseline = get_spark_app_baseline(
             baselines=spark_upgrade_baseline_fixture,
-            spark_app_name=spark_application_fixture.name,
+            spark_app_name=spark_application_snapshot.name,
         )
         verify_pods_not_restarted(
-            client=admin_client,
-            spark_app=spark_application_fixture,
+            snapshot=spark_application_snapshot,
             baseline_restart_counts=baseline["pod_restart_counts"],
         )
 
     @pytest.mark.post_upgrade
     @pytest.mark.dependency(depends=["spark_app_exists"])
-    def test_spark_application_post_upgrade_still_completed(self, spark_application_fixture):
+    def test_spark_application_post_upgrade_still_completed(self, spark_application_snapshot):
         """Test that SparkApplication is still in COMPLETED state after upgrade"""
-        verify_spark_app_completed(spark_app=spark_application_fixture)
+        assert spark_application_snapshot.application_state == "COMPLETED", (
+            f"SparkApplication {spark_application_snapshot.name} not in COMPLETED state. "
+            f"Actual: {spark_application_snapshot.application_state}"
+        )
 
 
 @pytest.mark.usefixtures("post_upgrade_spark_dsc_patch")
@@ -115,9 +117,9 @@ class TestPostUpgradeNewSparkApplication:
 
     @pytest.mark.post_upgrade
     @pytest.mark.dependency(depends=["new_spark_app_execution"])
-    def test_new_spark_application_post_upgrade_generation(self, new_spark_application_fixture):
+    def test_new_spark_application_post_upgrade_generation(self, admin_client, new_spark_application_fixture):
         """Verify newly created SparkApplication has generation=1 (fresh resource, after execution)"""
         verify_spark_app_generation(
-            spark_app=new_spark_application_fixture,
+            snapshot=get_spark_application_snapshot(client=admin_client, spark_app=new_spark_application_fixture),
             expected_generation=1,
         )
@@ -1,11 +1,16 @@
 """Utility functions for Spark upgrade tests."""
 
+import time
+from dataclasses import dataclass
+from typing import Any
+
 import structlog
 import yaml
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.config_map import ConfigMap
 from ocp_resources.pod import Pod
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
+from urllib3.exceptions import ProtocolError
 
 from tests.spark.image_constants import SparkImages
 from utilities.resources.spark_application import SparkApplication
@@ -15,6 +20,13 @@ LOGGER = structlog.get_logger(name=__name__)
 UPGRADE_BASELINE_CONFIGMAP = "spark-upgrade-baseline"
 SPARK_VERSION = "4.0.1"
 SPARK_IMAGE = SparkImages.DATA_PROCESSING
+SPARK_APP_NAME_LABEL = "sparkoperator.k8s.io/app-name"
+SPARK_ROLE_LABEL = "spark-role"
+
+
+def get_spark_application_state(spark_app: dict[str, Any]) -> str | None:
+    """Get the application state of a raw SparkApplication, None if it has no status yet."""
+    return (spark_app.get("status") or {}).get("applicationState", {}).get("state")
 
 
 def wait_for_spark_application_state(
@@ -24,6 +36,9 @@ def wait_for_spark_application_state(
 ) -> None:
     """Wait for SparkApplication to reach expected state.
 
+    The application is fetched once, then followed through a name-selected watch so the wait returns as soon
+    as the operator reports the state, instead of re-fetching the application every poll interval.
+
     Args:
         spark_app: SparkApplication resource
         expected_state: Expected application state (e.g., "COMPLETED", "RUNNING")
@@ -34,34 +49,94 @@ def wait_for_spark_application_state(
     """
     LOGGER.info(f"Waiting for SparkApplication {spark_app.name} to reach state {expected_state}")
 
-    def _get_state():
-        """Get application state, handling None status."""
-        status = spark_app.instance.status
-        if status is None:
-            return None
-        return status.get("applicationState", {}).get("state")
-
-    sampler = TimeoutSampler(
-        wait_timeout=timeout,
-        sleep=5,
-        func=_get_state,
+    deadline = time.monotonic() + timeout
+    current_state: str | None = None
+    while (remaining := int(deadline - time.monotonic())) > 0:
+        raw_app = spark_app.api.get(name=spark_app.name, namespace=spark_app.namespace).to_dict()
+        if (current_state := get_spark_application_state(spark_app=raw_app)) == expected_state:
+            LOGGER.info(f"SparkApplication {spark_app.name} reached state {expected_state}")
+            return
+
+        try:
+            for event in spark_app.api.watch(
+                namespace=spark_app.namespace,
+                field_selector=f"metadata.name={spark_app.name}",
+                resource_version=raw_app["metadata"]["resourceVersion"],
+                timeout=remaining,
+            ):
+                if event["type"] == "ERROR":
+                    # 410 Gone: the resource version is too old, re-fetch and watch again
+                    break
+
+                if (current_state := get_spark_application_state(spark_app=event["raw_object"])) == expected_state:
+                    LOGGER.info(f"SparkApplication {spark_app.name} reached state {expected_state}")
+                    return
+
+        except ConnectionError, TimeoutError, ProtocolError:
+            time.sleep(1)
+
+    raise TimeoutExpiredError(
+        f"SparkApplication {spark_app.name} did not reach {expected_state} state within {timeout}s. "
+        f"Current state: {current_state or 'No status yet'}"
     )
 
-    try:
-        for state in sampler:
-            if state == expected_state:
-                LOGGER.info(f"SparkApplication {spark_app.name} reached state {expected_state}")
-                return
-    except TimeoutExpiredError:
-        status = spark_app.instance.status
-        if status is None:
-            current_state = "No status yet"
-        else:
-            current_state = status.get("applicationState", {}).get("state", "UNKNOWN")
-        raise TimeoutExpiredError(
-            f"SparkApplication {spark_app.name} did not reach {expected_state} state within {timeout}s. "
-            f"Current state: {current_state}"
+
+@dataclass(frozen=True)
+class SparkApplicationSnapshot:
+    """Point-in-time state of a SparkApplication and its driver/executor pods."""
+
+    name: str
+    generation: int
+    application_state: str | None
+    pod_restart_counts: dict[str, int]
+    pod_roles: dict[str, str]
+
+    def to_baseline(self) -> dict:
+        """Return the snapshot as the baseline dict persisted to the baseline ConfigMap."""
+        return {
+            "spark_app_name": self.name,
+            "generation": self.generation,
+            "pod_restart_counts": self.pod_restart_counts,
+            "application_state": self.application_state,
+        }
+
+
+def get_spark_application_snapshot(client: DynamicClient, spark_app: SparkApplication) -> SparkApplicationSnapshot:
+    """Capture the SparkApplication and all its pods with one GET and one label-selected list.
+
+    Args:
+        client: Kubernetes client
+        spark_app: SparkApplication resource
+
+    Returns:
+        SparkApplicationSnapshot: the application generation and state, and its pods restart counts and roles
+    """
+    raw_app = spark_app.api.get(name=spark_app.name, namespace=spark_app.namespace).to_dict()
+    pods = [
+        pod.to_dict()
+        for pod in Pod.get(
+            client=client,
+            namespace=spark_app.namespace,
+            label_selector=f"{SPARK_APP_NAME_LABEL}={spark_app.name}",
+            raw=True,
         )
+    ]
+
+    return SparkApplicationSnapshot(
+        name=spark_app.name,
+        generation=raw_app["metadata"]["generation"],
+        application_state=get_spark_application_state(spark_app=raw_app),
+        pod_restart_counts={
+            pod["metadata"]["name"]: sum(
+                container_status.get("restartCount", 0)
+                for container_status in (pod.get("status") or {}).get("containerStatuses", [])
+            )
+            for pod in pods
+        },
+        pod_roles={
+            pod["metadata"]["name"]: pod["metadata"].get("labels", {}).get(SPARK_ROLE_LABEL, "unknown") for pod in pods
+        },
+    )
 
 
 def create_spark_pi_application_spec(
@@ -148,33 +223,8 @@ def capture_spark_application_baseline(
     """
     LOGGER.info(f"Capturing baseline for SparkApplication {spark_app.name}")
 
-    # Wait for application to complete and get metadata generation
     wait_for_spark_application_state(spark_app=spark_app, expected_state="COMPLETED", timeout=300)
-    generation = spark_app.instance.metadata.generation
-
-    # Get pod restart counts
-    pod_restart_counts = {}
-    pods = list(
-        Pod.get(
-            dyn_client=client,
-            namespace=spark_app.namespace,
-            label_selector=f"sparkoperator.k8s.io/app-name={spark_app.name}",
-        )
-    )
-
-    for pod in pods:
-        restart_count = sum(
-            container_status.get("restartCount", 0)
-            for container_status in pod.instance.status.get("containerStatuses", [])
-        )
-        pod_restart_counts[pod.name] = restart_count
-
-    baseline = {
-        "spark_app_name": spark_app.name,
-        "generation": generation,
-        "pod_restart_counts": pod_restart_counts,
-        "application_state": spark_app.instance.status.get("applicationState", {}).get("state"),
-    }
+    baseline = get_spark_application_snapshot(client=client, spark_app=spark_app).to_baseline()
 
     LOGGER.info(f"Baseline captured: {baseline}")
     return baseline
@@ -266,13 +316,13 @@ def get_spark_app_baseline(baselines: dict, spark_app_name: str) -> dict:
 
 
 def verify_spark_app_generation(
-    spark_app: SparkApplication,
+    snapshot: SparkApplicationSnapshot,
     expected_generation: int,
 ) -> None:
     """Verify SparkApplication metadata generation has not changed.
 
     Args:
-        spark_app: SparkApplication resource
+        snapshot: SparkApplication snapshot
         expected_generation: Expected metadata generation
 
     Raises:
@@ -282,13 +332,11 @@ def verify_spark_app_generation(
         Uses metadata.generation (set by Kubernetes) instead of status.observedGeneration
         because Spark Operator doesn't populate observedGeneration in the status.
     """
-    actual_generation = spark_app.instance.metadata.generation
-
-    assert actual_generation == expected_generation, (
-        f"SparkApplication {spark_app.name} generation changed during upgrade. "
-        f"Expected: {expected_generation}, Actual: {actual_generation}"
+    assert snapshot.generation == expected_generation, (
+        f"SparkApplication {snapshot.name} generation changed during upgrade. "
+        f"Expected: {expected_generation}, Actual: {snapshot.generation}"
     )
-    LOGGER.info(f"SparkApplication {spark_app.name} generation verified: {actual_generation}")
+    LOGGER.info(f"SparkApplication {snapshot.name} generation verified: {snapshot.generation}")
 
 
 def verify_spark_app_completed(spark_app: SparkApplication) -> None:
@@ -298,54 +346,38 @@ def verify_spark_app_completed(spark_app: SparkApplication) -> None:
         spark_app: SparkApplication resource
 
     Raises:
-        AssertionError: If application is not in COMPLETED state
+        TimeoutExpiredError: If application does not reach COMPLETED state
     """
     wait_for_spark_application_state(spark_app=spark_app, expected_state="COMPLETED", timeout=300)
-    state = spark_app.instance.status.get("applicationState", {}).get("state")
-    assert state == "COMPLETED", f"SparkApplication {spark_app.name} not in COMPLETED state. Actual: {state}"
     LOGGER.info(f"SparkApplication {spark_app.name} is in COMPLETED state")
 
 
 def verify_pods_not_restarted(
-    client: DynamicClient,
-    spark_app: SparkApplication,
+    snapshot: SparkApplicationSnapshot,
     baseline_restart_counts: dict,
 ) -> None:
     """Verify pods have not restarted beyond baseline.
 
     Args:
-        client: Kubernetes client
-        spark_app: SparkApplication resource
+        snapshot: SparkApplication snapshot
         baseline_restart_counts: Baseline restart counts per pod
 
     Raises:
         AssertionError: If any pod has restarted beyond baseline
     """
-    pods = list(
-        Pod.get(
-            dyn_client=client,
-            namespace=spark_app.namespace,
-            label_selector=f"sparkoperator.k8s.io/app-name={spark_app.name}",
-        )
-    )
-
     # Verify pod identity continuity
     baseline_pods = set(baseline_restart_counts.keys())
-    current_pods = {pod.name for pod in pods}
+    current_pods = set(snapshot.pod_restart_counts.keys())
     assert current_pods == baseline_pods, (
         f"Pod set changed during upgrade. Baseline: {sorted(baseline_pods)}, Current: {sorted(current_pods)}"
     )
 
-    for pod in pods:
-        current_restart_count = sum(
-            container_status.get("restartCount", 0)
-            for container_status in pod.instance.status.get("containerStatuses", [])
-        )
-
-        baseline_count = baseline_restart_counts[pod.name]
+    for pod_name, current_restart_count in snapshot.pod_restart_counts.items():
+        baseline_count = baseline_restart_counts[pod_name]
 
         assert current_restart_count <= baseline_count, (
-            f"Pod {pod.name} restarted during upgrade. Baseline: {baseline_count}, Current: {current_restart_count}"
+            f"Pod {pod_name} ({snapshot.pod_roles[pod_name]}) restarted during upgrade. "
+            f"Baseline: {baseline_count}, Current: {current_restart_count}"
         )
 
-    LOGGER.info(f"All pods for SparkApplication {spark_app.name} have not restarted beyond baseline")
+    LOGGER.info(f"All pods for SparkApplication {snapshot.name} have not restarted beyond baseline")
@@ -0,0 +1,317 @@
+import functools
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+import structlog
+from _pytest.reports import TestReport
+from _pytest.terminal import TerminalReporter
+from kubernetes.client import ApiClient
+from pytest import CallInfo, Config, Item, Session
+
+LOGGER = structlog.get_logger(name=__name__)
+
+# Per-test API calls of passing runs, recorded with --api-call-update-baseline
+API_CALL_BASELINE_PATH = os.getenv(
+    "PYTEST_API_CALL_BASELINE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "api-call-baseline.json"),
+)
+API_CALL_USER_PROPERTY = "api_calls"
+API_CALL_SUMMARY_TOP = 20
+# Calls made outside any test, e.g. session fixtures set up during collection
+SESSION_SCOPE = "<session>"
+
+_API_GROUP_VERSION_PREFIX = re.compile(r"^/(?:api/[^/]+|apis/[^/]+/[^/]+)(?:/|$)")
+
+
+def get_api_call_key(method: str, resource_path: str, query_params: Any) -> tuple[str, str]:
+    """
+    Get the Kubernetes audit-like verb and the resource of an API request.
+
+    Args:
+        method (str): HTTP method.
+        resource_path (str): request path, e.g. `/apis/serving.kserve.io/v1beta1/namespaces/ns/inferenceservices/name`.
+        query_params (Any): request query params, a list of tuples or a dict.
+
+    Returns:
+        tuple[str, str]: verb (get, list, watch, create, update, patch, delete, deletecollection) and resource,
+            including the subresource (e.g. `pods/log`); discovery requests are accounted as `discovery`.
+
+    """
+    path = resource_path.split("?", maxsplit=1)[0]
+    if not (match := _API_GROUP_VERSION_PREFIX.match(path)):
+        return method.lower(), "discovery"
+
+    parts = [part for part in path[match.end() :].split("/") if part]
+    if len(parts) > 2 and parts[0] == "namespaces":
+        parts = parts[2:]
+
+    if not parts:
+        return method.lower(), "discovery"
+
+    resource = "/".join(parts[:1] + parts[2:3])
+    has_name = len(parts) > 1
+    params = dict(query_params.items() if isinstance(query_params, dict) else query_params or [])
+    verb = {
+        "GET": "get" if has_name else ("watch" if str(params.get("watch")).lower() == "true" else "list"),
+        "POST": "create",
+        "PUT": "update",
+        "PATCH": "patch",
+        "DELETE": "delete" if has_name else "deletecollection",
+    }.get(method.upper(), method.lower())
+
+    return verb, resource
+
+
+def _get_response_status(response: Any) -> str:
+    # (data, status, headers) when `_return_http_data_only` is False; raw response when `_preload_content` is False
+    if isinstance(response, tuple) and len(response) > 1:
+        return str(response[1])
+
+    if status := getattr(response, "status", None):
+        return str(status)
+
+    return "ok"
+
+
+class ApiCallCounter:
+    """
+    Count Kubernetes API requests issued through `ApiClient.call_api`, by test, verb, resource and response status.
+
+    All clients (e.g. `admin_client` and `unprivileged_client` DynamicClients) share the patched `ApiClient` class;
+    calls from threads are accounted to the running test.
+    """
+
+    def __init__(self) -> None:
+        self.scope = SESSION_SCOPE
+        self.calls: dict[str, Counter[str]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._patched: dict[type, Callable[..., Any]] = {}
+
+    def add(self, verb: str, resource: str, status: str) -> None:
+        with self._lock:
+            self.calls[self.scope][f"{verb} {resource} {status}"] += 1
+
+    def pop(self, scope: str) -> Counter[str]:
+        with self._lock:
+            return self.calls.pop(scope, Counter())
+
+    def patch(self, api_client_class: type = ApiClient) -> None:
+        """Wrap `call_api` of the given ApiClient class to count its requests."""
+        if api_client_class in self._patched:
+            return
+
+        call_api = api_client_class.call_api
+        counter = self
+
+        @functools.wraps(call_api)
+        def _counted_call_api(self: Any, resource_path: str, method: str, *args: Any, **kwargs: Any) -> Any:
+            # query_params follows path_params when passed positionally
+            verb, resource = get_api_call_key(
+                method=method,
+                resource_path=resource_path,
+                query_params=kwargs.get("query_params", args[1] if len(args) > 1 else None),
+            )
+            try:
+                response = call_api(self, resource_path, method, *args, **kwargs)
+            except Exception as ex:
+                counter.add(verb=verb, resource=resource, status=str(getattr(ex, "status", None) or type(ex).__name__))
+                raise
+
+            counter.add(verb=verb, resource=resource, status=_get_response_status(response=response))
+            return response
+
+        self._patched[api_client_class] = call_api
+        api_client_class.call_api = _counted_call_api
+
+    def unpatch(self) -> None:
+        for api_client_class, call_api in self._patched.items():
+            api_client_class.call_api = call_api
+
+        self._patched.clear()
+
+
+def load_api_call_baseline(path: str = API_CALL_BASELINE_PATH) -> dict[str, int]:
+    """
+    Load the persisted per-test API calls baseline.
+
+    Args:
+        path (str): Baseline JSON file.
+
+    Returns:
+        dict[str, int]: test node id to API calls of its call phase; empty if there is no baseline.
+
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path) as fd:
+            return json.load(fd)
+    except (OSError, ValueError) as ex:
+        LOGGER.warning(f"Ignoring unreadable API calls baseline {path}: {ex}")
+        return {}
+
+
+def get_api_call_budget(item: Item, baseline: dict[str, int], factor: float | None) -> int | None:
+    """
+    Get the maximum number of API calls allowed in a test call phase.
+
+    The `api_call_budget` marker sets an absolute `max_calls` or overrides the `--api-call-budget` factor
+    applied to the test baseline.
+
+    Args:
+        item (Item): pytest item.
+        baseline (dict[str, int]): test node id to API calls of its call phase in previous passing runs.
+        factor (float | None): allowed growth over the baseline.
+
+    Returns:
+        int | None: API calls budget, None if the test has no budget.
+
+    """
+    if marker := item.get_closest_marker(name="api_call_budget"):
+        if (max_calls := marker.kwargs.get("max_calls")) is not None:
+            return max_calls
+
+        factor = marker.kwargs.get("factor", factor)
+
+    if factor is None or item.nodeid not in baseline:
+        return None
+
+    # Tolerate a few calls for tests with a small baseline
+    return max(int(baseline[item.nodeid] * factor), baseline[item.nodeid] + 1)
+
+
+class ApiCallAccounting:
+    """
+    Pytest plugin counting Kubernetes API requests per test phase, by verb, resource and response status.
+
+    Counts travel with the test reports, so the controller (or the single process) writes the JSON report of all
+    xdist workers. With a budget factor, tests whose call phase exceeds their baseline by more than the factor fail.
+    The baseline only changes when explicitly updated, so it does not ratchet up with every passing run; the call
+    phase of passing tests then replaces their baseline.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        report_path: str,
+        budget_factor: float | None = None,
+        update_baseline: bool = False,
+        baseline_path: str = API_CALL_BASELINE_PATH,
+    ) -> None:
+        self.config = config
+        self.report_path = report_path
+        self.budget_factor = budget_factor
+        self.update_baseline = update_baseline
+        self.baseline_path = baseline_path
+        self.baseline = load_api_call_baseline(path=baseline_path)
+        self.counter = ApiCallCounter()
+        # Patched when registered, so requests of other plugins' session start are accounted too
+        self.counter.patch()
+        self.tests_calls: dict[str, dict[str, Counter[str]]] = defaultdict(dict)
+        self.passed_calls: dict[str, int] = {}
+
+    @property
+    def is_controller(self) -> bool:
+        return not hasattr(self.config, "workerinput")
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(self, item: Item, nextitem: Item | None) -> Generator[None, Any, Any]:
+        self.counter.scope = item.nodeid
+        try:
+            return (yield)
+        finally:
+            self.counter.scope = SESSION_SCOPE
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item: Item, call: CallInfo[None]) -> Generator[None, Any, Any]:
+        report: TestReport = yield
+        calls = self.counter.pop(scope=item.nodeid)
+        report.user_properties.append((API_CALL_USER_PROPERTY, dict(calls)))
+
+        if call.when == "call" and report.passed:
+            total = sum(calls.values())
+            budget = get_api_call_budget(item=item, baseline=self.baseline, factor=self.budget_factor)
+            if budget is not None and total > budget:
+                report.outcome = "failed"
+                report.longrepr = (
+                    f"API calls budget exceeded: {total} calls, budget {budget} "
+                    f"(baseline {self.baseline.get(item.nodeid)}):\n"
+                    + "\n".join(f"  {count:>6}  {key}" for key, count in calls.most_common(API_CALL_SUMMARY_TOP))
+                )
+
+        return report
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        # On the controller, reports of all workers are received
+        for name, calls in report.user_properties:
+            if name == API_CALL_USER_PROPERTY and calls:
+                self.tests_calls[report.nodeid][report.when] = Counter(calls)
+
+        if report.when == "call" and report.passed:
+            self.passed_calls[report.nodeid] = sum(self.tests_calls[report.nodeid].get("call", Counter()).values())
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
+        self.counter.unpatch()
+        if not self.is_controller:
+            return
+
+        if session_calls := self.counter.pop(scope=SESSION_SCOPE):
+            self.tests_calls[SESSION_SCOPE]["session"] = session_calls
+
+        self.write_report()
+        if self.update_baseline and self.passed_calls:
+            self.write_baseline()
+
+    @property
+    def totals(self) -> Counter[str]:
+        return sum((calls for phases in self.tests_calls.values() for calls in phases.values()), Counter())
+
+    def write_report(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.report_path)), exist_ok=True)
+        with open(self.report_path, "w") as fd:
+            json.dump(
+                {
+                    "total": sum(self.totals.values()),
+                    "calls": dict(self.totals.most_common()),
+                    "tests": {
+                        nodeid: {
+                            "total": sum(sum(calls.values()) for calls in phases.values()),
+                            "phases": {phase: dict(calls.most_common()) for phase, calls in phases.items()},
+                        }
+                        for nodeid, phases in sorted(self.tests_calls.items())
+                    },
+                },
+                fd,
+                indent=2,
+            )
+
+        LOGGER.info(f"API calls report written to {self.report_path}")
+
+    def write_baseline(self) -> None:
+        baseline = load_api_call_baseline(path=self.baseline_path)
+        baseline.update(self.passed_calls)
+        directory = os.path.dirname(self.baseline_path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode="w", dir=directory, suffix=".json", delete=False) as fd:
+            json.dump(baseline, fd, indent=2, sort_keys=True)
+
+        os.replace(fd.name, self.baseline_path)
+        LOGGER.info(f"Recorded {len(self.passed_calls)} tests API calls baseline to {self.baseline_path}")
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter, exitstatus: int, config: Config) -> None:
+        if not (self.is_controller and self.tests_calls):
+            return
+
+        terminalreporter.write_sep(sep="-", title=f"Kubernetes API calls: {sum(self.totals.values())}")
+        for key, count in self.totals.most_common(API_CALL_SUMMARY_TOP):
+            terminalreporter.write_line(line=f"{count:>8}  {key}")
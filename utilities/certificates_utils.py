@@ -1,8 +1,20 @@
 import base64
+import datetime
+import hashlib
+import ipaddress
 import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from functools import cache
 
 import structlog
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.config_map import ConfigMap
 from ocp_resources.ingress_controller import IngressController
@@ -16,6 +28,17 @@ from utilities.infra import is_managed_cluster
 
 LOGGER = structlog.get_logger(name=__name__)
 
+# Seconds during which a cached CA bundle is served without re-checking the secret resourceVersion
+CA_BUNDLE_REVALIDATE_INTERVAL = 300
+# Test CA shared by xdist workers and by consecutive runs, regenerated when it is about to expire
+TEST_CA_CACHE_PATH = os.getenv(
+    "OPENDATAHUB_TESTS_CA_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "test-ca.pem"),
+)
+TEST_CA_VALIDITY_DAYS = 30
+TEST_CA_MIN_REMAINING_VALIDITY = datetime.timedelta(days=1)
+TEST_CERT_VALIDITY_DAYS = 7
+
 
 def _get_router_cert_secret_name(client: DynamicClient) -> str:
     """
@@ -35,12 +58,117 @@ def _get_router_cert_secret_name(client: DynamicClient) -> str:
     return secret_name
 
 
+@dataclass
+class CaBundleEntry:
+    resource_version: str
+    path: str
+    validated_at: float
+
+
+class CaBundleManager:
+    """
+    Per-process cache of router CA bundle files.
+
+    Each distinct bundle (API server + router certificate secret) is fetched once and written atomically to a
+    content-addressed path. The secret resourceVersion is re-checked at most every `revalidate_interval` seconds
+    and the bundle is rewritten only when it changed.
+    """
+
+    def __init__(self, revalidate_interval: int = CA_BUNDLE_REVALIDATE_INTERVAL) -> None:
+        self.revalidate_interval = revalidate_interval
+        self._secret_names: dict[str, str] = {}
+        self._entries: dict[tuple[str, str], CaBundleEntry] = {}
+        self._lock = threading.Lock()
+
+    def get_bundle_path(self, client: DynamicClient) -> str:
+        """
+        Get the router CA bundle file path.
+
+        Args:
+            client (DynamicClient): DynamicClient object
+
+        Returns:
+            str: The path to the ca bundle file.
+
+        Raises:
+            NotFoundError: If the router certificate secret does not exist in the cluster.
+        """
+        api_host = client.configuration.host
+        with self._lock:
+            if api_host not in self._secret_names:
+                self._secret_names[api_host] = _get_router_cert_secret_name(client=client)
+
+            secret_name = self._secret_names[api_host]
+            entry = self._entries.get((api_host, secret_name))
+            if (
+                entry
+                and time.monotonic() - entry.validated_at < self.revalidate_interval
+                and os.path.exists(entry.path)
+            ):
+                return entry.path
+
+            certs_secret_instance = Secret(client=client, name=secret_name, namespace="openshift-ingress").instance
+            resource_version = certs_secret_instance.metadata.resourceVersion
+            if entry and entry.resource_version == resource_version and os.path.exists(entry.path):
+                entry.validated_at = time.monotonic()
+                return entry.path
+
+            LOGGER.info(f"Writing CA bundle from secret {secret_name}, resourceVersion {resource_version}")
+            filepath = write_content_addressed_file(
+                content=base64.b64decode(certs_secret_instance.data["tls.crt"]).decode(),
+                directory=py_config["tmp_base_dir"],
+                prefix=os.path.splitext(OPENSHIFT_CA_BUNDLE_FILENAME)[0],
+                suffix=os.path.splitext(OPENSHIFT_CA_BUNDLE_FILENAME)[1],
+            )
+            self._entries[(api_host, secret_name)] = CaBundleEntry(
+                resource_version=resource_version, path=filepath, validated_at=time.monotonic()
+            )
+            return filepath
+
+
+@cache
+def get_ca_bundle_manager() -> CaBundleManager:
+    """
+    Get the process-wide CA bundle manager.
+
+    Returns:
+        CaBundleManager: CA bundle manager.
+
+    """
+    return CaBundleManager()
+
+
+def write_content_addressed_file(content: str, directory: str, prefix: str, suffix: str) -> str:
+    """
+    Atomically write content to a file named after its sha256 digest.
+
+    Args:
+        content (str): File content.
+        directory (str): Target directory.
+        prefix (str): File name prefix.
+        suffix (str): File name suffix.
+
+    Returns:
+        str: The path to the file; an existing file with the same content is reused.
+
+    """
+    filepath = os.path.join(directory, f"{prefix}-{hashlib.sha256(content.encode()).hexdigest()[:16]}{suffix}")
+    if not os.path.exists(filepath):
+        with tempfile.NamedTemporaryFile(mode="w", dir=directory, suffix=suffix, delete=False) as fd:
+            fd.write(content)
+
+        os.replace(fd.name, filepath)
+
+    return filepath
+
+
 def create_ca_bundle_file(client: DynamicClient) -> str:
     """
     Creates a ca bundle file from the router certificate secret.
 
     Queries the default IngressController to determine the correct secret name,
     supporting both default and custom ingress certificates.
+    The file is cached per process and rewritten only when the secret changes.
 
     Args:
         client (DynamicClient): DynamicClient object
@@ -50,22 +178,7 @@ def create_ca_bundle_file(client: DynamicClient) -> str:
     Raises:
         NotFoundError: If the router certificate secret does not exist in the cluster.
     """
-    secret_name = _get_router_cert_secret_name(client=client)
-
-    certs_secret = Secret(
-        client=client,
-        name=secret_name,
-        namespace="openshift-ingress",
-    )
-
-    filename = OPENSHIFT_CA_BUNDLE_FILENAME
-    bundle = base64.b64decode(certs_secret.instance.data["tls.crt"]).decode()
-    filepath = os.path.join(py_config["tmp_base_dir"], filename)
-
-    with open(filepath, "w") as fd:
-        fd.write(bundle)
-
-    return filepath
+    return get_ca_bundle_manager().get_bundle_path(client=client)
 
 
 @cache
@@ -177,3 +290,217 @@ def create_ca_bundle_with_router_cert(
         if router_ca_content not in bundle_content:
             with open(ca_bundle_path, "a", encoding="utf-8") as bundle_append:
                 bundle_append.write("\n" + router_ca_content)
+
+
+@dataclass(frozen=True)
+class TlsMaterial:
+    ca_cert: str
+    cert: str
+    key: str
+
+    def write(self, directory: str) -> dict[str, str]:
+        """
+        Write the PEM files to a directory.
+
+        Args:
+            directory (str): Target directory.
+
+        Returns:
+            dict[str, str]: ca_crt, server_crt and server_key paths.
+
+        """
+        paths = {
+            "ca_crt": os.path.join(directory, "ca.crt"),
+            "server_crt": os.path.join(directory, "server-cert.pem"),
+            "server_key": os.path.join(directory, "server-key.pem"),
+        }
+        for path_key, content in (("ca_crt", self.ca_cert), ("server_crt", self.cert), ("server_key", self.key)):
+            with open(paths[path_key], "w") as fd:
+                fd.write(content)
+
+        os.chmod(paths["server_key"], 0o600)
+        return paths
+
+
+def generate_private_key(key_type: str = "ecdsa") -> CertificateIssuerPrivateKeyTypes:
+    """
+    Generate a private key in-process.
+
+    Args:
+        key_type (str): "ecdsa" (P-256, fast) or "rsa" (2048 bits, for consumers without ECDSA support).
+
+    Returns:
+        CertificateIssuerPrivateKeyTypes: Private key.
+
+    """
+    if key_type == "ecdsa":
+        return ec.generate_private_key(curve=ec.SECP256R1())
+
+    if key_type == "rsa":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    raise ValueError(f"Unsupported key type: {key_type}")
+
+
+def _get_pem_private_key(key: CertificateIssuerPrivateKeyTypes) -> str:
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+class CertificateFactory:
+    """
+    In-process test CA issuing leaf certificates on demand.
+
+    The CA is optionally persisted to `cache_path` (certificate and key in one file, written atomically) and
+    reused until it is about to expire.
+    """
+
+    def __init__(
+        self, ca_name: str = "opendatahub-tests CA", cache_path: str | None = None, key_type: str = "ecdsa"
+    ) -> None:
+        self.ca_name = ca_name
+        self.cache_path = cache_path
+        self.key_type = key_type
+        self._lock = threading.Lock()
+        self.ca_key, self.ca_cert = self._load_ca() or self._create_ca()
+        self.ca_cert_pem = self.ca_cert.public_bytes(encoding=serialization.Encoding.PEM).decode()
+
+    def _load_ca(self) -> tuple[CertificateIssuerPrivateKeyTypes, x509.Certificate] | None:
+        if not (self.cache_path and os.path.exists(self.cache_path)):
+            return None
+
+        with open(self.cache_path, "rb") as fd:
+            content = fd.read()
+
+        try:
+            ca_cert = x509.load_pem_x509_certificate(data=content)
+            ca_key = serialization.load_pem_private_key(data=content, password=None)
+        except ValueError:
+            LOGGER.warning(f"Invalid test CA cache {self.cache_path}, regenerating")
+            return None
+
+        if (
+            ca_cert.subject.rfc4514_string() != f"CN={self.ca_name}"
+            or ca_cert.not_valid_after_utc - datetime.datetime.now(datetime.UTC) < TEST_CA_MIN_REMAINING_VALIDITY
+        ):
+            LOGGER.info(f"Test CA cache {self.cache_path} is expired or for another CA, regenerating")
+            return None
+
+        LOGGER.info(f"Using cached test CA {self.cache_path}")
+        return ca_key, ca_cert
+
+    def _create_ca(self) -> tuple[CertificateIssuerPrivateKeyTypes, x509.Certificate]:
+        LOGGER.info(f"Generating test CA {self.ca_name}")
+        ca_key = generate_private_key(key_type=self.key_type)
+        ca_name = x509.Name(attributes=[x509.NameAttribute(oid=NameOID.COMMON_NAME, value=self.ca_name)])
+        now = datetime.datetime.now(datetime.UTC)
+        ca_cert = (
+            x509
+            .CertificateBuilder()
+            .subject_name(ca_name)
+            .issuer_name(ca_name)
+            .public_key(ca_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(minutes=5))
+            .not_valid_after(now + datetime.timedelta(days=TEST_CA_VALIDITY_DAYS))
+            .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+            .add_extension(
+                x509.KeyUsage(
+                    digital_signature=True,
+                    content_commitment=False,
+                    key_encipherment=False,
+                    data_encipherment=False,
+                    key_agreement=False,
+                    key_cert_sign=True,
+                    crl_sign=True,
+                    encipher_only=False,
+                    decipher_only=False,
+                ),
+                critical=True,
+            )
+            .add_extension(x509.SubjectKeyIdentifier.from_public_key(ca_key.public_key()), critical=False)
+            .sign(private_key=ca_key, algorithm=hashes.SHA256())
+        )
+
+        if self.cache_path:
+            directory = os.path.dirname(self.cache_path)
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(mode="w", dir=directory, suffix=".pem", delete=False) as fd:
+                fd.write(ca_cert.public_bytes(encoding=serialization.Encoding.PEM).decode())
+                fd.write(_get_pem_private_key(key=ca_key))
+
+            os.replace(fd.name, self.cache_path)
+
+        return ca_key, ca_cert
+
+    def issue_cert(
+        self,
+        common_name: str,
+        sans: list[str] | None = None,
+        key_type: str | None = None,
+        validity_days: int = TEST_CERT_VALIDITY_DAYS,
+    ) -> TlsMaterial:
+        """
+        Issue a server/client leaf certificate signed by the test CA.
+
+        Args:
+            common_name (str): Certificate common name.
+            sans (list[str] | None): DNS names and IP addresses; defaults to the common name.
+            key_type (str | None): Leaf key type; defaults to the CA key type.
+            validity_days (int): Certificate validity in days.
+
+        Returns:
+            TlsMaterial: CA certificate, leaf certificate and leaf private key PEMs.
+
+        """
+        key = generate_private_key(key_type=key_type or self.key_type)
+        san_entries: list[x509.GeneralName] = []
+        for san in sans or [common_name]:
+            try:
+                san_entries.append(x509.IPAddress(ipaddress.ip_address(san)))
+            except ValueError:
+                san_entries.append(x509.DNSName(san))
+
+        now = datetime.datetime.now(datetime.UTC)
+        with self._lock:
+            cert = (
+                x509
+                .CertificateBuilder()
+                .subject_name(x509.Name(attributes=[x509.NameAttribute(oid=NameOID.COMMON_NAME, value=common_name)]))
+                .issuer_name(self.ca_cert.subject)
+                .public_key(key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now - datetime.timedelta(minutes=5))
+                .not_valid_after(min(now + datetime.timedelta(days=validity_days), self.ca_cert.not_valid_after_utc))
+                .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=True)
+                .add_extension(x509.SubjectAlternativeName(general_names=san_entries), critical=False)
+                .add_extension(
+                    x509.ExtendedKeyUsage(usages=[ExtendedKeyUsageOID.SERVER_AUTH, ExtendedKeyUsageOID.CLIENT_AUTH]),
+                    critical=False,
+                )
+                .add_extension(
+                    x509.AuthorityKeyIdentifier.from_issuer_public_key(self.ca_key.public_key()), critical=False
+                )
+                .sign(private_key=self.ca_key, algorithm=hashes.SHA256())
+            )
+
+        return TlsMaterial(
+            ca_cert=self.ca_cert_pem,
+            cert=cert.public_bytes(encoding=serialization.Encoding.PEM).decode(),
+            key=_get_pem_private_key(key=key),
+        )
+
+
+@cache
+def get_certificate_factory() -> CertificateFactory:
+    """
+    Get the session test CA certificate factory, persisted on disk.
+
+    Returns:
+        CertificateFactory: Certificate factory.
+
+    """
+    return CertificateFactory(cache_path=TEST_CA_CACHE_PATH)
@@ -180,6 +180,7 @@ class Annotations:
     class OpenDataHubIo:
         MANAGED: str = f"{ApiGroups.OPENDATAHUB_IO}/managed"
         SERVICE_MESH: str = f"{ApiGroups.OPENDATAHUB_IO}/service-mesh"
+        MODEL_CACHE_COMPLETED: str = f"model-cache.{ApiGroups.OPENDATAHUB_IO}/completed"
 
     class HaproxyRouterOpenshiftIo:
         TIMEOUT: str = f"{ApiGroups.HAPROXY_ROUTER_OPENSHIFT_IO}/timeout"
@@ -232,6 +233,7 @@ class Labels:
     class OpenDataHubIo:
         MANAGED: str = Annotations.OpenDataHubIo.MANAGED
         NAME: str = f"component.{ApiGroups.OPENDATAHUB_IO}/name"
+        MODEL_CACHE_KEY: str = f"model-cache.{ApiGroups.OPENDATAHUB_IO}/key"
 
     class Openshift:
         APP: str = "app"
@@ -443,6 +445,8 @@ MAAS_TOKEN_RATE_LIMIT_POLICY_NAME: str = "gateway-token-rate-limits"
 MARIADB: str = "mariadb"
 MARIA_DB_IMAGE: str = SharedImages.MARIADB_1011
 MODEL_REGISTRY_CUSTOM_NAMESPACE: str = "model-registry-custom-ns"
+# Long-lived namespace of the model data cache PVCs and VolumeSnapshots, kept across runs
+MODEL_CACHE_NAMESPACE: str = "opendatahub-tests-model-cache"
 THANOS_QUERIER_ADDRESS = "https://thanos-querier.openshift-monitoring.svc:9092"
 BUILTIN_DETECTOR_CONFIG: dict[str, Any] = {
     "regex": {
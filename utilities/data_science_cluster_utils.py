@@ -80,6 +80,121 @@ def update_components_in_dsc(
         yield dsc
 
 
+class DscComponentStateManager:
+    """
+    Apply DSC component managementStates for class-scoped toggles.
+
+    By default, each toggle patches the DSC on setup and restores it on teardown, as `update_components_in_dsc`
+    does. With `keep_states` (`--dsc-state-planner`), applied states are kept after the toggle teardown and only
+    restored by `release` when the next test does not require them, so consecutive tests requiring the same
+    states, grouped by the DSC state planner, pay a single reconciliation.
+    """
+
+    def __init__(
+        self,
+        dsc: DataScienceCluster,
+        keep_states: bool = False,
+        condition_wait_timeout: int = Timeout.TIMEOUT_5MIN,
+    ) -> None:
+        self.dsc = dsc
+        self.keep_states = keep_states
+        self.condition_wait_timeout = condition_wait_timeout
+        self.original_states: dict[str, str | None] = {}
+        self.applied_states: dict[str, str | None] = {}
+        self.transitions = 0
+
+    def _update(self, components: dict[str, str | None]) -> None:
+        ResourceEditor(
+            patches={
+                self.dsc: {
+                    "spec": {
+                        "components": {
+                            component_name: {"managementState": state} for component_name, state in components.items()
+                        }
+                    }
+                }
+            }
+        ).update()
+        self.applied_states.update(components)
+        self.transitions += len(components)
+
+        for component_name, state in components.items():
+            if state == DscComponents.ManagementState.MANAGED:
+                self.dsc.wait_for_condition(
+                    condition=DscComponents.COMPONENT_MAPPING[component_name],
+                    status="True",
+                    timeout=self.condition_wait_timeout,
+                )
+
+    def apply(self, components: dict[str, str]) -> DataScienceCluster:
+        """
+        Switch components to the desired managementStates, if not already applied.
+
+        Args:
+            components (dict[str, str]): component name to desired managementState
+
+        Returns:
+            DataScienceCluster
+
+        """
+        for component_name in components:
+            if component_name not in self.applied_states:
+                state = _get_component_spec_management_state(dsc=self.dsc, component_name=component_name)
+                self.original_states[component_name] = self.applied_states[component_name] = state
+
+        if changed_components := {
+            component_name: state
+            for component_name, state in components.items()
+            if self.applied_states[component_name] != state
+        }:
+            LOGGER.info(f"Updating DSC components managementState: {changed_components}")
+            self._update(components=changed_components)
+
+        return self.dsc
+
+    def release(self, required_components: dict[str, str]) -> None:
+        """
+        Restore the original managementState of the applied components that are not required.
+
+        Args:
+            required_components (dict[str, str]): component name to managementState required by the next test
+
+        """
+        if changed_components := {
+            component_name: state
+            for component_name, state in self.original_states.items()
+            if self.applied_states[component_name] not in (state, required_components.get(component_name))
+        }:
+            LOGGER.info(f"Restoring DSC components managementState: {changed_components}")
+            self._update(components=changed_components)
+
+    def restore(self) -> None:
+        """Restore the original managementState of all the components changed during the session."""
+        self.release(required_components={})
+        LOGGER.info(f"DSC components managementState transitions during the session: {self.transitions}")
+
+    @contextmanager
+    def update_components(self, components: dict[str, str]) -> Generator[DataScienceCluster, Any, Any]:
+        """
+        Switch components to the desired managementStates for the scope of a toggle fixture.
+
+        Args:
+            components (dict[str, str]): component name to desired managementState
+
+        Yields:
+            DataScienceCluster
+
+        """
+        if self.keep_states:
+            yield self.apply(components=components)
+
+        else:
+            with update_components_in_dsc(
+                dsc=self.dsc, components=components, condition_wait_timeout=self.condition_wait_timeout
+            ) as dsc:
+                yield dsc
+
+
 def get_dsc_ready_condition(dsc: DataScienceCluster) -> dict[str, Any] | None:
     """Get DSC Ready condition.
 
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from itertools import pairwise
+
+from pytest import Item
+
+from utilities.constants import DscComponents
+
+# Class-scoped fixtures switching DSC components to a specific managementState through `DscComponentStateManager`;
+# with the planner, states are kept across consecutive tests requiring them and restored before the others
+DSC_COMPONENT_STATE_FIXTURES: dict[str, dict[str, str]] = {
+    "enabled_ogx_operator": {DscComponents.OGX: DscComponents.ManagementState.MANAGED},
+    "autorag_ogx_operator": {DscComponents.OGX: DscComponents.ManagementState.MANAGED},
+}
+
+DscState = frozenset[tuple[str, str]]
+
+
+@dataclass
+class DscComponentStatePlan:
+    """Result of ordering collected items by the DSC component states they require."""
+
+    items: list[Item]
+    groups: int
+    original_transitions: int
+    planned_transitions: int
+
+    @property
+    def avoided_transitions(self) -> int:
+        return self.original_transitions - self.planned_transitions
+
+
+def get_item_dsc_component_states(item: Item) -> DscState:
+    """
+    Get the DSC component states a test item requires.
+
+    Args:
+        item (Item): pytest item
+
+    Returns:
+        DscState: (component name, managementState) pairs of the DSC-updating fixtures in the item's fixture closure
+
+    """
+    states: dict[str, str] = {}
+    for fixture_name in getattr(item, "fixturenames", []):
+        states.update(DSC_COMPONENT_STATE_FIXTURES.get(fixture_name, {}))
+
+    return frozenset(states.items())
+
+
+def _count_transitions(applied_state: DscState, required_state: DscState) -> int:
+    """Count components switched between two states; components missing from a state are in their original state."""
+    return len({component for component, _ in applied_state ^ required_state})
+
+
+def count_dsc_state_transitions(states: list[DscState]) -> int:
+    """
+    Count component transitions needed to go through `states` in order.
+
+    As `DscComponentStateManager` does with `keep_states`, required states are kept across consecutive states
+    requiring them and components not required are restored to their original state, including at session end.
+    Transitions are counted as if the original states differ from the required ones.
+    """
+    return sum(
+        _count_transitions(applied_state=applied_state, required_state=required_state)
+        for applied_state, required_state in pairwise([frozenset(), *states, frozenset()])
+    )
+
+
+def _order_package_tree(
+    items: list[Item],
+    items_states: dict[Item, DscState],
+    applied_state: DscState,
+    depth: int = 0,
+) -> list[Item]:
+    """Order the children (sub-packages and modules) of a package, recursively, from the applied state."""
+    children: dict[str, list[Item]] = {}
+    for item in items:
+        path_parts = item.nodeid.split("::", maxsplit=1)[0].split("/")
+        children.setdefault("/".join(path_parts[: depth + 1]), []).append(item)
+
+    ordered_items: list[Item] = []
+    remaining_children = list(children)
+    while remaining_children:
+        # Nearest child first, by the nearest state it requires; ties keep the collection order
+        child = min(
+            remaining_children,
+            key=lambda _child: min(
+                _count_transitions(applied_state=applied_state, required_state=items_states[_item])
+                for _item in children[_child]
+            ),
+        )
+        remaining_children.remove(child)
+        child_items = children[child]
+        if child == child_items[0].nodeid.split("::", maxsplit=1)[0]:
+            # Module: its items keep their order
+            ordered_items.extend(child_items)
+        else:
+            ordered_items.extend(
+                _order_package_tree(
+                    items=child_items, items_states=items_states, applied_state=applied_state, depth=depth + 1
+                )
+            )
+
+        applied_state = items_states[ordered_items[-1]]
+
+    return ordered_items
+
+
+def plan_dsc_component_states(items: list[Item]) -> DscComponentStatePlan:
+    """
+    Order items to minimise the number of DSC component transitions.
+
+    Packages and modules stay contiguous (so package, module, class and dependency ordering is kept); the
+    children of each package are ordered by a greedy nearest-neighbour walk over the component states they
+    require, starting from the states applied so far. The collection order is kept when the plan does not
+    avoid any transition.
+
+    Args:
+        items (list[Item]): collected pytest items
+
+    Returns:
+        DscComponentStatePlan: ordered items and transitions count before and after planning
+
+    """
+    items_states = {item: get_item_dsc_component_states(item=item) for item in items}
+    ordered_items = _order_package_tree(items=items, items_states=items_states, applied_state=frozenset())
+
+    original_transitions = count_dsc_state_transitions(states=[items_states[item] for item in items])
+    planned_transitions = count_dsc_state_transitions(states=[items_states[item] for item in ordered_items])
+    if planned_transitions >= original_transitions:
+        ordered_items, planned_transitions = list(items), original_transitions
+
+    return DscComponentStatePlan(
+        items=ordered_items,
+        groups=len({state for state in items_states.values() if state}),
+        original_transitions=original_transitions,
+        planned_transitions=planned_transitions,
+    )
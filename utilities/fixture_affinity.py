@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+
+import pytest
+from _pytest.fixtures import FixtureDef
+from pytest import Item
+
+# Items of modules using these markers keep their collection order
+ORDER_SENSITIVE_MARKERS: tuple[str, ...] = ("dependency", "order")
+# (fixture name, scope node id, param identity)
+FixtureKey = tuple[str, str, int | None]
+
+
+@dataclass
+class FixtureAffinityPlan:
+    """Result of ordering collected items to maximise reuse of fixtures above function scope."""
+
+    items: list[Item]
+    original_setups: int
+    planned_setups: int
+
+    @property
+    def saved_setups(self) -> int:
+        return self.original_setups - self.planned_setups
+
+
+def get_fixture_scope_node_id(item: Item, fixturedef: FixtureDef) -> str:
+    """
+    Get the id of the node a fixture instance is cached on for an item, as pytest resolves it.
+
+    Class-scoped fixtures of module-level tests are cached per test; package-scoped fixtures are bound to the package
+    of the conftest defining them (`fixturedef.baseid`), or to the session if the item is not in that package.
+
+    Args:
+        item (Item): pytest item
+        fixturedef (FixtureDef): definition of the fixture used by the item
+
+    Returns:
+        str: scope node id, empty for the session
+
+    """
+    if fixturedef.scope == "class":
+        class_node = item.getparent(pytest.Class)
+        return class_node.nodeid if class_node else item.nodeid
+
+    if fixturedef.scope == "module":
+        return item.getparent(pytest.Module).nodeid
+
+    if fixturedef.scope == "package":
+        for node in item.listchain():
+            if isinstance(node, pytest.Package) and node.nodeid == fixturedef.baseid:
+                return node.nodeid
+
+    return ""
+
+
+def get_item_fixture_keys(item: Item) -> frozenset[FixtureKey]:
+    """
+    Get the instances of fixtures above function scope a test item uses.
+
+    A fixture instance is identified by its name, the node its scope is bound to and its param. Params are compared
+    by identity, as pytest does when deciding whether a cached fixture value can be reused.
+
+    Args:
+        item (Item): pytest item
+
+    Returns:
+        frozenset[FixtureKey]: (fixture name, scope node id, param identity) keys
+
+    """
+    fixture_info = getattr(item, "_fixtureinfo", None)
+    if not fixture_info:
+        return frozenset()
+
+    callspec = getattr(item, "callspec", None)
+    keys: set[FixtureKey] = set()
+    for fixture_name, fixturedefs in fixture_info.name2fixturedefs.items():
+        fixturedef = fixturedefs[-1]
+        if fixturedef.scope == "function":
+            continue
+
+        param = callspec.params[fixture_name] if callspec and fixture_name in callspec.params else None
+        keys.add((
+            fixture_name,
+            get_fixture_scope_node_id(item=item, fixturedef=fixturedef),
+            None if param is None else id(param),
+        ))
+
+    return frozenset(keys)
+
+
+def count_fixture_setups(items: list[Item], items_keys: dict[Item, frozenset[FixtureKey]] | None = None) -> int:
+    """
+    Count the setups of fixtures above function scope needed to run items in order.
+
+    A fixture is set up again when its param changes or when its scope node (class, module, package) was left.
+
+    Args:
+        items (list[Item]): ordered pytest items
+        items_keys (dict[Item, frozenset[FixtureKey]] | None): fixture keys per item, see `get_item_fixture_keys`;
+            computed from the items if not given
+
+    Returns:
+        int: number of fixture setups
+
+    """
+    if items_keys is None:
+        items_keys = {item: get_item_fixture_keys(item=item) for item in items}
+
+    setups = 0
+    cached_params: dict[tuple[str, str], int | None] = {}
+    for item in items:
+        active_nodes = {node.nodeid for node in item.listchain()}
+        cached_params = {key: param for key, param in cached_params.items() if key[1] in active_nodes}
+        for fixture_name, scope_node_id, param in items_keys[item]:
+            cache_key = (fixture_name, scope_node_id)
+            if cache_key not in cached_params or cached_params[cache_key] != param:
+                setups += 1
+                cached_params[cache_key] = param
+
+    return setups
+
+
+def _group_stable(items: list[Item], key: dict[Item, frozenset[FixtureKey]]) -> list[Item]:
+    """Group items with equal keys together, groups and items keeping their first occurrence order."""
+    groups: dict[frozenset[FixtureKey], list[Item]] = {}
+    for item in items:
+        groups.setdefault(key[item], []).append(item)
+
+    return [item for group in groups.values() for item in group]
+
+
+def plan_fixture_affinity(items: list[Item]) -> FixtureAffinityPlan:
+    """
+    Order items to maximise reuse of fixtures above function scope.
+
+    Modules and classes stay contiguous, so scoped fixtures are not torn down in between. Within a class, items
+    using the same parametrized fixture instances are grouped; within a module, classes are grouped by their
+    module and session-scoped fixture instances; modules are grouped by their session-scoped fixture instances.
+    Modules using `dependency` / `order` markers keep their internal order. Ties keep the collection order, and the
+    collection order is kept altogether when it needs no more setups than the plan.
+
+    Args:
+        items (list[Item]): collected pytest items
+
+    Returns:
+        FixtureAffinityPlan: ordered items and fixture setups count before and after planning
+
+    """
+    items_keys = {item: get_item_fixture_keys(item=item) for item in items}
+
+    module_items: dict[str, list[Item]] = {}
+    for item in items:
+        module_items.setdefault(item.nodeid.split("::", maxsplit=1)[0], []).append(item)
+
+    ordered_modules: dict[str, list[Item]] = {}
+    for module, _items in module_items.items():
+        if any(_item.get_closest_marker(name=marker) for _item in _items for marker in ORDER_SENSITIVE_MARKERS):
+            ordered_modules[module] = _items
+            continue
+
+        class_items: dict[str, list[Item]] = {}
+        for _item in _items:
+            class_node = _item.getparent(pytest.Class)
+            class_items.setdefault(class_node.nodeid if class_node else _item.nodeid, []).append(_item)
+
+        class_keys = {
+            class_id: frozenset(
+                key for _item in _class_items for key in items_keys[_item] if key[2] is not None and key[1] != class_id
+            )
+            for class_id, _class_items in class_items.items()
+        }
+        class_groups: dict[frozenset[FixtureKey], list[str]] = {}
+        for class_id, keys in class_keys.items():
+            class_groups.setdefault(keys, []).append(class_id)
+
+        ordered_modules[module] = [
+            _item
+            for class_ids in class_groups.values()
+            for class_id in class_ids
+            for _item in _group_stable(
+                items=class_items[class_id],
+                key={
+                    _item: frozenset(key for key in items_keys[_item] if key[2] is not None)
+                    for _item in class_items[class_id]
+                },
+            )
+        ]
+
+    module_groups: dict[frozenset[FixtureKey], list[str]] = {}
+    for module, _items in ordered_modules.items():
+        session_keys = frozenset(
+            key for _item in _items for key in items_keys[_item] if key[1] == "" and key[2] is not None
+        )
+        module_groups.setdefault(session_keys, []).append(module)
+
+    ordered_items = [
+        item for modules in module_groups.values() for module in modules for item in ordered_modules[module]
+    ]
+
+    original_setups = count_fixture_setups(items=items, items_keys=items_keys)
+    planned_setups = count_fixture_setups(items=ordered_items, items_keys=items_keys)
+    if planned_setups >= original_setups:
+        return FixtureAffinityPlan(items=list(items), original_setups=original_setups, planned_setups=original_setups)
+
+    return FixtureAffinityPlan(items=ordered_items, original_setups=original_setups, planned_setups=planned_setups)
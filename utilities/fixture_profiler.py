@@ -0,0 +1,296 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+from typing import Any
+
+import pytest
+import structlog
+import timeout_sampler
+from _pytest.terminal import TerminalReporter
+from pytest import Config, FixtureDef, FixtureRequest, Item, Session
+
+LOGGER = structlog.get_logger(name=__name__)
+
+FIXTURE_PROFILE_FILE_PREFIX = "fixture-profile"
+FIXTURE_PROFILE_SUMMARY_TOP = 20
+
+
+@dataclass
+class ProfileFrame:
+    """One measured fixture setup/teardown or test phase."""
+
+    name: str
+    scope: str
+    param_id: str
+    phase: str
+    start: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    sampler_sleep: float = 0.0
+    child_duration: float = 0.0
+
+
+@dataclass
+class ProfileRecord:
+    name: str
+    scope: str
+    param_id: str
+    phase: str
+    count: int = 0
+    total: float = 0.0
+    self_total: float = 0.0
+    sampler_sleep: float = 0.0
+    max: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return ";".join((self.scope, f"{self.name}[{self.param_id}]" if self.param_id else self.name, self.phase))
+
+    def add(self, duration: float, self_duration: float, sampler_sleep: float, count: int = 1) -> None:
+        self.count += count
+        self.total += duration
+        self.self_total += self_duration
+        self.sampler_sleep += sampler_sleep
+        self.max = max(self.max, duration)
+
+
+def _get_param_id(fixturedef: FixtureDef[Any], request: FixtureRequest) -> str:
+    # The fixture's own param, not the id of the (first) requesting test, which includes its other params
+    if not hasattr(request, "param"):
+        return ""
+
+    if callable(fixturedef.ids):
+        param_id = fixturedef.ids(request.param)
+    elif fixturedef.ids and request.param_index < len(fixturedef.ids):
+        param_id = fixturedef.ids[request.param_index]
+    else:
+        param_id = None
+
+    return str(request.param) if param_id is None else str(param_id)
+
+
+def merge_profile_records(records: list[dict[str, Any]]) -> dict[str, ProfileRecord]:
+    """
+    Merge serialized profile records, e.g. from several xdist workers.
+
+    Args:
+        records (list[dict[str, Any]]): Serialized ProfileRecord dicts.
+
+    Returns:
+        dict[str, ProfileRecord]: Merged records by key.
+
+    """
+    merged: dict[str, ProfileRecord] = {}
+    for record_dict in records:
+        record = ProfileRecord(
+            name=record_dict["name"],
+            scope=record_dict["scope"],
+            param_id=record_dict["param_id"],
+            phase=record_dict["phase"],
+        )
+        merged.setdefault(record.key, record).add(
+            duration=record_dict["total"],
+            self_duration=record_dict["self_total"],
+            sampler_sleep=record_dict["sampler_sleep"],
+            count=record_dict["count"],
+        )
+        merged[record.key].max = max(merged[record.key].max, record_dict["max"])
+
+    return merged
+
+
+class FixtureProfiler:
+    """
+    Pytest plugin measuring wall time of fixture setups/teardowns and test phases.
+
+    Time spent sleeping inside TimeoutSampler is accounted separately from real work. Each xdist worker writes
+    a JSON artifact; the controller (or the single process) merges them into a JSON report, a folded-stacks
+    flame graph input and a terminal summary.
+    """
+
+    def __init__(self, config: Config, output_dir: str) -> None:
+        self.config = config
+        self.output_dir = output_dir
+        self.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.records: dict[str, ProfileRecord] = {}
+        self.merged_records: dict[str, ProfileRecord] = {}
+        self._stack: list[ProfileFrame] = []
+        self._teardown_frames: dict[int, ProfileFrame] = {}
+        self._lock = threading.Lock()
+        self._sampler_time_module: ModuleType | None = getattr(timeout_sampler, "time", None)
+        if self.is_controller:
+            # Drop artifacts of previous runs before xdist workers start
+            for path in glob.glob(os.path.join(self.output_dir, f"{FIXTURE_PROFILE_FILE_PREFIX}*")):
+                os.remove(path)
+
+    @property
+    def is_controller(self) -> bool:
+        return not hasattr(self.config, "workerinput")
+
+    def add_sampler_sleep(self, duration: float) -> None:
+        with self._lock:
+            if self._stack:
+                self._stack[-1].sampler_sleep += duration
+
+    def _push(self, frame: ProfileFrame) -> ProfileFrame:
+        with self._lock:
+            self._stack.append(frame)
+        return frame
+
+    def _pop(self, frame: ProfileFrame) -> None:
+        frame.duration = time.perf_counter() - frame.start
+        with self._lock:
+            if frame in self._stack:
+                self._stack.remove(frame)
+            if self._stack:
+                self._stack[-1].child_duration += frame.duration
+
+            record = ProfileRecord(name=frame.name, scope=frame.scope, param_id=frame.param_id, phase=frame.phase)
+            self.records.setdefault(record.key, record).add(
+                duration=frame.duration,
+                self_duration=frame.duration - frame.child_duration,
+                sampler_sleep=frame.sampler_sleep,
+            )
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session: Session) -> None:
+        if self._sampler_time_module:
+            timeout_sampler.time = _SamplerSleepAccountingTime(profiler=self, time_module=self._sampler_time_module)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef: FixtureDef[Any], request: FixtureRequest) -> Generator[None, Any, Any]:
+        param_id = _get_param_id(fixturedef=fixturedef, request=request)
+        frame = self._push(
+            frame=ProfileFrame(name=fixturedef.argname, scope=fixturedef.scope, param_id=param_id, phase="setup")
+        )
+        try:
+            return (yield)
+        finally:
+            self._pop(frame=frame)
+
+            # Registered after the fixture's own finalizers, so it runs first and marks the teardown start
+            def _start_teardown() -> None:
+                self._teardown_frames[id(fixturedef)] = self._push(
+                    frame=ProfileFrame(
+                        name=fixturedef.argname, scope=fixturedef.scope, param_id=param_id, phase="teardown"
+                    )
+                )
+
+            fixturedef.addfinalizer(_start_teardown)
+
+    @pytest.hookimpl
+    def pytest_fixture_post_finalizer(self, fixturedef: FixtureDef[Any], request: FixtureRequest) -> None:
+        if frame := self._teardown_frames.pop(id(fixturedef), None):
+            self._pop(frame=frame)
+
+    @contextmanager
+    def _profile_phase(self, item: Item, phase: str) -> Generator[None, Any, Any]:
+        frame = self._push(frame=ProfileFrame(name=item.nodeid, scope="test", param_id="", phase=phase))
+        try:
+            yield
+        finally:
+            self._pop(frame=frame)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item: Item) -> Generator[None, Any, Any]:
+        with self._profile_phase(item=item, phase="setup"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: Item) -> Generator[None, Any, Any]:
+        with self._profile_phase(item=item, phase="call"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item: Item, nextitem: Item | None) -> Generator[None, Any, Any]:
+        with self._profile_phase(item=item, phase="teardown"):
+            return (yield)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
+        if self._sampler_time_module:
+            timeout_sampler.time = self._sampler_time_module
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        worker_file = os.path.join(self.output_dir, f"{FIXTURE_PROFILE_FILE_PREFIX}-{self.worker_id}.json")
+        with open(worker_file, "w") as fd:
+            json.dump([asdict(record) for record in self.records.values()], fd, indent=2)
+
+        if not self.is_controller:
+            return
+
+        # On the controller, xdist workers have finished and written their artifacts
+        worker_records: list[dict[str, Any]] = []
+        for path in sorted(glob.glob(os.path.join(self.output_dir, f"{FIXTURE_PROFILE_FILE_PREFIX}-*.json"))):
+            with open(path) as fd:
+                worker_records.extend(json.load(fd))
+
+        self.merged_records = merge_profile_records(records=worker_records)
+        self.write_reports()
+
+    def write_reports(self) -> None:
+        merged_file = os.path.join(self.output_dir, f"{FIXTURE_PROFILE_FILE_PREFIX}.json")
+        with open(merged_file, "w") as fd:
+            json.dump(
+                [asdict(record) for record in sorted(self.merged_records.values(), key=lambda _record: -_record.total)],
+                fd,
+                indent=2,
+            )
+
+        # Folded stacks (flamegraph.pl / speedscope), sampler sleeps as a child frame of the fixture
+        folded: dict[str, float] = defaultdict(float)
+        for record in self.merged_records.values():
+            if record.scope == "test":
+                continue
+            folded[record.key] += max(record.self_total - record.sampler_sleep, 0)
+            folded[f"{record.key};TimeoutSampler sleep"] += record.sampler_sleep
+
+        folded_file = os.path.join(self.output_dir, f"{FIXTURE_PROFILE_FILE_PREFIX}.folded")
+        with open(folded_file, "w") as fd:
+            for stack, duration in sorted(folded.items()):
+                if microseconds := int(duration * 1_000_000):
+                    fd.write(f"{stack} {microseconds}\n")
+
+        LOGGER.info(f"Fixture profile written to {merged_file} and {folded_file}")
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter, exitstatus: int, config: Config) -> None:
+        if not (self.is_controller and self.merged_records):
+            return
+
+        terminalreporter.write_sep(sep="-", title=f"Fixture profile (top {FIXTURE_PROFILE_SUMMARY_TOP} by total time)")
+        terminalreporter.write_line(
+            line=f"{'total(s)':>10} {'sleep(s)':>10} {'max(s)':>9} {'count':>6}  scope;fixture[param];phase"
+        )
+        for record in sorted(
+            (record for record in self.merged_records.values() if record.scope != "test"),
+            key=lambda _record: -_record.total,
+        )[:FIXTURE_PROFILE_SUMMARY_TOP]:
+            terminalreporter.write_line(
+                line=f"{record.total:>10.1f} {record.sampler_sleep:>10.1f} {record.max:>9.1f} {record.count:>6}  "
+                f"{record.key}"
+            )
+
+
+class _SamplerSleepAccountingTime:
+    """Proxy of the `time` module used by timeout_sampler, accounting sleeps to the active profile frame."""
+
+    def __init__(self, profiler: FixtureProfiler, time_module: ModuleType) -> None:
+        self._profiler = profiler
+        self._time_module = time_module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._time_module, name)
+
+    def sleep(self, seconds: float) -> None:
+        start = time.perf_counter()
+        try:
+            self._time_module.sleep(seconds)
+        finally:
+            self._profiler.add_sampler_sleep(duration=time.perf_counter() - start)
@@ -1,30 +1,54 @@
 import base64
+import hashlib
 import os
 import re
 import uuid
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
 from kubernetes.dynamic import DynamicClient
-from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
+from kubernetes.dynamic.exceptions import ConflictError, NotFoundError, ResourceNotFoundError
 from ocp_resources.deployment import Deployment
 from ocp_resources.inference_graph import InferenceGraph
 from ocp_resources.inference_service import InferenceService
 from ocp_resources.namespace import Namespace
+from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
 from ocp_resources.pod import Pod
-from ocp_resources.resource import Resource
+from ocp_resources.resource import Resource, ResourceEditor
+from ocp_resources.storage_class import StorageClass
+from ocp_resources.volume_snapshot import VolumeSnapshot
+from ocp_resources.volume_snapshot_class import VolumeSnapshotClass
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler, retry
 
 import utilities.infra
-from utilities.constants import MODELMESH_SERVING, Annotations, KServeDeploymentType
+from utilities.constants import (
+    MODEL_CACHE_NAMESPACE,
+    MODELMESH_SERVING,
+    Annotations,
+    KServeDeploymentType,
+    Labels,
+    Timeout,
+)
 from utilities.exceptions import ResourceValueMismatch, UnexpectedResourceCountError
 from utilities.image_constants import SharedImages
+from utilities.resources.volume_snapshot_content import VolumeSnapshotContent
 
 # Constants for image validation
 SHA256_DIGEST_PATTERN = r"@sha256:[a-f0-9]{64}$"
 
 LOGGER = structlog.get_logger(name=__name__)
 
+MODEL_DOWNLOAD_TIMEOUT: int = 25 * 60
+RESTRICTED_SECURITY_CONTEXT: dict[str, Any] = {
+    "allowPrivilegeEscalation": False,
+    "capabilities": {"drop": ["ALL"]},
+    "runAsNonRoot": True,
+    "seccompProfile": {"type": "RuntimeDefault"},
+}
+
 # ANSI stripping functionality
 _ANSI_ESCAPE_RE = re.compile(r"\x1b(?:\[[?!>]?[0-9;:]*[A-Za-z]|\][^\x07]*(?:\x07|\x1b\\)|[()][A-B0-2]|[=>NODMHc78])")
 
@@ -95,7 +119,348 @@ def namespace_fs_group(client: DynamicClient, namespace: str) -> int | None:
     return int(uid_range.split("/")[0])
 
 
-def download_model_data(
+def get_model_cache_key(
+    bucket_name: str,
+    model_path: str,
+    storage_class: str | None,
+    use_sub_path: bool,
+    restricted_scc_init: bool,
+) -> str:
+    """
+    Returns a content address for model data on a PVC
+
+    The download layout flags are part of the key, as they change where the data lands on the PVC.
+
+    Args:
+        bucket_name (str): Name of the bucket
+        model_path (str): Path to the model
+        storage_class (str | None): PVC storage class name
+        use_sub_path (bool): Whether the model is downloaded to a sub path
+        restricted_scc_init (bool): Whether the restricted-SCC-safe init is used
+
+    Returns:
+        str: Label-safe hash of the bucket, model path, storage class and download layout
+
+    """
+    return hashlib.sha256(
+        f"{bucket_name}/{model_path}/{storage_class}/{use_sub_path}/{restricted_scc_init}".encode()
+    ).hexdigest()[:32]
+
+
+def is_model_cache_pvc_completed(pvc: PersistentVolumeClaim) -> bool:
+    """Whether the model cache PVC holds fully downloaded model data."""
+    return (pvc.instance.metadata.annotations or {}).get(Annotations.OpenDataHubIo.MODEL_CACHE_COMPLETED) == "true"
+
+
+def get_volume_snapshot_class(client: DynamicClient, storage_class: str) -> VolumeSnapshotClass | None:
+    """
+    Returns the VolumeSnapshotClass of the storage class provisioner
+
+    Args:
+        client (DynamicClient): Admin client
+        storage_class (str): Storage class name
+
+    Returns:
+        VolumeSnapshotClass | None: VolumeSnapshotClass of the provisioner, None if it does not support snapshots
+
+    """
+    provisioner = StorageClass(client=client, name=storage_class).instance.provisioner
+    return next(
+        (
+            snapshot_class
+            for snapshot_class in VolumeSnapshotClass.get(client=client)
+            if snapshot_class.instance.driver == provisioner
+        ),
+        None,
+    )
+
+
+def wait_for_model_cache_pvc_completed(pvc: PersistentVolumeClaim, timeout: int) -> bool:
+    """
+    Waits for the download of another run or worker into the model cache PVC
+
+    Args:
+        pvc (PersistentVolumeClaim): Model cache PVC
+        timeout (int): Timeout in seconds
+
+    Returns:
+        bool: True if the download completed, False if it did not complete in time or the PVC was deleted
+
+    """
+    try:
+        for sample in TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=10,
+            func=lambda: not pvc.exists or is_model_cache_pvc_completed(pvc=pvc),
+        ):
+            if sample:
+                return bool(pvc.exists) and is_model_cache_pvc_completed(pvc=pvc)
+
+    except TimeoutExpiredError:
+        LOGGER.warning(f"Model cache PVC {pvc.name} did not complete within {timeout} seconds")
+
+    return False
+
+
+def get_model_cache_pvc(
+    client: DynamicClient,
+    cache_key: str,
+    storage_class: str,
+    size: str,
+    download_model: Callable[[PersistentVolumeClaim], None],
+) -> PersistentVolumeClaim:
+    """
+    Returns the PVC holding fully downloaded model data for the cache key, downloading it if missing
+
+    Cache PVCs live in `MODEL_CACHE_NAMESPACE`, are looked up by their cache key label and kept across runs.
+    They are annotated as completed only once the download succeeded; a PVC left half-filled by an interrupted
+    download is re-created, while a download still in progress in another run or worker is waited for.
+
+    Args:
+        client (DynamicClient): Admin client
+        cache_key (str): Model cache key, see `get_model_cache_key`
+        storage_class (str): Storage class name of the cache PVC
+        size (str): Size of the cache PVC
+        download_model (Callable[[PersistentVolumeClaim], None]): Downloads the model data to the cache PVC
+
+    Returns:
+        PersistentVolumeClaim: Completed model cache PVC
+
+    Raises:
+        TimeoutExpiredError: If another run or worker did not complete its download in time
+
+    """
+    namespace = Namespace(client=client, name=MODEL_CACHE_NAMESPACE, teardown=False)
+    if not namespace.exists:
+        namespace.deploy(wait=True)
+
+    cache_pvc = next(
+        PersistentVolumeClaim.get(
+            client=client,
+            namespace=MODEL_CACHE_NAMESPACE,
+            label_selector=f"{Labels.OpenDataHubIo.MODEL_CACHE_KEY}={cache_key}",
+        ),
+        None,
+    )
+    if cache_pvc:
+        if is_model_cache_pvc_completed(pvc=cache_pvc):
+            LOGGER.info(f"Reusing model cache PVC {cache_pvc.name}")
+            return cache_pvc
+
+        # A download in progress started less than MODEL_DOWNLOAD_TIMEOUT ago
+        download_age = (
+            datetime.now(tz=UTC) - datetime.fromisoformat(cache_pvc.instance.metadata.creationTimestamp)
+        ).total_seconds()
+        if download_age < MODEL_DOWNLOAD_TIMEOUT and wait_for_model_cache_pvc_completed(
+            pvc=cache_pvc, timeout=int(MODEL_DOWNLOAD_TIMEOUT - download_age)
+        ):
+            return cache_pvc
+
+        LOGGER.warning(f"Deleting half-filled model cache PVC {cache_pvc.name}")
+        cache_pvc.clean_up()
+
+    cache_pvc = PersistentVolumeClaim(
+        client=client,
+        name=f"model-cache-{cache_key}",
+        namespace=MODEL_CACHE_NAMESPACE,
+        storage_class=storage_class,
+        accessmodes=PersistentVolumeClaim.AccessMode.RWO,
+        size=size,
+        label={Labels.OpenDataHubIo.MODEL_CACHE_KEY: cache_key},
+        annotations={Annotations.OpenDataHubIo.MODEL_CACHE_COMPLETED: "false"},
+        teardown=False,
+    )
+    try:
+        cache_pvc.deploy()
+
+    except ConflictError:
+        # Created by another worker in the meantime
+        if not wait_for_model_cache_pvc_completed(pvc=cache_pvc, timeout=MODEL_DOWNLOAD_TIMEOUT):
+            raise TimeoutExpiredError(f"Model cache PVC {cache_pvc.name} was not completed by another worker")
+
+        return cache_pvc
+
+    try:
+        download_model(cache_pvc)
+
+    except Exception:
+        cache_pvc.clean_up()
+        raise
+
+    ResourceEditor(
+        patches={cache_pvc: {"metadata": {"annotations": {Annotations.OpenDataHubIo.MODEL_CACHE_COMPLETED: "true"}}}}
+    ).update()
+
+    return cache_pvc
+
+
+def get_model_cache_snapshot(
+    client: DynamicClient,
+    cache_pvc: PersistentVolumeClaim,
+    snapshot_class: VolumeSnapshotClass,
+) -> VolumeSnapshot:
+    """
+    Returns a ready VolumeSnapshot of the model cache PVC, taking it if missing
+
+    Args:
+        client (DynamicClient): Admin client
+        cache_pvc (PersistentVolumeClaim): Completed model cache PVC
+        snapshot_class (VolumeSnapshotClass): VolumeSnapshotClass of the cache PVC provisioner
+
+    Returns:
+        VolumeSnapshot: Model cache snapshot, kept across runs
+
+    """
+    snapshot = VolumeSnapshot(
+        client=client,
+        name=cache_pvc.name,
+        namespace=MODEL_CACHE_NAMESPACE,
+        source={"persistentVolumeClaimName": cache_pvc.name},
+        volume_snapshot_class_name=snapshot_class.name,
+        label=cache_pvc.instance.metadata.labels,
+        teardown=False,
+    )
+    if not snapshot.exists:
+        snapshot.deploy()
+
+    wait_for_volume_snapshot_ready(snapshot=snapshot)
+    return snapshot
+
+
+def wait_for_volume_snapshot_ready(snapshot: VolumeSnapshot) -> None:
+    """Waits for the VolumeSnapshot to be ready to use."""
+    for sample in TimeoutSampler(
+        wait_timeout=Timeout.TIMEOUT_10MIN,
+        sleep=5,
+        func=lambda: (snapshot.instance.status or {}).get("readyToUse"),
+    ):
+        if sample:
+            return
+
+
+@contextmanager
+def model_pvc_from_cache(
+    client: DynamicClient,
+    name: str,
+    namespace: str,
+    cache_snapshot: VolumeSnapshot,
+) -> Generator[PersistentVolumeClaim, Any, Any]:
+    """
+    Creates a writable copy of cached model data as a new PVC
+
+    The cache snapshot is bound to a VolumeSnapshot of the target namespace through a pre-provisioned
+    VolumeSnapshotContent (snapshots cannot be restored across namespaces directly), which the PVC is restored from.
+
+    Args:
+        client (DynamicClient): Admin client
+        name (str): Name of the PVC copy
+        namespace (str): Namespace of the PVC copy
+        cache_snapshot (VolumeSnapshot): Model cache snapshot, see `get_model_cache_snapshot`
+
+    Yields:
+        PersistentVolumeClaim: PVC copy, bound on first consumer depending on its storage class
+
+    """
+    cache_snapshot_content = VolumeSnapshotContent(
+        client=client, name=cache_snapshot.instance.status.boundVolumeSnapshotContentName
+    ).instance
+    cache_pvc_spec = PersistentVolumeClaim(
+        client=client,
+        name=cache_snapshot.instance.spec.source.persistentVolumeClaimName,
+        namespace=MODEL_CACHE_NAMESPACE,
+    ).instance.spec
+
+    with (
+        VolumeSnapshotContent(
+            client=client,
+            name=f"{cache_snapshot.name}-{namespace}",
+            # The physical snapshot belongs to the cache snapshot
+            deletion_policy="Retain",
+            driver=cache_snapshot_content.spec.driver,
+            source={"snapshotHandle": cache_snapshot_content.status.snapshotHandle},
+            volume_snapshot_class_name=cache_snapshot.instance.spec.volumeSnapshotClassName,
+            volume_snapshot_ref={"name": cache_snapshot.name, "namespace": namespace},
+        ) as snapshot_content,
+        VolumeSnapshot(
+            client=client,
+            name=cache_snapshot.name,
+            namespace=namespace,
+            source={"volumeSnapshotContentName": snapshot_content.name},
+        ) as snapshot,
+    ):
+        wait_for_volume_snapshot_ready(snapshot=snapshot)
+        with PersistentVolumeClaim(
+            client=client,
+            kind_dict={
+                "apiVersion": "v1",
+                "kind": "PersistentVolumeClaim",
+                "metadata": {"name": name, "namespace": namespace},
+                "spec": {
+                    "accessModes": [PersistentVolumeClaim.AccessMode.RWO],
+                    "storageClassName": cache_pvc_spec.storageClassName,
+                    "resources": {"requests": {"storage": snapshot.instance.status.restoreSize}},
+                    "dataSource": {
+                        "apiGroup": VolumeSnapshot.api_group,
+                        "kind": "VolumeSnapshot",
+                        "name": snapshot.name,
+                    },
+                },
+            },
+        ) as pvc:
+            yield pvc
+
+
+def _copy_model_data_from_cache(
+    client: DynamicClient,
+    cache_snapshot: VolumeSnapshot,
+    model_namespace: str,
+    model_pvc_name: str,
+    restricted_scc_init: bool,
+    node_selector: dict[str, str] | None,
+) -> None:
+    """Copies the cached model data to the PVC, through a writable copy of the cache in the PVC namespace."""
+    with model_pvc_from_cache(
+        client=client,
+        name=f"{model_pvc_name}-cache",
+        namespace=model_namespace,
+        cache_snapshot=cache_snapshot,
+    ) as cache_pvc_copy:
+        container: dict[str, Any] = {
+            "name": "model-copier",
+            "image": SharedImages.BUSYBOX,
+            "command": ["sh", "-c"],
+            # lost+found of the cache volume is not readable by restricted pods
+            "args": ["find /mnt/cache -mindepth 1 -maxdepth 1 ! -name lost+found -exec cp -R {} /mnt/models/ ';'"],
+            "volumeMounts": [
+                {"mountPath": "/mnt/cache/", "name": "model-cache", "readOnly": True},
+                {"mountPath": "/mnt/models/", "name": model_pvc_name},
+            ],
+        }
+        pod_kwargs: dict[str, Any] = {
+            "client": client,
+            "namespace": model_namespace,
+            "name": "copy-model-data",
+            "containers": [container],
+            "volumes": [
+                {"name": "model-cache", "persistentVolumeClaim": {"claimName": cache_pvc_copy.name}},
+                {"name": model_pvc_name, "persistentVolumeClaim": {"claimName": model_pvc_name}},
+            ],
+            "restart_policy": "Never",
+        }
+        if restricted_scc_init:
+            container["securityContext"] = RESTRICTED_SECURITY_CONTEXT
+            if (fs_group := namespace_fs_group(client=client, namespace=model_namespace)) is not None:
+                pod_kwargs["security_context"] = {"fsGroup": fs_group, "seccompProfile": {"type": "RuntimeDefault"}}
+
+        if node_selector:
+            pod_kwargs["node_selector"] = node_selector
+
+        with Pod(**pod_kwargs) as pod:
+            LOGGER.info(f"Waiting for model data copy from {cache_snapshot.name} to complete")
+            pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=MODEL_DOWNLOAD_TIMEOUT)
+
+
+def _run_model_download_pod(
     client: DynamicClient,
     aws_access_key_id: str,
     aws_secret_access_key: str,
@@ -108,9 +473,10 @@ def download_model_data(
     use_sub_path: bool = False,
     restricted_scc_init: bool = False,
     node_selector: dict[str, str] | None = None,
-) -> str:
+    pod_name: str = "download-model-data",
+) -> None:
     """
-    Downloads the model data from the bucket to the PVC
+    Runs a pod downloading the model data from the bucket to the PVC
 
     Args:
         client (DynamicClient): Admin client
@@ -126,9 +492,7 @@ def download_model_data(
         restricted_scc_init (bool): Use OpenShift restricted-SCC-safe init (no chmod,
             fsGroup from namespace, init container mounts full PVC when use_sub_path).
         node_selector (dict[str, str] | None): Optional nodeSelector for the download pod.
-
-    Returns:
-        str: Path to the model path
+        pod_name (str): Name of the download pod
 
     """
     volume_mount = {"mountPath": "/mnt/models/", "name": model_pvc_name}
@@ -157,13 +521,6 @@ def download_model_data(
         ]
         download_destination = pvc_model_path
 
-    restricted_security_context = {
-        "allowPrivilegeEscalation": False,
-        "capabilities": {"drop": ["ALL"]},
-        "runAsNonRoot": True,
-        "seccompProfile": {"type": "RuntimeDefault"},
-    }
-
     init_container: dict[str, Any] = {
         "name": "init-container",
         "image": SharedImages.BUSYBOX,
@@ -191,8 +548,8 @@ def download_model_data(
     }
 
     if restricted_scc_init:
-        init_container["securityContext"] = restricted_security_context
-        downloader_container["securityContext"] = restricted_security_context
+        init_container["securityContext"] = RESTRICTED_SECURITY_CONTEXT
+        downloader_container["securityContext"] = RESTRICTED_SECURITY_CONTEXT
 
     init_containers = [init_container]
     containers = [downloader_container]
@@ -201,7 +558,7 @@ def download_model_data(
     pod_kwargs: dict[str, Any] = {
         "client": client,
         "namespace": model_namespace,
-        "name": "download-model-data",
+        "name": pod_name,
         "init_containers": init_containers,
         "containers": containers,
         "volumes": volumes,
@@ -217,8 +574,105 @@ def download_model_data(
 
     with Pod(**pod_kwargs) as pod:
         LOGGER.info("Waiting for model download to complete")
-        pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=25 * 60)
+        pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=MODEL_DOWNLOAD_TIMEOUT)
+
+
+def download_model_data(
+    client: DynamicClient,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    model_namespace: str,
+    model_pvc_name: str,
+    bucket_name: str,
+    aws_endpoint_url: str,
+    aws_default_region: str,
+    model_path: str,
+    use_sub_path: bool = False,
+    restricted_scc_init: bool = False,
+    node_selector: dict[str, str] | None = None,
+    use_cache: bool = False,
+) -> str:
+    """
+    Downloads the model data from the bucket to the PVC
+
+    With `use_cache`, the model data is downloaded once to a cache PVC, see `get_model_cache_pvc`, and copied from
+    its snapshot; storage classes without VolumeSnapshot support download from the bucket.
+
+    Args:
+        client (DynamicClient): Admin client
+        aws_access_key_id (str): AWS access key
+        aws_secret_access_key (str): AWS secret key
+        model_namespace (str): Namespace of the model
+        model_pvc_name (str): Name of the PVC
+        bucket_name (str): Name of the bucket
+        aws_endpoint_url (str): AWS endpoint URL
+        aws_default_region (str): AWS default region
+        model_path (str): Path to the model
+        use_sub_path (bool): Whether to use a sub path
+        restricted_scc_init (bool): Use OpenShift restricted-SCC-safe init (no chmod,
+            fsGroup from namespace, init container mounts full PVC when use_sub_path).
+        node_selector (dict[str, str] | None): Optional nodeSelector for the download pod.
+        use_cache (bool): Reuse model data downloaded by previous classes and runs
+
+    Returns:
+        str: Path to the model path
+
+    """
+    download_kwargs: dict[str, Any] = {
+        "client": client,
+        "aws_access_key_id": aws_access_key_id,
+        "aws_secret_access_key": aws_secret_access_key,
+        "bucket_name": bucket_name,
+        "aws_endpoint_url": aws_endpoint_url,
+        "aws_default_region": aws_default_region,
+        "model_path": model_path,
+        "use_sub_path": use_sub_path,
+        "restricted_scc_init": restricted_scc_init,
+        "node_selector": node_selector,
+    }
+
+    if use_cache:
+        model_pvc_spec = PersistentVolumeClaim(
+            client=client, name=model_pvc_name, namespace=model_namespace
+        ).instance.spec
+        if snapshot_class := get_volume_snapshot_class(client=client, storage_class=model_pvc_spec.storageClassName):
+            cache_key = get_model_cache_key(
+                bucket_name=bucket_name,
+                model_path=model_path,
+                storage_class=model_pvc_spec.storageClassName,
+                use_sub_path=use_sub_path,
+                restricted_scc_init=restricted_scc_init,
+            )
+            cache_pvc = get_model_cache_pvc(
+                client=client,
+                cache_key=cache_key,
+                storage_class=model_pvc_spec.storageClassName,
+                size=model_pvc_spec.resources.requests.storage,
+                download_model=lambda _cache_pvc: _run_model_download_pod(
+                    model_namespace=MODEL_CACHE_NAMESPACE,
+                    model_pvc_name=_cache_pvc.name,
+                    pod_name=f"download-{_cache_pvc.name}",
+                    **download_kwargs,
+                ),
+            )
+            _copy_model_data_from_cache(
+                client=client,
+                cache_snapshot=get_model_cache_snapshot(
+                    client=client, cache_pvc=cache_pvc, snapshot_class=snapshot_class
+                ),
+                model_namespace=model_namespace,
+                model_pvc_name=model_pvc_name,
+                restricted_scc_init=restricted_scc_init,
+                node_selector=node_selector,
+            )
+            return model_path
+
+        LOGGER.warning(
+            f"Storage class {model_pvc_spec.storageClassName} does not support VolumeSnapshots, "
+            "downloading the model data without cache"
+        )
 
+    _run_model_download_pod(model_namespace=model_namespace, model_pvc_name=model_pvc_name, **download_kwargs)
     return model_path
 
 
@@ -1,5 +1,11 @@
+import json
 import os
 import re
+import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable
+from contextlib import closing, contextmanager
 from functools import cache
 from typing import Any
 
@@ -16,6 +22,93 @@ from urllib3.exceptions import NewConnectionError
 LOGGER = structlog.get_logger(name=__name__)
 
 JIRA_CLOSED_STATUSES = ("closed", "resolved", "testing")
+JIRA_FIELDS = "status, fixVersions"
+# On-disk cache shared by xdist workers and by consecutive runs
+JIRA_CACHE_PATH = os.getenv(
+    "PYTEST_JIRA_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "jira-cache.sqlite"),
+)
+JIRA_CACHE_TTL = int(os.getenv("PYTEST_JIRA_CACHE_TTL", "3600"))
+# Serve expired entries immediately and refresh them in the background
+JIRA_CACHE_STALE_WHILE_REVALIDATE = os.getenv("PYTEST_JIRA_CACHE_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+
+
+class JiraIssueCache:
+    """
+    Persistent Jira issue fields cache, keyed by issue id.
+
+    Backed by sqlite, which serializes concurrent writers from different processes (xdist workers).
+    """
+
+    def __init__(self, path: str, ttl: int) -> None:
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS issues (jira_id TEXT PRIMARY KEY, fields TEXT NOT NULL, updated_at REAL)"
+            )
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection, Any, Any]:
+        with closing(sqlite3.connect(database=self.path, timeout=60, isolation_level=None)) as connection:
+            yield connection
+
+    @staticmethod
+    def _set_many(connection: sqlite3.Connection, issues_fields: dict[str, dict[str, Any]]) -> None:
+        updated_at = time.time()
+        connection.executemany(
+            "INSERT OR REPLACE INTO issues (jira_id, fields, updated_at) VALUES (?, ?, ?)",
+            [(jira_id, json.dumps(fields), updated_at) for jira_id, fields in issues_fields.items()],
+        )
+
+    def get(self, jira_id: str) -> tuple[dict[str, Any] | None, bool]:
+        """
+        Get cached issue fields.
+
+        Args:
+            jira_id (str): Jira issue id.
+
+        Returns:
+            tuple[dict[str, Any] | None, bool]: issue fields (None if not cached) and whether the entry is fresh.
+
+        """
+        with self._connection() as connection:
+            row = connection.execute("SELECT fields, updated_at FROM issues WHERE jira_id = ?", (jira_id,)).fetchone()
+
+        if not row:
+            return None, False
+
+        return json.loads(row[0]), time.time() - row[1] < self.ttl
+
+    def set(self, jira_id: str, fields: dict[str, Any]) -> None:
+        with self._connection() as connection:
+            self._set_many(connection=connection, issues_fields={jira_id: fields})
+
+    def refresh(self, jira_ids: Iterable[str]) -> None:
+        """
+        Fetch missing or expired issues in one bulk JQL query and store them.
+
+        No sqlite lock is held while Jira is queried, so other processes keep reading the cache; concurrent
+        refreshes of the same keys store the same fields.
+
+        Args:
+            jira_ids (Iterable[str]): Jira issue ids.
+
+        """
+        fresh_since = time.time() - self.ttl
+        with self._connection() as connection:
+            stale_ids = [
+                jira_id
+                for jira_id in sorted(set(jira_ids))
+                if not connection.execute(
+                    "SELECT 1 FROM issues WHERE jira_id = ? AND updated_at > ?", (jira_id, fresh_since)
+                ).fetchone()
+            ]
+
+        if stale_ids and (issues_fields := search_jira_issues_fields(jira_ids=stale_ids)):
+            with self._connection() as connection:
+                self._set_many(connection=connection, issues_fields=issues_fields)
 
 
 @cache
@@ -34,17 +127,116 @@ def get_jira_connection() -> JIRA:
 
 
 @cache
-def get_jira_issue_fields(jira_id: str) -> Any:
+def get_jira_issue_cache() -> JiraIssueCache:
+    """
+    Get the persistent Jira issue cache.
+
+    Returns:
+        JiraIssueCache: Jira issue cache.
+
+    """
+    return JiraIssueCache(path=JIRA_CACHE_PATH, ttl=JIRA_CACHE_TTL)
+
+
+def get_issue_fields_dict(issue: Any) -> dict[str, Any]:
+    """Convert Jira issue to a serializable dict with status and fix versions names."""
+    return {
+        "status": issue.fields.status.name,
+        "fix_versions": [fix_version.name for fix_version in issue.fields.fixVersions],
+    }
+
+
+def search_jira_issues_fields(jira_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Get Jira issues fields with one bulk JQL query.
+
+    Jira rejects the whole query if one key does not exist (or is not visible), the issues are then fetched
+    one by one and the failing ones are skipped.
+
+    Args:
+        jira_ids (list[str]): Jira issue ids.
+
+    Returns:
+        dict[str, dict[str, Any]]: Jira issue id to fields dict.
+
+    """
+    LOGGER.info(f"Fetching {len(jira_ids)} Jira issues: {jira_ids}")
+    try:
+        issues = get_jira_connection().search_issues(
+            jql_str=f"key in ({', '.join(jira_ids)})",
+            fields=JIRA_FIELDS,
+            maxResults=len(jira_ids),
+        )
+    except JIRAError as ex:
+        LOGGER.warning(f"Bulk Jira query failed ({ex.text}), fetching issues one by one")
+    else:
+        return {issue.key: get_issue_fields_dict(issue=issue) for issue in issues}
+
+    issues_fields: dict[str, dict[str, Any]] = {}
+    for jira_id in jira_ids:
+        try:
+            issues_fields[jira_id] = get_issue_fields_dict(
+                issue=get_jira_connection().issue(id=jira_id, fields=JIRA_FIELDS)
+            )
+        except JIRAError as ex:
+            LOGGER.warning(f"Failed to get Jira issue {jira_id}: {ex.text}")
+
+    return issues_fields
+
+
+def prefetch_jira_issues(jira_ids: set[str]) -> None:
+    """
+    Resolve Jira issues into the persistent cache.
+
+    Args:
+        jira_ids (set[str]): Jira issue ids.
+
+    """
+    if not os.getenv("PYTEST_JIRA_URL"):
+        LOGGER.info("PYTEST_JIRA_URL is not set, skipping Jira issues prefetch")
+        return
+
+    try:
+        get_jira_issue_cache().refresh(jira_ids=jira_ids)
+    except NewConnectionError, JIRAError, RequestsConnectionError, OSError, sqlite3.Error:
+        LOGGER.warning(f"Failed to prefetch Jira issues {sorted(jira_ids)}")
+
+
+@cache
+def get_jira_issue_fields(jira_id: str) -> dict[str, Any]:
     """
     Get Jira issue fields (status and fixVersions).
 
+    Served from the persistent cache when fresh; with stale-while-revalidate, expired entries are returned
+    immediately and refreshed in the background. If the cache cannot be used, the issue is fetched directly.
+
     Args:
         jira_id: Jira issue id (e.g. "RHOAIENG-52129").
 
     Returns:
-        Jira issue fields object with status and fixVersions.
+        dict with Jira issue status name and fix versions names.
     """
-    return get_jira_connection().issue(id=jira_id, fields="status, fixVersions").fields
+    try:
+        fields, is_fresh = get_jira_issue_cache().get(jira_id=jira_id)
+    except OSError, sqlite3.Error:
+        LOGGER.warning(f"Jira {jira_id}: issue cache {JIRA_CACHE_PATH} unavailable, fetching it directly")
+        fields, is_fresh = None, False
+
+    if fields and is_fresh:
+        return fields
+
+    if fields and JIRA_CACHE_STALE_WHILE_REVALIDATE:
+        LOGGER.info(f"Jira {jira_id}: serving stale cache entry, refreshing in background")
+        threading.Thread(target=prefetch_jira_issues, kwargs={"jira_ids": {jira_id}}, daemon=True).start()
+        return fields
+
+    fields = get_issue_fields_dict(issue=get_jira_connection().issue(id=jira_id, fields=JIRA_FIELDS))
+    try:
+        get_jira_issue_cache().set(jira_id=jira_id, fields=fields)
+    except OSError, sqlite3.Error:
+        LOGGER.warning(f"Jira {jira_id}: failed to store the issue in cache {JIRA_CACHE_PATH}")
+
+    return fields
 
 
 def is_jira_open(jira_id: str, admin_client: DynamicClient) -> bool:  # skip-unused-code
@@ -66,8 +258,8 @@ def is_jira_open(jira_id: str, admin_client: DynamicClient) -> bool:  # skip-unu
         jira_fields = get_jira_issue_fields(jira_id=jira_id)
         jira_fix_versions: list[Version] = [
             Version(_fix_version.group())
-            for fix_version in jira_fields.fixVersions
-            if (_fix_version := re.search(r"\d+\.\d+(?:\.\d+)?", fix_version.name))
+            for fix_version in jira_fields["fix_versions"]
+            if (_fix_version := re.search(r"\d+\.\d+(?:\.\d+)?", fix_version))
         ]
 
         if not jira_fix_versions:
@@ -105,7 +297,7 @@ def is_jira_issue_open(jira_id: str) -> bool:  # skip-unused-code
         True if Jira is unreachable (assumes issue is open).
     """
     try:
-        jira_status = get_jira_issue_fields(jira_id=jira_id).status.name.lower()
+        jira_status = get_jira_issue_fields(jira_id=jira_id)["status"].lower()
     except NewConnectionError, JIRAError, RequestsConnectionError:
         LOGGER.warning(f"Failed to get Jira issue {jira_id}, assuming it is open")
         return True
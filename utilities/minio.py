@@ -1,7 +1,17 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+import io
+import socket
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from pathlib import Path
 from typing import Any
 
+import boto3
+import portforward
+import structlog
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.secret import Secret
 from ocp_resources.service import Service
@@ -9,6 +19,12 @@ from ocp_resources.service import Service
 from utilities.constants import ApiGroups, Labels, MinIo, Protocols
 from utilities.general import get_s3_secret_dict
 
+LOGGER = structlog.get_logger(name=__name__)
+
+S3_MAX_CONCURRENCY: int = 8
+# Objects above the threshold are uploaded/copied in concurrent multipart chunks
+S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=S3_MAX_CONCURRENCY)
+
 
 @contextmanager
 def create_minio_data_connection_secret(
@@ -51,3 +67,133 @@ def create_minio_data_connection_secret(
         },
     ) as minio_secret:
         yield minio_secret
+
+
+def get_free_local_port() -> int:
+    """Return a free local TCP port to port-forward to."""
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_s3_client(endpoint_url: str, access_key: str, secret_key: str, region: str = "us-east-1") -> Any:
+    """
+    Get a boto3 S3 client with path-style addressing, as used by MinIO.
+
+    Args:
+        endpoint_url (str): S3 endpoint URL.
+        access_key (str): S3 access key.
+        secret_key (str): S3 secret key.
+        region (str): S3 region.
+
+    Returns:
+        S3 client.
+    """
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=Config(s3={"addressing_style": "path"}, max_pool_connections=S3_MAX_CONCURRENCY * 2),
+    )
+
+
+@contextmanager
+def minio_s3_client(
+    minio_service: Service,
+    access_key: str = MinIo.Credentials.ACCESS_KEY_VALUE,
+    secret_key: str = MinIo.Credentials.SECRET_KEY_VALUE,  # pragma: allowlist secret
+    port: int = MinIo.Metadata.DEFAULT_PORT,
+) -> Generator[Any, Any, Any]:
+    """
+    Port-forward a MinIO service and yield an S3 client talking to it from the test runner.
+
+    Args:
+        minio_service (Service): MinIO service.
+        access_key (str): MinIO access key.
+        secret_key (str): MinIO secret key.
+        port (int): MinIO service S3 port.
+
+    Yields:
+        S3 client.
+    """
+    local_port = get_free_local_port()
+    with portforward.forward(
+        pod_or_service=minio_service.name,
+        namespace=minio_service.namespace,
+        from_port=local_port,
+        to_port=port,
+        waiting=20,
+    ):
+        LOGGER.info(f"MinIO service {minio_service.name} port-forwarded to localhost:{local_port}")
+        yield get_s3_client(endpoint_url=f"http://localhost:{local_port}", access_key=access_key, secret_key=secret_key)
+
+
+def ensure_s3_bucket(s3_client: Any, bucket: str) -> None:
+    """Create the bucket if it does not exist."""
+    try:
+        s3_client.head_bucket(Bucket=bucket)
+    except ClientError:
+        LOGGER.info(f"Creating S3 bucket {bucket}")
+        s3_client.create_bucket(Bucket=bucket)
+
+
+def _run_s3_transfers(transfer: Callable[[str, Any], None], objects: dict[str, Any]) -> None:
+    with ThreadPoolExecutor(max_workers=min(S3_MAX_CONCURRENCY, len(objects)) or 1) as executor:
+        # list() re-raises the first failed transfer
+        list(executor.map(transfer, objects.keys(), objects.values()))
+
+
+def upload_s3_objects(
+    s3_client: Any,
+    bucket: str,
+    objects: dict[str, bytes | Path],
+    create_bucket: bool = True,
+) -> None:
+    """
+    Upload objects concurrently from the test runner; large files are uploaded in multipart chunks.
+
+    Args:
+        s3_client: S3 client.
+        bucket (str): destination bucket.
+        objects (dict[str, bytes | Path]): object key to content or local file path.
+        create_bucket (bool): create the bucket if it does not exist.
+    """
+    if create_bucket:
+        ensure_s3_bucket(s3_client=s3_client, bucket=bucket)
+
+    def _upload(key: str, body: bytes | Path) -> None:
+        if isinstance(body, Path):
+            s3_client.upload_file(Filename=str(body), Bucket=bucket, Key=key, Config=S3_TRANSFER_CONFIG)
+        else:
+            s3_client.upload_fileobj(Fileobj=io.BytesIO(body), Bucket=bucket, Key=key, Config=S3_TRANSFER_CONFIG)
+        LOGGER.info(f"Uploaded s3://{bucket}/{key}")
+
+    _run_s3_transfers(transfer=_upload, objects=objects)
+
+
+def transfer_s3_objects(
+    src_client: Any,
+    src_bucket: str,
+    dst_client: Any,
+    dst_bucket: str,
+    objects: dict[str, str],
+) -> None:
+    """
+    Stream objects concurrently from one S3 server to another through the test runner, without local files.
+
+    Args:
+        src_client: source S3 client.
+        src_bucket (str): source bucket.
+        dst_client: destination S3 client.
+        dst_bucket (str): destination bucket.
+        objects (dict[str, str]): destination key to source key.
+    """
+
+    def _transfer(key: str, src_key: str) -> None:
+        body = src_client.get_object(Bucket=src_bucket, Key=src_key)["Body"]
+        dst_client.upload_fileobj(Fileobj=body, Bucket=dst_bucket, Key=key, Config=S3_TRANSFER_CONFIG)
+        LOGGER.info(f"Transferred s3://{src_bucket}/{src_key} to s3://{dst_bucket}/{key}")
+
+    _run_s3_transfers(transfer=_transfer, objects=objects)
@@ -0,0 +1,93 @@
+# Generated using https://github.com/RedHatQE/openshift-python-wrapper/blob/main/scripts/resource/README.md
+
+
+from typing import Any
+
+from ocp_resources.exceptions import MissingRequiredArgumentError
+from ocp_resources.resource import Resource
+
+
+class VolumeSnapshotContent(Resource):
+    """
+        VolumeSnapshotContent represents the actual "on-disk" snapshot object in the
+    underlying storage system
+    """
+
+    api_group: str = Resource.ApiGroup.SNAPSHOT_STORAGE_K8S_IO
+
+    def __init__(
+        self,
+        deletion_policy: str | None = None,
+        driver: str | None = None,
+        source: dict[str, Any] | None = None,
+        source_volume_mode: str | None = None,
+        volume_snapshot_class_name: str | None = None,
+        volume_snapshot_ref: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        r"""
+        Args:
+            deletion_policy (str): deletionPolicy determines whether this VolumeSnapshotContent and its
+              physical snapshot on the underlying storage system should be
+              deleted when its bound VolumeSnapshot is deleted. Supported values
+              are "Retain" and "Delete". Required.
+
+            driver (str): driver is the name of the CSI driver used to create the physical
+              snapshot on the underlying storage system. Required.
+
+            source (dict[str, Any]): source specifies whether the snapshot is (or should be) dynamically
+              provisioned or already exists, and just requires a Kubernetes
+              object representation. This field is immutable after creation.
+              Required.
+
+            source_volume_mode (str): SourceVolumeMode is the mode of the volume whose snapshot is taken.
+              Can be either “Filesystem” or “Block”.
+
+            volume_snapshot_class_name (str): name of the VolumeSnapshotClass from which this snapshot was (or
+              will be) created.
+
+            volume_snapshot_ref (dict[str, Any]): volumeSnapshotRef specifies the VolumeSnapshot object to which this
+              VolumeSnapshotContent object is bound. Required.
+
+        """
+        super().__init__(**kwargs)
+
+        self.deletion_policy = deletion_policy
+        self.driver = driver
+        self.source = source
+        self.source_volume_mode = source_volume_mode
+        self.volume_snapshot_class_name = volume_snapshot_class_name
+        self.volume_snapshot_ref = volume_snapshot_ref
+
+    def to_dict(self) -> None:
+
+        super().to_dict()
+
+        if not self.kind_dict and not self.yaml_file:
+            if self.deletion_policy is None:
+                raise MissingRequiredArgumentError(argument="self.deletion_policy")
+
+            if self.driver is None:
+                raise MissingRequiredArgumentError(argument="self.driver")
+
+            if self.source is None:
+                raise MissingRequiredArgumentError(argument="self.source")
+
+            if self.volume_snapshot_ref is None:
+                raise MissingRequiredArgumentError(argument="self.volume_snapshot_ref")
+
+            self.res["spec"] = {}
+            _spec = self.res["spec"]
+
+            _spec["deletionPolicy"] = self.deletion_policy
+            _spec["driver"] = self.driver
+            _spec["source"] = self.source
+            _spec["volumeSnapshotRef"] = self.volume_snapshot_ref
+
+            if self.source_volume_mode is not None:
+                _spec["sourceVolumeMode"] = self.source_volume_mode
+
+            if self.volume_snapshot_class_name is not None:
+                _spec["volumeSnapshotClassName"] = self.volume_snapshot_class_name
+
+    # End of generated code
@@ -1,6 +1,11 @@
 import copy
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
+import structlog
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from ocp_resources.serving_runtime import ServingRuntime
@@ -9,6 +14,113 @@ from pytest_testconfig import config as py_config
 
 from utilities.constants import ApiGroups, PortNames, Protocols, vLLM_CONFIG
 
+LOGGER = structlog.get_logger(name=__name__)
+
+# Seconds during which the listed templates are served without listing them again
+TEMPLATE_CATALOG_REVALIDATE_INTERVAL = 300
+
+
+@dataclass
+class TemplateCatalogEntry:
+    resource_version: str
+    # objects[0] of the template, None if the template has no objects
+    model_dict: dict[str, Any] | None
+
+
+class ServingRuntimeTemplateCatalog:
+    """
+    Per-process cache of operator-shipped ServingRuntime templates, listed once per namespace.
+
+    Only templates owned by the operator (with ownerReferences) are cached: templates created and deleted by
+    tests reuse names with different content, so they are fetched from the cluster on every lookup.
+    Owned templates are re-listed at most every `revalidate_interval` seconds; only templates whose
+    resourceVersion changed are parsed again. Callers get deep copies of the cached dicts.
+    """
+
+    def __init__(self, revalidate_interval: int = TEMPLATE_CATALOG_REVALIDATE_INTERVAL) -> None:
+        self.revalidate_interval = revalidate_interval
+        self._entries: dict[tuple[str, str], dict[str, TemplateCatalogEntry]] = {}
+        self._listed_at: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def _list_templates(self, client: DynamicClient, namespace: str) -> None:
+        catalog_key = (client.configuration.host, namespace)
+        cached_entries = self._entries.get(catalog_key, {})
+        entries: dict[str, TemplateCatalogEntry] = {}
+        for template in Template.get(client=client, namespace=namespace, raw=True):
+            if not template.metadata.ownerReferences:
+                continue
+
+            name = template.metadata.name
+            resource_version = template.metadata.resourceVersion
+            if (entry := cached_entries.get(name)) and entry.resource_version == resource_version:
+                entries[name] = entry
+                continue
+
+            objects = template.objects
+            entries[name] = TemplateCatalogEntry(
+                resource_version=resource_version, model_dict=objects[0].to_dict() if objects else None
+            )
+
+        LOGGER.info(f"Listed {len(entries)} operator templates in namespace {namespace}")
+        self._entries[catalog_key] = entries
+        self._listed_at[catalog_key] = time.monotonic()
+
+    def get_model_dict(self, client: DynamicClient, template_name: str, namespace: str) -> dict[str, Any]:
+        """
+        Get a copy of the first object of a template.
+
+        Args:
+            client (DynamicClient): DynamicClient object
+            template_name (str): Name of the template
+            namespace (str): Namespace where the template exists
+
+        Returns:
+            dict[str, Any]: Deep copy of the template first object
+
+        Raises:
+            ResourceNotFoundError: If the template is not found or has no objects
+
+        """
+        catalog_key = (client.configuration.host, namespace)
+        with self._lock:
+            if (
+                catalog_key not in self._entries
+                or time.monotonic() - self._listed_at[catalog_key] >= self.revalidate_interval
+            ):
+                self._list_templates(client=client, namespace=namespace)
+
+            entry = self._entries[catalog_key].get(template_name)
+
+        if entry:
+            model_dict = entry.model_dict
+
+        else:
+            # Not operator-owned (e.g. created by a test): always read the current template
+            template_instance = Template(client=client, name=template_name, namespace=namespace).exists
+            if not template_instance:
+                raise ResourceNotFoundError(f"{template_name} template not found in namespace {namespace}")
+
+            objects = template_instance.objects
+            model_dict = objects[0].to_dict() if objects else None
+
+        if not model_dict:
+            raise ResourceNotFoundError(f"{template_name} template has no objects")
+
+        return copy.deepcopy(model_dict)
+
+
+@cache
+def get_serving_runtime_template_catalog() -> ServingRuntimeTemplateCatalog:
+    """
+    Get the process-wide ServingRuntime template catalog.
+
+    Returns:
+        ServingRuntimeTemplateCatalog: ServingRuntime template catalog.
+
+    """
+    return ServingRuntimeTemplateCatalog()
+
 
 def get_runtime_image_from_template(
     client: DynamicClient,
@@ -29,18 +141,9 @@ def get_runtime_image_from_template(
     Raises:
         ResourceNotFoundError: If the template is not found, has no objects, or has no containers
     """
-    template = Template(
-        client=client,
-        name=template_name,
-        namespace=namespace,
+    model_dict = get_serving_runtime_template_catalog().get_model_dict(
+        client=client, template_name=template_name, namespace=namespace
     )
-    if not template.exists:
-        raise ResourceNotFoundError(f"{template_name} template not found in namespace {namespace}")
-
-    objects = template.instance.objects
-    if not objects:
-        raise ResourceNotFoundError(f"{template_name} template has no objects")
-    model_dict: dict[str, Any] = objects[0].to_dict()
     containers = model_dict.get("spec", {}).get("containers", [])
 
     if not containers:
@@ -137,38 +240,20 @@ class ServingRuntimeFromTemplate(ServingRuntime):
             teardown=teardown,
         )
 
-    def get_model_template(self) -> Template:
+    def get_model_dict_from_template(self) -> dict[Any, Any]:
         """
-        Get the model template from the cluster
+        Get the model dictionary from the template
 
         Returns:
-            Template: SeringRuntime Template object
-
-        Raises:
-            ResourceNotFoundError: If the template is not found
+            dict[Any, Any]: Model dict
 
         """
         # Only admin client can get templates from the cluster
-        template = Template(
+        model_dict = get_serving_runtime_template_catalog().get_model_dict(
             client=self.admin_client,
-            name=self.template_name,
+            template_name=self.template_name,
             namespace=py_config["applications_namespace"],
         )
-        if template.exists:
-            return template
-
-        raise ResourceNotFoundError(f"{self.template_name} template not found")
-
-    def get_model_dict_from_template(self) -> dict[Any, Any]:
-        """
-        Get the model dictionary from the template
-
-        Returns:
-            dict[Any, Any]: Model dict
-
-        """
-        template = self.get_model_template()
-        model_dict: dict[str, Any] = template.instance.objects[0].to_dict()
         model_dict["metadata"]["name"] = self.name
         model_dict["metadata"]["namespace"] = self.namespace
 
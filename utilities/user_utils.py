@@ -1,11 +1,15 @@
 import base64
+import copy
 import logging
 import tempfile
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 import bcrypt
 import requests
+from kubernetes.client import ApiClient
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.user import User
 from timeout_sampler import retry
@@ -15,6 +19,8 @@ from utilities.infra import get_cluster_authentication, login_with_user_password
 
 LOGGER = logging.getLogger(__name__)
 SLEEP_TIME = 5
+# Built-in OAuth client which returns the token to basic-auth challenges, as used by `oc login`
+OAUTH_CHALLENGING_CLIENT_ID = "openshift-challenging-client"
 
 
 @dataclass
@@ -30,6 +36,7 @@ class UserTestSession:
     api_server_url: str
     client: DynamicClient
     is_byoidc: bool = False
+    token: str | None = None
 
     def __post_init__(self) -> None:
         """Validate the session data after initialization."""
@@ -40,6 +47,22 @@ class UserTestSession:
         if self.client is None:
             raise ValueError("Client must be provided")
 
+    @cached_property
+    def user_client(self) -> DynamicClient:
+        """DynamicClient authenticated as the test user, without switching the kubeconfig context."""
+        if not self.token:
+            raise ValueError(f"No token for user {self.username}")
+        return get_token_client(client=self.client, token=self.token)
+
+    @cached_property
+    def requests_session(self) -> requests.Session:
+        """requests session sending the test user bearer token."""
+        if not self.token:
+            raise ValueError(f"No token for user {self.username}")
+        session = requests.Session()
+        session.headers["Authorization"] = f"Bearer {self.token}"
+        return session
+
     def cleanup(self) -> None:
         """Clean up the user context."""
         user = User(name=self.username, client=self.client)
@@ -97,6 +120,78 @@ def wait_for_user_creation(username: str, password: str, cluster_url: str) -> bo
     raise ExceptionUserLogin(f"Could not login as user {username}.")
 
 
+def get_token_client(client: DynamicClient, token: str) -> DynamicClient:
+    """Return a DynamicClient for the same cluster as *client*, authenticated with a bearer *token*."""
+    configuration = copy.copy(client.configuration)
+    configuration.api_key = {"authorization": f"Bearer {token}"}
+    configuration.api_key_prefix = {}
+    configuration.username = configuration.password = configuration.cert_file = configuration.key_file = None
+    return DynamicClient(client=ApiClient(configuration=configuration))
+
+
+def get_oauth_authorization_endpoint(api_server_url: str) -> str:
+    """Discover the OpenShift OAuth server authorization endpoint from the API server."""
+    response = requests.get(
+        f"{api_server_url}/.well-known/oauth-authorization-server",
+        verify=False,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()["authorization_endpoint"]
+
+
+def get_oauth_user_token(api_server_url: str, username: str, password: str) -> str:
+    """
+    Get an OpenShift OAuth access token for an identity provider user, the way `oc login` does,
+    without touching the kubeconfig.
+
+    Args:
+        api_server_url: The OpenShift API server URL
+        username: The username to login with
+        password: The password to login with
+
+    Returns:
+        The user bearer token
+
+    Raises:
+        ExceptionUserLogin: If the OAuth server did not issue a token
+    """
+    response = requests.get(
+        get_oauth_authorization_endpoint(api_server_url=api_server_url),
+        params={"response_type": "token", "client_id": OAUTH_CHALLENGING_CLIENT_ID},
+        auth=(username, password),
+        headers={"X-CSRF-Token": "1"},
+        allow_redirects=False,
+        verify=False,
+        timeout=30,
+    )
+    access_token = parse_qs(urlparse(response.headers.get("Location", "")).fragment).get("access_token")
+    if not access_token:
+        raise ExceptionUserLogin(f"Could not get OAuth token for user {username}, status {response.status_code}")
+    return access_token[0]
+
+
+@retry(
+    wait_timeout=240,
+    sleep=10,
+    exceptions_dict={ExceptionUserLogin: []},
+)
+def wait_for_user_oauth_token(username: str, password: str, api_server_url: str) -> str:
+    """
+    Attempts to get an OAuth token for a specific user over a period of time to ensure user creation
+
+    Args:
+        username: The username to login with
+        password: The password to login with
+        api_server_url: The OpenShift API server URL
+
+    Returns:
+        The user bearer token
+    """
+    LOGGER.info(f"Attempting to get OAuth token for {username}")
+    return get_oauth_user_token(api_server_url=api_server_url, username=username, password=password)
+
+
 def get_oidc_token_endpoint(issuer_url: str) -> str:
     """Discover the token endpoint from the OIDC well-known configuration.
 
@@ -0,0 +1,167 @@
+import json
+import os
+import statistics
+import tempfile
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+import pytest
+import structlog
+from _pytest.reports import TestReport
+from pytest import Config, Session
+from xdist.scheduler import LoadFileScheduling
+
+LOGGER = structlog.get_logger(name=__name__)
+
+# Per-test durations of previous runs, shared by consecutive runs
+TEST_DURATIONS_PATH = os.getenv(
+    "PYTEST_TEST_DURATIONS_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "test-durations.json"),
+)
+
+
+def get_class_scope(nodeid: str) -> str:
+    """Return the `file::Class` part of a test node id, or the file for module-level tests."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def load_test_durations(path: str = TEST_DURATIONS_PATH) -> dict[str, float]:
+    """
+    Load the persisted per-test durations.
+
+    Args:
+        path (str): Durations JSON file.
+
+    Returns:
+        dict[str, float]: test node id to duration in seconds; empty if there is no history.
+
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path) as fd:
+            return json.load(fd)
+    except (OSError, ValueError) as ex:
+        LOGGER.warning(f"Ignoring unreadable test durations history {path}: {ex}")
+        return {}
+
+
+def estimate_work_unit_durations(
+    work_units: dict[str, list[str]],
+    durations: dict[str, float],
+) -> dict[str, float]:
+    """
+    Estimate the duration of each work unit from the tests durations history.
+
+    Tests without history are estimated from the average of their class (which shares its class-scoped
+    fixtures chain), then of their file, then from the median of all known tests.
+
+    Args:
+        work_units (dict[str, list[str]]): work unit (file) to its test node ids.
+        durations (dict[str, float]): test node id to duration in seconds.
+
+    Returns:
+        dict[str, float]: work unit to estimated duration in seconds.
+
+    """
+    scope_durations: dict[str, list[float]] = defaultdict(list)
+    for nodeid, duration in durations.items():
+        scope_durations[get_class_scope(nodeid=nodeid)].append(duration)
+        scope_durations[nodeid.split("::", maxsplit=1)[0]].append(duration)
+
+    default_duration = statistics.median(durations.values()) if durations else 0.0
+
+    def _estimate(nodeid: str) -> float:
+        if nodeid in durations:
+            return durations[nodeid]
+
+        for scope in (get_class_scope(nodeid=nodeid), nodeid.split("::", maxsplit=1)[0]):
+            if scope_durations.get(scope):
+                return statistics.mean(scope_durations[scope])
+
+        return default_duration
+
+    return {work_unit: sum(_estimate(nodeid=nodeid) for nodeid in nodeids) for work_unit, nodeids in work_units.items()}
+
+
+def order_work_units(work_units: dict[str, list[str]], durations: dict[str, float]) -> list[str]:
+    """
+    Order work units longest first (LPT), so each one is handed to the first free worker.
+
+    Without history the original order is kept.
+
+    Args:
+        work_units (dict[str, list[str]]): work unit (file) to its test node ids.
+        durations (dict[str, float]): test node id to duration in seconds.
+
+    Returns:
+        list[str]: ordered work units.
+
+    """
+    if not durations:
+        return list(work_units)
+
+    estimated_durations = estimate_work_unit_durations(work_units=work_units, durations=durations)
+    return sorted(work_units, key=lambda work_unit: -estimated_durations[work_unit])
+
+
+class DurationFileScheduling(LoadFileScheduling):
+    """
+    Like `--dist loadfile`, whole test files are sent to a worker, keeping module and class-scoped fixtures
+    together, but files are sent longest-first according to the durations history (LPT list scheduling).
+
+    Falls back to loadfile ordering when there is no history.
+    """
+
+    def __init__(self, config: Config, log: Any = None, durations: dict[str, float] | None = None) -> None:
+        super().__init__(config=config, log=log)
+        self.durations = load_test_durations() if durations is None else durations
+        self._is_workqueue_ordered = False
+
+    def _assign_work_unit(self, node: Any) -> None:
+        # The work queue is complete when the first unit is assigned
+        if not self._is_workqueue_ordered:
+            ordered_work_units = order_work_units(
+                work_units={scope: list(nodeids) for scope, nodeids in self.workqueue.items()},
+                durations=self.durations,
+            )
+            self.workqueue = OrderedDict((scope, self.workqueue[scope]) for scope in ordered_work_units)
+            self._is_workqueue_ordered = True
+            self.log(f"Work units ordered by {'duration history' if self.durations else 'loadfile order'}")
+
+        super()._assign_work_unit(node)
+
+
+class DurationScheduler:
+    """
+    Pytest plugin providing the duration-aware xdist scheduler and recording tests durations for the next runs.
+    """
+
+    def __init__(self, path: str = TEST_DURATIONS_PATH) -> None:
+        self.path = path
+        self.durations: dict[str, float] = defaultdict(float)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config: Config, log: Any) -> DurationFileScheduling:
+        return DurationFileScheduling(config=config, log=log, durations=load_test_durations(path=self.path))
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        # On the controller, reports of all workers are received
+        if not report.skipped:
+            self.durations[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
+        if not self.durations:
+            return
+
+        durations = load_test_durations(path=self.path)
+        durations.update(self.durations)
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode="w", dir=directory, suffix=".json", delete=False) as fd:
+            json.dump(durations, fd, indent=2, sort_keys=True)
+
+        os.replace(fd.name, self.path)
+        LOGGER.info(f"Recorded {len(self.durations)} tests durations to {self.path}")